@@ -1,10 +1,50 @@
-from .widgets import Stack
+import importlib
 
 from .exceptions import DuplicateNameError, NotInStackError, WidgetAlreadyInStackError
+from .backends import available_backends, get_backend, set_backend
+
+
+# loaded the first time they are used, so importing the package for the exceptions or to call set_backend 
+# does not import the widgets or a GUI toolkit.
+_LAZY_EXPORTS = {
+    "Stack": ".widgets.stack",
+    "get_stack_class": ".widgets.stack",
+    "VirtualStack": ".widgets.virtual_stack",
+    "get_virtual_stack_class": ".widgets.virtual_stack",
+    "StackRouter": ".widgets.stack_router",
+    "StackSwitcher": ".widgets.stack_switcher",
+    "get_stack_switcher_class": ".widgets.stack_switcher",
+    "StackSidebar": ".widgets.stack_sidebar",
+    "get_stack_sidebar_class": ".widgets.stack_sidebar",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [
     "Stack",
+    "get_stack_class",
+    "VirtualStack",
+    "get_virtual_stack_class",
+    "StackRouter",
+    "StackSwitcher",
+    "get_stack_switcher_class",
+    "StackSidebar",
+    "get_stack_sidebar_class",
+    "available_backends",
+    "get_backend",
+    "set_backend",
     "DuplicateNameError",
     "NotInStackError",
     "WidgetAlreadyInStackError"
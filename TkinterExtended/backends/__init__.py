@@ -0,0 +1,201 @@
+# TkinterExtended/backends/__init__.py
+import os
+import time
+
+
+class Backend:
+    """
+    Describes a widget toolkit the Stack can be built on.
+
+    Attributes:
+        name (str): the name of the backend, eg "tkinter".
+        frame_class (type): the container widget the Stack inherits from.
+        widget_class (type): the base class of every widget of the toolkit, used to tell widgets apart
+            from names and indexes.
+        frame_options (dict): keyword arguments always passed to frame_class, eg transparent colours.
+        monotonic (callable): called with a widget, returns the time in seconds of the event loop the widget 
+            runs on. animations are timed with it so they follow a simulated loop too.
+        bind_destroy (callable): called with a widget and a handler, adds the handler to the widget's <Destroy> 
+            event without replacing its other bindings and returns an id for unbind_destroy.
+        unbind_destroy (callable): called with a widget and the id from bind_destroy, removes only that handler.
+        button_class (type | None): the button widget StackSwitcher and StackSidebar are made of, it takes text 
+            and command options. None if the backend has no buttons.
+        button_styles (dict): the options a button is configured with to show it is "normal" or "selected".
+    """
+    __slots__ = ("name", "frame_class", "widget_class", "frame_options", "monotonic", "bind_destroy", "unbind_destroy",
+                 "button_class", "button_styles")
+
+    def __init__(self, name: str, frame_class: type, widget_class: type, frame_options: dict | None = None, 
+                 monotonic: callable = None, bind_destroy: callable = None, unbind_destroy: callable = None, 
+                 button_class: type | None = None, button_styles: dict | None = None) -> None:
+        self.name = name
+        self.frame_class = frame_class
+        self.widget_class = widget_class
+        self.frame_options = frame_options or {}
+        self.monotonic = monotonic or _real_monotonic
+        self.bind_destroy = bind_destroy or _tk_bind_destroy
+        self.unbind_destroy = unbind_destroy or _tk_unbind_destroy
+        self.button_class = button_class
+        self.button_styles = button_styles or _TK_BUTTON_STYLES
+
+    def __repr__(self) -> str:
+        return f"Backend({self.name!r})"
+
+
+_TK_BUTTON_STYLES = {"normal": {"relief": "raised"}, "selected": {"relief": "sunken"}}
+
+
+def _real_monotonic(widget) -> float:
+    return time.monotonic()
+
+
+def _tk_bind_destroy(widget, handler: callable) -> str:
+    import tkinter
+    # tkinter.Misc.bind directly, customtkinter widgets override bind to bind their canvas instead.
+    return tkinter.Misc.bind(widget, "<Destroy>", handler, "+")
+
+
+def _tk_unbind_destroy(widget, funcid: str) -> None:
+    # Misc.unbind with a funcid clears every binding of the sequence before python 3.13, so only the 
+    # line that calls this handler is taken out of the binding script.
+    script = widget.tk.call("bind", widget._w, "<Destroy>")
+    kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+    widget.tk.call("bind", widget._w, "<Destroy>", kept)
+    widget.deletecommand(funcid)
+
+
+def _load_customtkinter() -> Backend:
+    import customtkinter as ctk
+    return Backend("customtkinter", ctk.CTkFrame, ctk.CTkBaseClass, {"bg_color": "transparent", "fg_color": "transparent"}, 
+                   button_class = ctk.CTkButton, button_styles = {"normal": {"border_width": 0}, "selected": {"border_width": 2}})
+
+
+def _load_tkinter() -> Backend:
+    import tkinter as tk
+    return Backend("tkinter", tk.Frame, tk.Widget, button_class = tk.Button) # a plain tkinter frame has no transparent colour option.
+
+
+def _load_headless() -> Backend:
+    from TkinterExtended.backends.headless import (HeadlessButton, HeadlessFrame, HeadlessWidget, bind_destroy, loop_monotonic, 
+                                                   unbind_destroy)
+    return Backend("headless", HeadlessFrame, HeadlessWidget, monotonic = loop_monotonic, bind_destroy = bind_destroy, 
+                   unbind_destroy = unbind_destroy, button_class = HeadlessButton)
+
+
+_BACKEND_LOADERS = {
+    "customtkinter": _load_customtkinter,
+    "tkinter": _load_tkinter,
+    "headless": _load_headless,
+}
+_DEFAULT_ORDER = ("customtkinter", "tkinter")
+BACKEND_ENVIRONMENT_VARIABLE = "TKINTEREXTENDED_BACKEND"
+_loaded_backends: dict[str, Backend] = {}
+_requested_backend: str | None = None
+_default_backend: Backend | None = None
+
+
+def register_backend(name: str, loader: callable) -> None:
+    """
+    adds a backend that get_backend can load by name.
+
+    Args:
+        name (str): the name of the backend.
+        loader (callable): called with no arguments the first time the backend is needed, returns a Backend.
+    """
+    _BACKEND_LOADERS[name] = loader
+    _loaded_backends.pop(name, None)
+
+
+def available_backends() -> tuple[str, ...]:
+    """
+    gets the names of every registered backend, whether or not its toolkit is installed.
+
+    Returns:
+        tuple[str, ...]: the backend names.
+    """
+    return tuple(_BACKEND_LOADERS)
+
+
+def get_backend(name: str | None = None) -> Backend:
+    """
+    loads a backend by name. without a name the default backend is returned, see get_default_backend.
+
+    Args:
+        name (str | None, optional): the backend to load. Defaults to None.
+
+    Raises:
+        ValueError: if there is no backend with that name.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        Backend: the backend.
+    """
+    if name is None:
+        return get_default_backend()
+
+    backend = _loaded_backends.get(name)
+    if backend is None:
+        loader = _BACKEND_LOADERS.get(name)
+        if loader is None:
+            raise ValueError(f"{name} is an invalid backend. valid backends: {', '.join(_BACKEND_LOADERS)}")
+        backend = _loaded_backends[name] = loader()
+    return backend
+
+
+def set_backend(name: str | None) -> None:
+    """
+    chooses the backend Stack is built on, instead of using the first toolkit that is installed. 
+    the TKINTEREXTENDED_BACKEND environment variable does the same without changing code, set_backend 
+    takes priority over it.
+
+    Args:
+        name (str | None): the backend, eg "tkinter" or "headless". None goes back to the automatic choice.
+
+    Raises:
+        ValueError: if there is no backend with that name.
+        RuntimeError: if Stack has already been built on a different backend.
+    """
+    global _requested_backend
+    if name is not None and name not in _BACKEND_LOADERS:
+        raise ValueError(f"{name} is an invalid backend. valid backends: {', '.join(_BACKEND_LOADERS)}")
+    if _default_backend is not None and name is not None and name != _default_backend.name:
+        raise RuntimeError(f"Stack is already using the {_default_backend.name} backend, set_backend must be called "
+                           "before Stack is first used")
+    _requested_backend = name
+
+
+def get_default_backend() -> Backend:
+    """
+    gets the backend Stack is built on, choosing it the first time this is called. the backend from 
+    set_backend is used, then the one named by the TKINTEREXTENDED_BACKEND environment variable, otherwise 
+    the first installed of customtkinter and tkinter. the headless backend is only used when it is asked 
+    for, so a missing toolkit is not hidden behind a stack that never draws.
+
+    Raises:
+        ValueError: if the backend that was asked for does not exist.
+        ModuleNotFoundError: if the toolkit of the backend that was asked for is not installed, or none 
+            was asked for and neither customtkinter nor tkinter is installed.
+
+    Returns:
+        Backend: the default backend.
+    """
+    global _default_backend
+    if _default_backend is None:
+        name = _requested_backend or os.environ.get(BACKEND_ENVIRONMENT_VARIABLE) or None
+        if name is not None:
+            _default_backend = get_backend(name)
+        else:
+            for default in _DEFAULT_ORDER:
+                try:
+                    _default_backend = get_backend(default)
+                    break
+                except ModuleNotFoundError:
+                    continue
+            else:
+                raise ModuleNotFoundError(f"neither {' nor '.join(_DEFAULT_ORDER)} is installed. to run without a "
+                                          f"toolkit call set_backend(\"headless\") or set {BACKEND_ENVIRONMENT_VARIABLE}=headless")
+    return _default_backend
+
+
+__all__ = ["Backend", "BACKEND_ENVIRONMENT_VARIABLE", "available_backends", "get_backend", "get_default_backend", 
+           "register_backend", "set_backend"]
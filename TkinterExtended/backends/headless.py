@@ -0,0 +1,710 @@
+import heapq
+import itertools
+import sys
+import time
+import traceback
+from typing import Callable
+from collections import deque
+
+try:
+    from tkinter import TclError
+except ImportError: # python built without Tk, the headless backend still has to raise something Tk like.
+    class TclError(Exception):
+        pass
+
+
+GRID_OPTIONS = ("column", "columnspan", "in", "ipadx", "ipady", "padx", "pady", "row", "rowspan", "sticky")
+PLACE_OPTIONS = ("anchor", "bordermode", "height", "in", "relheight", "relwidth", "relx", "rely", "width", "x", "y")
+PACK_OPTIONS = ("after", "anchor", "before", "expand", "fill", "in", "ipadx", "ipady", "padx", "pady", "side")
+TRACK_OPTIONS = ("minsize", "pad", "uniform", "weight")
+_VALID_OPTIONS = {options: frozenset(options) for options in (GRID_OPTIONS, PLACE_OPTIONS, PACK_OPTIONS, TRACK_OPTIONS)}
+_STICKY_CACHE: dict[str, str] = {}
+_CONFLICTING_MANAGERS = {"grid": "pack", "pack": "grid"} # Tk refuses to mix these two in one master.
+
+_default_root = None
+
+
+class HeadlessEventLoop:
+    """
+    A simulated Tk event loop with a virtual clock, so code driven by after and after_idle can be run
+    step by step and as fast as the CPU allows, without a display or real waiting.
+
+    Timers fire in due order and idle callbacks run whenever no timer is due, the same order Tk uses.
+    Exceptions raised by callbacks are passed to the root's report_callback_exception, as in tkinter.
+
+    Args:
+        root (HeadlessRoot): the root window the loop belongs to.
+    """
+    def __init__(self, root) -> None:
+        self._root = root
+        self._time_ms: float = 0.0
+        self._timers: list[tuple[float, int, str]] = [] # heap of (due time, sequence, job id).
+        self._idle: deque[str] = deque()
+        self._jobs: dict[str, tuple] = {} # job id -> (callback, args), cancelled jobs are only removed from here.
+        self._sequence = itertools.count()
+        self._quitting: bool = False
+
+    def now(self) -> float:
+        """
+        gets the virtual time in milliseconds since the loop was created.
+        """
+        return self._time_ms
+
+    def pending(self) -> int:
+        """
+        gets how many timers and idle callbacks are waiting to run.
+        """
+        return len(self._jobs)
+
+    def after(self, ms: int, callback: Callable | None = None, *args) -> str | None:
+        ms = _tcl_integer(ms)
+        if callback is None: # like tkinter, without a callback after just waits.
+            self._time_ms += max(ms, 0)
+            return None
+        job_id = self._new_job(callback, args)
+        heapq.heappush(self._timers, (self._time_ms + max(ms, 0), next(self._sequence), job_id))
+        return job_id
+
+    def after_idle(self, callback: callable, *args) -> str:
+        job_id = self._new_job(callback, args)
+        self._idle.append(job_id)
+        return job_id
+
+    def after_cancel(self, job_id: str) -> None:
+        if not job_id:
+            raise ValueError("id must be a valid identifier returned from after or after_idle")
+        self._jobs.pop(job_id, None)
+
+    def update_idletasks(self) -> None:
+        """
+        runs the idle callbacks, including any they add, without running timers.
+        """
+        self._root._mapped = not self._root._withdrawn # Tk maps the windows at idle time.
+        while self._idle:
+            self._run(self._idle.popleft())
+
+    def update(self) -> None:
+        """
+        runs every timer that is due at the current virtual time, then the idle callbacks, until neither is left.
+        """
+        while True:
+            self._run_due_timers()
+            self.update_idletasks()
+            if not self._due():
+                return
+
+    def advance(self, ms: float) -> None:
+        """
+        moves the virtual clock forward, firing each timer at its due time and running the idle callbacks
+        whenever the loop would otherwise wait.
+
+        Args:
+            ms (float): how many milliseconds to advance by.
+        """
+        end = self._time_ms + ms
+        self.update()
+        while self._timers and self._timers[0][0] <= end:
+            self._time_ms = max(self._time_ms, self._timers[0][0])
+            self.update()
+        self._time_ms = end
+
+    def run_until_idle(self, limit_ms: float | None = None) -> None:
+        """
+        advances the virtual clock from timer to timer until nothing is scheduled, or until limit_ms has
+        passed. callbacks that always reschedule themselves need a limit.
+
+        Args:
+            limit_ms (float | None, optional): the most virtual time to advance by. Defaults to None.
+        """
+        end = None if limit_ms is None else self._time_ms + limit_ms
+        self.update()
+        while self._next_due() is not None:
+            due = self._next_due()
+            if end is not None and due > end:
+                self._time_ms = end
+                return
+            self._time_ms = max(self._time_ms, due)
+            self.update()
+
+    def mainloop(self) -> None:
+        """
+        runs the loop against the real clock until quit is called or the root is destroyed, for code
+        that mixes the headless backend with real threads.
+        """
+        self._quitting = False
+        last = time.monotonic()
+        while not self._quitting and not self._root._destroyed:
+            self.update()
+            due = self._next_due()
+            wait = 0.05 if due is None else min(max(due - self._time_ms, 0) / 1000, 0.05)
+            if wait:
+                time.sleep(wait)
+            current = time.monotonic()
+            self._time_ms += (current - last) * 1000
+            last = current
+
+    def quit(self) -> None:
+        self._quitting = True
+
+    def _new_job(self, callback: callable, args: tuple) -> str:
+        job_id = f"after#{next(self._sequence)}"
+        self._jobs[job_id] = (callback, args)
+        return job_id
+
+    def _next_due(self) -> float | None:
+        timers = self._timers
+        while timers and timers[0][2] not in self._jobs: # drop cancelled timers lazily.
+            heapq.heappop(timers)
+        if self._idle:
+            return self._time_ms
+        return timers[0][0] if timers else None
+
+    def _due(self) -> bool:
+        due = self._next_due()
+        return due is not None and due <= self._time_ms
+
+    def _run_due_timers(self) -> None:
+        timers = self._timers
+        while timers and timers[0][0] <= self._time_ms:
+            self._run(heapq.heappop(timers)[2])
+
+    def _run(self, job_id: str) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        callback, args = job
+        try:
+            callback(*args)
+        except Exception:
+            self._root.report_callback_exception(*sys.exc_info())
+
+
+class HeadlessEvent:
+    """
+    The event passed to handlers added with bind, with the fields Stack and most handlers use.
+    """
+    def __init__(self, widget, sequence: str, **fields) -> None:
+        self.widget = widget
+        self.type = sequence.strip("<>")
+        self.x = self.y = self.width = self.height = 0
+        self.__dict__.update(fields)
+
+    def __repr__(self) -> str:
+        return f"<{self.type} event widget={self.widget}>"
+
+
+class HeadlessWidget:
+    """
+    An in-memory stand in for a Tk widget. It keeps the state Tk would, which geometry manager a widget
+    uses and with which options, whether it is mapped, its children, stacking order, bindings and options,
+    and raises TclError in the same situations Tk does, but it never draws anything. Timers run on the
+    HeadlessEventLoop of its root.
+
+    Args:
+        master (HeadlessWidget | None, optional): the parent widget, the default root if None. Defaults to None.
+        **options: widget options, kept for configure and cget. name sets the widget's path name.
+    """
+    widget_name = "widget"
+
+    def __init__(self, master = None, cnf: dict | None = None, **options) -> None:
+        if master is None:
+            master = _get_default_root()
+        master._check_alive() # Tk cannot create a widget inside a destroyed one either.
+        options = {**(cnf or {}), **options}
+
+        self.master = master
+        self._root = master._root
+        self._reset_state()
+
+        name = options.pop("name", None)
+        if name is None:
+            count = master._name_counts.get(self.widget_name, 0) + 1
+            master._name_counts[self.widget_name] = count
+            name = f"!{self.widget_name}" if count == 1 else f"!{self.widget_name}{count}"
+        self._name = name
+        self._w = f".{name}" if master._w == "." else f"{master._w}.{name}"
+        existing = master.children.get(name)
+        if existing is not None:
+            existing.destroy() # tkinter replaces a child with the same name.
+        master.children[name] = self
+        self.configure(**options)
+
+    def _reset_state(self) -> None:
+        self.children: dict[str, HeadlessWidget] = {}
+        self._name_counts: dict[str, int] = {}
+        self._options: dict = {}
+        self._manager: str = ""
+        self._geometry: dict = {}
+        self._remembered_grid: dict | None = None # the grid options kept by grid_remove.
+        self._slaves: dict[str, dict] = {}
+        self._propagate: bool = True
+        self._rows: dict[int, dict] = {}
+        self._columns: dict[int, dict] = {}
+        self._bindings: dict[str, dict[str, callable]] = {}
+        self._destroyed: bool = False
+
+    def __str__(self) -> str:
+        return self._w
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__module__}.{type(self).__qualname__} object {self._w}>"
+
+    # options
+
+    def configure(self, cnf: dict | None = None, **options) -> dict | None:
+        options = {**(cnf or {}), **options}
+        self._check_alive()
+        if not options:
+            return dict(self._options)
+        self._options.update(options)
+        return None
+
+    config = configure
+
+    def cget(self, key: str):
+        self._check_alive()
+        if key not in self._options:
+            raise TclError(f'unknown option "-{key}"')
+        return self._options[key]
+
+    __getitem__ = cget
+
+    def __setitem__(self, key: str, value) -> None:
+        self.configure({key: value})
+
+    def keys(self) -> list[str]:
+        return list(self._options)
+
+    # grid
+
+    def grid(self, cnf: dict | None = None, **options) -> None:
+        options = _check_options({**(cnf or {}), **options}, GRID_OPTIONS)
+        if "sticky" in options:
+            options["sticky"] = _check_sticky(options["sticky"])
+        if self._manager == "grid":
+            base = self._geometry
+        elif self._remembered_grid is not None:
+            base = self._remembered_grid
+        else:
+            base = {"column": 0, "columnspan": 1, "ipadx": 0, "ipady": 0, "padx": 0, "pady": 0,
+                    "row": self._next_free_row(), "rowspan": 1, "sticky": ""}
+        self._manage("grid", {**base, **options})
+
+    grid_configure = grid
+
+    def grid_remove(self) -> None:
+        self._check_alive()
+        if self._manager == "grid":
+            self._remembered_grid = self._geometry
+            self._unmanage()
+
+    def grid_forget(self) -> None:
+        self._check_alive()
+        self._remembered_grid = None
+        if self._manager == "grid":
+            self._unmanage()
+
+    def grid_info(self) -> dict:
+        self._check_alive()
+        if self._manager != "grid":
+            return {}
+        return {"in": self.master, **self._geometry}
+
+    def grid_propagate(self, flag: bool | None = None) -> bool | None:
+        self._check_alive()
+        if flag is None:
+            return self._propagate
+        self._propagate = bool(flag)
+        return None
+
+    def grid_rowconfigure(self, index: int, cnf: dict | None = None, **options) -> dict | None:
+        return self._configure_track(self._rows, index, {**(cnf or {}), **options})
+
+    def grid_columnconfigure(self, index: int, cnf: dict | None = None, **options) -> dict | None:
+        return self._configure_track(self._columns, index, {**(cnf or {}), **options})
+
+    rowconfigure = grid_rowconfigure
+    columnconfigure = grid_columnconfigure
+
+    def grid_slaves(self, row: int | None = None, column: int | None = None) -> list:
+        self._check_alive()
+        slaves = reversed(list(self._slaves.get("grid", ()))) # Tk lists the most recently managed first.
+        return [slave for slave in slaves if (row is None or slave._geometry["row"] == row)
+                and (column is None or slave._geometry["column"] == column)]
+
+    # place
+
+    def place(self, cnf: dict | None = None, **options) -> None:
+        options = _check_options({**(cnf or {}), **options}, PLACE_OPTIONS)
+        base = self._geometry if self._manager == "place" else {"anchor": "nw", "x": 0, "y": 0}
+        self._manage("place", {**base, **options})
+
+    place_configure = place
+
+    def place_forget(self) -> None:
+        self._check_alive()
+        if self._manager == "place":
+            self._unmanage()
+
+    def place_info(self) -> dict:
+        self._check_alive()
+        return {"in": self.master, **self._geometry} if self._manager == "place" else {}
+
+    def place_slaves(self) -> list:
+        self._check_alive()
+        return list(self._slaves.get("place", ()))
+
+    # pack
+
+    def pack(self, cnf: dict | None = None, **options) -> None:
+        options = _check_options({**(cnf or {}), **options}, PACK_OPTIONS)
+        before, after = options.pop("before", None), options.pop("after", None)
+        sibling = before if before is not None else after
+        if sibling is not None:
+            if sibling._manager != "pack":
+                raise TclError(f'window "{sibling._w}" isn\'t packed')
+            options["in"] = sibling._geometry.get("in", sibling.master) # Tk packs next to the sibling, in its master.
+        base = self._geometry if self._manager == "pack" else {"side": "top", "fill": "none", "expand": 0}
+        self._manage("pack", {**base, **options})
+        if sibling is not None and sibling is not self:
+            # the packing order is the order of the master's slaves, before and after move this widget in it.
+            slaves = options["in"]._slaves["pack"]
+            order = [slave for slave in slaves if slave is not self]
+            order.insert(order.index(sibling) + (after is not None), self)
+            options["in"]._slaves["pack"] = dict.fromkeys(order)
+
+    pack_configure = pack
+
+    def pack_forget(self) -> None:
+        self._check_alive()
+        if self._manager == "pack":
+            self._unmanage()
+
+    def pack_info(self) -> dict:
+        self._check_alive()
+        return {"in": self.master, **self._geometry} if self._manager == "pack" else {}
+
+    def pack_slaves(self) -> list:
+        self._check_alive()
+        return list(self._slaves.get("pack", ()))
+
+    def pack_propagate(self, flag: bool | None = None) -> bool | None:
+        return self.grid_propagate(flag) # Tk keeps one propagate flag per manager, one is enough here.
+
+    # window information
+
+    def winfo_manager(self) -> str:
+        self._check_alive()
+        return self._manager
+
+    def winfo_ismapped(self) -> int:
+        self._check_alive()
+        widget = self
+        while widget is not self._root:
+            if not widget._manager:
+                return 0
+            widget = widget.master
+        return int(self._root._mapped)
+
+    def winfo_exists(self) -> int:
+        return int(not self._destroyed)
+
+    def winfo_children(self) -> list:
+        self._check_alive()
+        return list(self.children.values())
+
+    def winfo_toplevel(self):
+        return self._root
+
+    def winfo_width(self) -> int:
+        self._check_alive()
+        return int(self._options.get("width", 1)) if self.winfo_ismapped() else 1
+
+    def winfo_height(self) -> int:
+        self._check_alive()
+        return int(self._options.get("height", 1)) if self.winfo_ismapped() else 1
+
+    def winfo_reqwidth(self) -> int:
+        return int(self._options.get("width", 1))
+
+    def winfo_reqheight(self) -> int:
+        return int(self._options.get("height", 1))
+
+    # stacking order, kept as the order of the master's children like winfo children reports it.
+
+    def lift(self, above_this = None) -> None:
+        self._check_alive()
+        siblings = self.master.children
+        if above_this is None:
+            del siblings[self._name]
+            siblings[self._name] = self
+            return
+        ordered = [child for child in siblings.values() if child is not self]
+        ordered.insert(ordered.index(above_this) + 1, self)
+        self.master.children = {child._name: child for child in ordered}
+
+    tkraise = lift
+
+    def lower(self, below_this = None) -> None:
+        self._check_alive()
+        ordered = [child for child in self.master.children.values() if child is not self]
+        ordered.insert(0 if below_this is None else ordered.index(below_this), self)
+        self.master.children = {child._name: child for child in ordered}
+
+    # events
+
+    def bind(self, sequence: str | None = None, func: Callable | None = None, add: bool | str | None = None):
+        self._check_alive()
+        if sequence is None:
+            return tuple(self._bindings)
+        if func is None:
+            return " ".join(self._bindings.get(sequence, ()))
+        handlers = self._bindings.setdefault(sequence, {})
+        if not add:
+            handlers.clear()
+        funcid = f"{id(func)}{getattr(func, '__name__', 'lambda')}{len(handlers)}"
+        handlers[funcid] = func
+        return funcid
+
+    def unbind(self, sequence: str, funcid: str | None = None) -> None:
+        self._check_alive()
+        if funcid is None:
+            self._bindings.pop(sequence, None)
+        else:
+            self._bindings.get(sequence, {}).pop(funcid, None)
+
+    def event_generate(self, sequence: str, **fields) -> None:
+        self._check_alive()
+        event = HeadlessEvent(self, sequence, **fields)
+        for handler in list(self._bindings.get(sequence, {}).values()):
+            if handler(event) == "break":
+                break
+
+    def destroy(self) -> None:
+        """
+        destroys the widget and its children, sending <Destroy> to each, parent first like Tk.
+        """
+        if self._destroyed:
+            return
+        global _default_root
+        handlers = list(self._bindings.get("<Destroy>", {}).values())
+        event = HeadlessEvent(self, "<Destroy>")
+        for handler in handlers:
+            handler(event)
+        for child in list(self.children.values()):
+            child.destroy()
+
+        if self._manager:
+            self._unmanage()
+        self._destroyed = True
+        self._bindings.clear()
+        if self.master is not None and self.master.children.get(self._name) is self:
+            del self.master.children[self._name]
+        if self is _default_root:
+            _default_root = None
+
+    # event loop, shared by every widget of the root.
+
+    def after(self, ms: int, func: Callable | None = None, *args) -> str | None:
+        return self._root._loop.after(ms, func, *args)
+
+    def after_idle(self, func: callable, *args) -> str:
+        return self._root._loop.after_idle(func, *args)
+
+    def after_cancel(self, id: str) -> None:
+        self._root._loop.after_cancel(id)
+
+    def update(self) -> None:
+        self._root._loop.update()
+
+    def update_idletasks(self) -> None:
+        self._root._loop.update_idletasks()
+
+    def mainloop(self, n: int = 0) -> None:
+        self._root._loop.mainloop()
+
+    def quit(self) -> None:
+        self._root._loop.quit()
+
+    # private helpers
+
+    def _check_alive(self) -> None:
+        if self._destroyed:
+            raise TclError(f'bad window path name "{self._w}"')
+
+    def _manage(self, manager: str, geometry: dict) -> None:
+        self._check_alive()
+        master = geometry.get("in", self.master)
+        if master is self:
+            raise TclError(f"can't manage \"{self._w}\" in itself")
+        conflicting = _CONFLICTING_MANAGERS.get(manager)
+        if conflicting and master._slaves.get(conflicting):
+            raise TclError(f"cannot use geometry manager {manager} inside {master._w} which already has slaves managed by {conflicting}")
+
+        if self._manager and self._manager != manager:
+            self._unmanage()
+        if not self._manager:
+            master._slaves.setdefault(manager, {})[self] = None
+        self._manager = manager
+        self._geometry = geometry
+        if manager == "grid":
+            self._remembered_grid = None
+
+    def _unmanage(self) -> None:
+        master = self._geometry.get("in", self.master)
+        slaves = master._slaves.get(self._manager)
+        if slaves is not None:
+            slaves.pop(self, None)
+        self._manager = ""
+        self._geometry = {}
+
+    def _next_free_row(self) -> int:
+        slaves = self.master._slaves.get("grid", ())
+        return max((slave._geometry["row"] + slave._geometry["rowspan"] for slave in slaves), default = 0)
+
+    def _configure_track(self, tracks: dict[int, dict], index: int, options: dict) -> dict | None:
+        self._check_alive()
+        track = tracks.setdefault(_tcl_integer(index), {"minsize": 0, "pad": 0, "uniform": "", "weight": 0})
+        if not options:
+            return dict(track)
+        track.update(_check_options(options, TRACK_OPTIONS))
+        return None
+
+
+class HeadlessFrame(HeadlessWidget):
+    widget_name = "frame"
+
+
+class HeadlessLabel(HeadlessWidget):
+    widget_name = "label"
+
+
+class HeadlessButton(HeadlessWidget):
+    widget_name = "button"
+
+    def invoke(self):
+        self._check_alive()
+        command = self._options.get("command")
+        return command() if command is not None else None
+
+
+class HeadlessRoot(HeadlessWidget):
+    """
+    The root window of a headless widget tree, the equivalent of tkinter.Tk. It owns the simulated event
+    loop every widget in the tree schedules on, and becomes the default root if there is none.
+    """
+    def __init__(self, **options) -> None:
+        global _default_root
+        self.master = None
+        self._root = self
+        self._w = "."
+        self._name = "."
+        self._mapped: bool = False
+        self._withdrawn: bool = False
+        self._title: str = "tk"
+        self._loop = HeadlessEventLoop(self)
+        self._reset_state()
+        self.configure(**options)
+        if _default_root is None:
+            _default_root = self
+
+    @property
+    def loop(self) -> HeadlessEventLoop:
+        return self._loop
+
+    def title(self, string: str | None = None) -> str | None:
+        if string is None:
+            return self._title
+        self._title = string
+        return None
+
+    def geometry(self, new_geometry: str | None = None) -> str | None:
+        if new_geometry is None:
+            return f"{self.winfo_width()}x{self.winfo_height()}+0+0"
+        size = new_geometry.split("+")[0]
+        if "x" in size:
+            width, height = size.split("x")
+            self._options.update(width = int(width), height = int(height))
+        return None
+
+    def withdraw(self) -> None:
+        self._withdrawn = True
+        self._mapped = False
+
+    def deiconify(self) -> None:
+        self._withdrawn = False
+        self._mapped = True
+
+    def winfo_ismapped(self) -> int:
+        self._check_alive()
+        return int(self._mapped)
+
+    def report_callback_exception(self, exc, val, tb) -> None:
+        print("Exception in Tkinter callback", file = sys.stderr)
+        traceback.print_exception(exc, val, tb)
+
+
+def loop_monotonic(widget: HeadlessWidget) -> float:
+    """
+    gets the virtual time of the loop a widget runs on, in seconds.
+    """
+    return widget._root._loop.now() / 1000
+
+
+def bind_destroy(widget: HeadlessWidget, handler: Callable) -> str:
+    """
+    adds a handler to the <Destroy> event of a widget, keeping its other bindings.
+    """
+    return widget.bind("<Destroy>", handler, "+")
+
+
+def unbind_destroy(widget: HeadlessWidget, funcid: str) -> None:
+    """
+    removes one handler added with bind_destroy.
+    """
+    widget.unbind("<Destroy>", funcid)
+
+
+def _get_default_root() -> HeadlessRoot:
+    global _default_root
+    if _default_root is None:
+        HeadlessRoot()
+    return _default_root
+
+
+def _tcl_integer(value) -> int:
+    """
+    converts a value to an int the way Tcl reads an integer argument, 1.5 and "1.0" are not integers.
+    """
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value))
+    except ValueError:
+        raise TclError(f'expected integer but got "{value}"') from None
+
+
+def _check_options(options: dict, valid: tuple[str, ...]) -> dict:
+    if "in_" in options: # in is written with an underscore in Python.
+        options["in"] = options.pop("in_")
+    if not _VALID_OPTIONS[valid].issuperset(options):
+        unknown = next(key for key in options if key not in valid)
+        raise TclError(f'bad option "-{unknown}": must be {", ".join("-" + option for option in valid[:-1])}, or -{valid[-1]}')
+    return options
+
+
+def _check_sticky(sticky: str | tuple) -> str:
+    if isinstance(sticky, str) and sticky in _STICKY_CACHE:
+        return _STICKY_CACHE[sticky]
+    key, sticky = sticky, "".join(sticky)
+    for character in sticky.replace(",", "").replace(" ", ""):
+        if character not in "nsewNSEW":
+            raise TclError(f'bad stickyness value "{sticky}": must be a string containing n, e, s, and/or w')
+    normalised = "".join(side for side in "nesw" if side in sticky.lower())
+    if isinstance(key, str):
+        _STICKY_CACHE[key] = normalised
+    return normalised
+
+
+__all__ = ["HeadlessEventLoop", "HeadlessEvent", "HeadlessWidget", "HeadlessFrame", "HeadlessLabel", "HeadlessButton",
+           "HeadlessRoot", "TclError"]
@@ -1,3 +1,34 @@
-from .stack import Stack
+import importlib
 
-__all__ = ["Stack"]
+from .stack_child import StackChild
+
+
+# Stack picks a backend when it is first used, so it is only imported then.
+_LAZY_EXPORTS = {
+    "Stack": ".stack",
+    "get_stack_class": ".stack",
+    "VirtualStack": ".virtual_stack",
+    "get_virtual_stack_class": ".virtual_stack",
+    "StackRouter": ".stack_router",
+    "StackSwitcher": ".stack_switcher",
+    "get_stack_switcher_class": ".stack_switcher",
+    "StackSidebar": ".stack_sidebar",
+    "get_stack_sidebar_class": ".stack_sidebar",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+__all__ = ["Stack", "StackChild", "StackRouter", "StackSidebar", "StackSwitcher", "VirtualStack", "get_stack_class", 
+           "get_stack_sidebar_class", "get_stack_switcher_class", "get_virtual_stack_class"]
@@ -0,0 +1,215 @@
+import inspect
+import warnings
+import weakref
+from typing import Iterable
+
+
+class _CallbackRegistration:
+    """
+    How a single callback is called, worked out once from its signature when it is registered.
+
+    Attributes:
+        callback (callable | weakref.ref): the registered function, or a weak reference to it.
+        priority (int): callbacks with a higher priority are called first.
+        order (int): when the callback was registered, keeps callbacks of equal priority in order.
+        weak (bool): if callback is a weak reference that has to be called to get the function.
+        accepts_all (bool): if the callback takes **kwargs, so every keyword argument is passed.
+        accepted (frozenset[str]): the keyword arguments the callback can take.
+    """
+    __slots__ = ("callback", "priority", "order", "weak", "accepts_all", "accepted")
+
+    def __init__(self, callback: callable, priority: int, order: int, reference: weakref.ref | None = None) -> None:
+        self.callback = callback if reference is None else reference
+        self.priority = priority
+        self.order = order
+        self.weak = reference is not None
+
+        try:
+            parameters = inspect.signature(callback).parameters.values()
+        except (TypeError, ValueError): # some builtins have no signature, they are called with no arguments.
+            parameters = ()
+
+        self.accepts_all = any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters)
+        self.accepted = frozenset(parameter.name for parameter in parameters
+                                  if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY))
+
+
+class CallbackDispatcher:
+    """
+    Holds the callbacks for a set of named events and calls them when an event is dispatched.
+    The signature of each callback is inspected once when it is added, and every event keeps a cached,
+    ordered dispatch plan that is only rebuilt after its callbacks change. Callbacks are passed only the
+    keyword arguments they accept, so no callback is ever called twice for one event. Callbacks added with 
+    weak=True are only weakly referenced and are removed once their owner is garbage collected.
+
+    Args:
+        events (Iterable[str]): the names of the events that can be dispatched.
+    """
+    def __init__(self, events: Iterable[str] = ()) -> None:
+        self._registrations: dict[str, dict[callable, _CallbackRegistration]] = {}
+        self._plans: dict[str, tuple] = {}
+        self._order: int = 0
+        for event in events:
+            self.register_event(event)
+
+    @property
+    def events(self) -> tuple[str, ...]:
+        """
+        the names of every registered event.
+        """
+        return tuple(self._registrations)
+
+    def register_event(self, event: str) -> None:
+        """
+        adds a new event name that callbacks can be added to, does nothing if it already exists.
+
+        Args:
+            event (str): the name of the event.
+        """
+        if event not in self._registrations:
+            self._registrations[event] = {}
+            self._plans[event] = ()
+
+    def add(self, event: str, callback_function: callable, priority: int = 0, weak: bool = False) -> None:
+        """
+        adds a callback to an event, adding it again only updates its priority and whether it is weak.
+
+        Args:
+            event (str): the name of the event.
+            callback_function (callable): the function to call.
+            priority (int, optional): callbacks with a higher priority are called first. Defaults to 0.
+            weak (bool, optional): only keep a weak reference to the callback, a bound method is dropped once 
+                its object is garbage collected and any other function once nothing else refers to it, so a 
+                lambda added this way is dropped straight away. Defaults to False.
+
+        Raises:
+            TypeError: if the callback_function is not callable, or weak is used with a callback that cannot 
+                be weakly referenced.
+            ValueError: if the event is invalid.
+        """
+        if not callable(callback_function):
+            raise TypeError(f"Object {callback_function} is not callable")
+        registrations = self._get_registrations(event)
+
+        reference = None
+        if weak:
+            on_collected = lambda reference, event = event: self._drop(event, reference)
+            if inspect.ismethod(callback_function):
+                reference = weakref.WeakMethod(callback_function, on_collected)
+            else:
+                reference = weakref.ref(callback_function, on_collected)
+        registration = _CallbackRegistration(callback_function, priority, self._order, reference)
+        self._order += 1
+        if not registration.accepts_all and not registration.accepted >= {"event", "widget"}:
+            warnings.warn(f"Warning: The callback function {getattr(callback_function, '__name__', callback_function)} does not accept 'event' "
+                            "and/or 'widget' parameters. These will not be passed to the function.")
+
+        key = self._find_key(registrations, callback_function)
+        if key is not None:
+            registration.order = registrations.pop(key).order
+        registrations[registration.callback] = registration
+        self._plans[event] = None
+
+    def remove(self, event: str, callback_function: callable) -> None:
+        """
+        removes a callback from an event, does nothing if it was not added.
+
+        Args:
+            event (str): the name of the event.
+            callback_function (callable): the function to remove.
+
+        Raises:
+            TypeError: if the callback_function is not callable.
+            ValueError: if the event is invalid.
+        """
+        if not callable(callback_function):
+            raise TypeError(f"Object {callback_function} is not callable")
+        registrations = self._get_registrations(event)
+        key = self._find_key(registrations, callback_function)
+        if key is not None:
+            del registrations[key]
+            self._plans[event] = None
+
+    def get(self, event: str) -> set[callable]:
+        """
+        gets the callbacks added to an event.
+
+        Args:
+            event (str): the name of the event.
+
+        Raises:
+            ValueError: if the event is invalid.
+
+        Returns:
+            set[callable]: a copy of the set of callbacks, without weak callbacks that have been collected.
+        """
+        callbacks = set()
+        for registration in self._get_registrations(event).values():
+            callback = registration.callback() if registration.weak else registration.callback
+            if callback is not None:
+                callbacks.add(callback)
+        return callbacks
+
+    def dispatch(self, event: str, **kwargs) -> None:
+        """
+        calls every callback of an event in priority order, passing each the keyword arguments it accepts.
+        the name of the event is always offered as the event keyword argument. callbacks added or removed 
+        while dispatching take effect from the next dispatch.
+
+        Args:
+            event (str): the name of the event.
+            **kwargs: the keyword arguments for the callbacks.
+
+        Raises:
+            ValueError: if the event is invalid.
+        """
+        plan = self._plans.get(event)
+        if plan is None:
+            plan = self._build_plan(event)
+        kwargs["event"] = event
+
+        for callback, weak, accepts_all, accepted in plan:
+            if weak:
+                callback = callback()
+                if callback is None: # collected, it is dropped from the registrations by its weak reference.
+                    continue
+            if accepts_all:
+                callback(**kwargs)
+            elif accepted:
+                callback(**{key: value for key, value in kwargs.items() if key in accepted})
+            else:
+                callback()
+
+    def _build_plan(self, event: str) -> tuple:
+        registrations = sorted(self._get_registrations(event).values(), key = lambda registration: (-registration.priority, registration.order))
+        plan = tuple((registration.callback, registration.weak, registration.accepts_all, registration.accepted) for registration in registrations)
+        self._plans[event] = plan
+        return plan
+
+    def _find_key(self, registrations: dict, callback_function: callable):
+        """
+        private method that finds the key a callback is registered under, the callback itself or a weak 
+        reference to it, None if it is not registered.
+        """
+        if callback_function in registrations:
+            return callback_function
+        try:
+            reference = weakref.WeakMethod(callback_function) if inspect.ismethod(callback_function) else weakref.ref(callback_function)
+        except TypeError: # cannot be weakly referenced, so it was not added with weak=True.
+            return None
+        return reference if reference in registrations else None
+
+    def _drop(self, event: str, reference: weakref.ref) -> None:
+        """
+        private method called when a weak callback is garbage collected, removes its registration.
+        """
+        registrations = self._registrations.get(event)
+        if registrations is not None and registrations.pop(reference, None) is not None: # a dead reference only equals itself.
+            self._plans[event] = None
+
+    def _get_registrations(self, event: str) -> dict[callable, _CallbackRegistration]:
+        registrations = self._registrations.get(event)
+        if registrations is None:
+            valid_events = ", ".join(self._registrations)
+            raise ValueError(f"{event} is an invalid event. valid events: {valid_events}")
+        return registrations
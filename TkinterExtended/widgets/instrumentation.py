@@ -0,0 +1,305 @@
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+
+
+class LatencyHistogram:
+    """
+    A fixed size histogram of durations with power of two microsecond buckets, so recording is O(1)
+    and memory does not grow however many samples are recorded.
+
+    Args:
+        buckets (int, optional): how many buckets, the last one holds everything longer. Defaults to 32.
+    """
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self, buckets: int = 32) -> None:
+        self.counts: list[int] = [0] * buckets
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        microseconds = int(seconds * 1_000_000)
+        self.counts[min(microseconds.bit_length(), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        estimates a percentile from the buckets, as the upper edge of the bucket it falls in.
+
+        Args:
+            fraction (float): the percentile as a fraction, eg 0.99.
+
+        Returns:
+            float: the estimated duration in seconds.
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        running = 0
+        for bucket, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return min((1 << bucket) / 1_000_000, self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.minimum * 1000 if self.count else 0.0,
+            "max_ms": self.maximum * 1000,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p90_ms": self.percentile(0.9) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+        }
+
+
+class StackProfiler:
+    """
+    Opt-in timing of Stack operations and event callbacks.
+    Enabling it wraps the stack's methods on the instance, and disabling it removes the wrappers again,
+    so a stack that is not being profiled runs exactly the same code as before.
+
+    Every operation and callback is recorded in a bounded histogram and as a trace event. After each
+    visibility change an idle callback measures how long the event loop takes to become idle, which
+    includes the geometry work Tk does for the switch. Operations or idle waits longer than the stall
+    threshold are recorded with the slowest callback that ran during them, operations called by another
+    operation count towards the outer operation's stall.
+
+    Args:
+        stack (Stack): the stack to profile.
+        stall_threshold_ms (float, optional): the duration at which an operation counts as a stall. Defaults to 50.
+        trace_capacity (int, optional): how many trace events and stalls are kept, oldest are dropped first.
+            Defaults to 10000.
+    """
+    OPERATIONS = {
+        "add_widget": "add_widget",
+        "remove_widget": "remove_widget",
+        "set_visible_child": "set_visible_child",
+        "show_next": "show_next",
+        "show_previous": "show_previous",
+        "_trigger_event_callbacks": "_trigger_event_callbacks",
+        "_build_child": "build_page",
+        "_grid_child": "grid_page",
+    }
+    SWITCH_OPERATIONS = ("set_visible_child", "show_next", "show_previous")
+
+    def __init__(self, stack, stall_threshold_ms: float = 50, trace_capacity: int = 10_000) -> None:
+        self.stall_threshold_ms: float = stall_threshold_ms
+
+        self._stack = stack
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._trace: deque[dict] = deque(maxlen = trace_capacity)
+        self._stalls: deque[dict] = deque(maxlen = trace_capacity)
+        self._active: list[list] = [] # [operation, slowest callback name, slowest callback seconds] per running operation.
+        self._origin: float = time.perf_counter()
+        self._idle_probe: str | None = None
+        self._pid: int = os.getpid()
+
+    def install(self) -> None:
+        """
+        wraps the stack's operations and its callback dispatcher.
+        """
+        stack = self._stack
+        for attribute, operation in self.OPERATIONS.items():
+            setattr(stack, attribute, self._wrap_operation(getattr(type(stack), attribute).__get__(stack), operation))
+        dispatcher = stack._callbacks
+        dispatcher.dispatch = self._wrap_dispatch(dispatcher)
+        dispatcher._build_plan = self._wrap_build_plan(dispatcher)
+        _forget_plans(dispatcher) # the cached plans call the callbacks untimed.
+
+    def uninstall(self) -> None:
+        """
+        removes every wrapper, restoring the stack's own methods.
+        """
+        stack = self._stack
+        for attribute in self.OPERATIONS:
+            stack.__dict__.pop(attribute, None)
+        dispatcher = stack._callbacks
+        dispatcher.__dict__.pop("dispatch", None)
+        dispatcher.__dict__.pop("_build_plan", None)
+        _forget_plans(dispatcher)
+        if self._idle_probe is not None:
+            stack.after_cancel(self._idle_probe)
+            self._idle_probe = None
+
+    def get_stats(self) -> dict:
+        """
+        gets the recorded timings.
+
+        Returns:
+            dict: operations and callbacks map names to histogram summaries, idle_after_switch summarises
+                how long the loop took to become idle after a switch, and stalls lists the recent stalls.
+        """
+        operations = {}
+        callbacks = {}
+        for name, histogram in self._histograms.items():
+            kind, _, label = name.partition(":")
+            (callbacks if kind == "callback" else operations)[label] = histogram.to_dict()
+        idle = operations.pop("idle_after_switch", LatencyHistogram().to_dict())
+        return {
+            "operations": operations,
+            "callbacks": callbacks,
+            "idle_after_switch": idle,
+            "stall_threshold_ms": self.stall_threshold_ms,
+            "stalls": list(self._stalls),
+        }
+
+    def export_chrome_trace(self, path: str | os.PathLike | None = None) -> dict:
+        """
+        exports the recorded trace events in the Chrome trace event format, which chrome://tracing and
+        Perfetto can open.
+
+        Args:
+            path (str | os.PathLike | None, optional): a file to write the JSON to. Defaults to None.
+
+        Returns:
+            dict: the trace.
+        """
+        trace = {"traceEvents": list(self._trace), "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w", encoding = "utf-8") as file:
+                json.dump(trace, file)
+        return trace
+
+    def reset(self) -> None:
+        """
+        clears every recorded timing.
+        """
+        self._histograms.clear()
+        self._trace.clear()
+        self._stalls.clear()
+        self._origin = time.perf_counter()
+
+    def _record(self, name: str, category: str, started: float, duration: float, args: dict | None = None) -> None:
+        histogram = self._histograms.get(f"{category}:{name}")
+        if histogram is None:
+            histogram = self._histograms[f"{category}:{name}"] = LatencyHistogram()
+        histogram.record(duration)
+
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (started - self._origin) * 1_000_000,
+            "dur": duration * 1_000_000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self._trace.append(event)
+
+    def _check_stall(self, name: str, duration: float, culprit: str | None, culprit_duration: float) -> None:
+        if duration * 1000 >= self.stall_threshold_ms:
+            self._stalls.append({
+                "operation": name,
+                "duration_ms": duration * 1000,
+                "culprit": culprit,
+                "culprit_ms": culprit_duration * 1000,
+                "at_ms": (time.perf_counter() - self._origin) * 1000,
+            })
+
+    def _wrap_operation(self, method: callable, operation: str) -> callable:
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            frame = [operation, None, 0.0]
+            self._active.append(frame)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - started
+                self._active.pop()
+                if self._active and frame[2] > self._active[-1][2]: # pass the slowest callback up to the caller.
+                    self._active[-1][1:] = frame[1:]
+                self._record(operation, "operation", started, duration)
+                if not self._active: # nested operations are part of the outermost one's stall.
+                    self._check_stall(operation, duration, frame[1], frame[2])
+                if operation in self.SWITCH_OPERATIONS:
+                    self._probe_idle(frame[1], frame[2])
+        return timed
+
+    def _wrap_dispatch(self, dispatcher) -> callable:
+        """
+        private method that times the dispatcher's own dispatch of each event as a whole.
+        """
+        dispatch = type(dispatcher).dispatch.__get__(dispatcher)
+        @functools.wraps(dispatch)
+        def timed_dispatch(event: str, **kwargs) -> None:
+            started = time.perf_counter()
+            try:
+                dispatch(event, **kwargs)
+            finally:
+                self._record(f"dispatch:{event}", "operation", started, time.perf_counter() - started)
+        return timed_dispatch
+
+    def _wrap_build_plan(self, dispatcher) -> callable:
+        """
+        private method that makes the dispatcher's plans call each callback through a timer, the plans are
+        still built, ordered and run by the dispatcher itself.
+        """
+        build_plan = type(dispatcher)._build_plan.__get__(dispatcher)
+        def timed_build_plan(event: str) -> tuple:
+            plan = tuple((self._timed_weak_callback(callback, event) if weak else self._timed_callback(callback, event),
+                          weak, accepts_all, accepted)
+                         for callback, weak, accepts_all, accepted in build_plan(event))
+            dispatcher._plans[event] = plan
+            return plan
+        return timed_build_plan
+
+    def _timed_weak_callback(self, reference: weakref.ref, event: str) -> callable:
+        """
+        private method that stands in for the weak reference of a weak callback in a plan, it gives the
+        dispatcher a timed callback, or None once the callback has been collected.
+        """
+        def resolve():
+            callback = reference()
+            return None if callback is None else self._timed_callback(callback, event)
+        return resolve
+
+    def _timed_callback(self, callback: callable, event: str) -> callable:
+        name = getattr(callback, "__qualname__", repr(callback))
+        def timed(**kwargs):
+            started = time.perf_counter()
+            try:
+                return callback(**kwargs)
+            finally:
+                duration = time.perf_counter() - started
+                self._record(name, "callback", started, duration, {"event": event})
+                if self._active and duration > self._active[-1][2]:
+                    self._active[-1][1] = name
+                    self._active[-1][2] = duration
+        return timed
+
+    def _probe_idle(self, culprit: str | None, culprit_duration: float) -> None:
+        if self._idle_probe is not None or self._active:
+            return # one probe at a time, measured from the end of the outermost switch.
+        switched_at = time.perf_counter()
+        def became_idle() -> None:
+            self._idle_probe = None
+            duration = time.perf_counter() - switched_at
+            self._record("idle_after_switch", "operation", switched_at, duration)
+            self._check_stall("idle_after_switch", duration, culprit, culprit_duration)
+        self._idle_probe = self._stack.after_idle(became_idle)
+
+
+def _forget_plans(dispatcher) -> None:
+    """
+    drops the cached dispatch plans, so each is rebuilt on its next dispatch.
+    """
+    for event in dispatcher._plans:
+        dispatcher._plans[event] = None
@@ -0,0 +1,99 @@
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+class NavigationCoalescer:
+    """
+    Collapses bursts of switch requests on a Stack into one switch. A request only updates the target page,
+    the first request of a burst schedules a single flush, with after_idle or after a frame interval, which
+    shows the last target and sends one change_visible_widget event with where the burst started and ended.
+    Pages requested in between are never built, gridded or reported to callbacks.
+
+    Attributes:
+        frame_ms (int | None): how long after the first request of a burst it is applied, None applies it
+            once the event loop is idle.
+    """
+    def __init__(self, stack, frame_ms: int | None = None) -> None:
+        self.frame_ms: int | None = frame_ms
+
+        self._stack = stack
+        self._target: StackChild | None = None
+        self._identifier = None # what the last request passed, sent as the widget of the event.
+        self._requests: int = 0
+        self._job: str | None = None
+
+        self.bursts: int = 0
+        self.coalesced_requests: int = 0
+
+    @property
+    def target(self) -> StackChild | None:
+        """
+        the page the pending burst will show, None if nothing is pending.
+        """
+        return self._target
+
+    def request(self, child: StackChild, identifier) -> None:
+        """
+        sets the page to show at the next flush, scheduling the flush if this starts a burst.
+
+        Args:
+            child (StackChild): the page to show.
+            identifier (BASECLASS | str | int): the identifier the page was requested with.
+        """
+        self._target = child
+        self._identifier = identifier
+        self._requests += 1
+        if self._job is None:
+            if self.frame_ms is None:
+                self._job = self._stack.after_idle(self.flush)
+            else:
+                self._job = self._stack.after(self.frame_ms, self.flush)
+
+    def flush(self) -> None:
+        """
+        shows the pending target straight away, if there is one. nothing is switched or sent when the burst
+        ends on the page it started from, or its target has been removed.
+        """
+        self.cancel()
+        child, identifier, requests = self._target, self._identifier, self._requests
+        self.discard()
+        if child is None:
+            return
+
+        stack = self._stack
+        self.bursts += 1
+        self.coalesced_requests += requests - 1
+        origin = stack.visible_child
+        if child is stack._visible_record or not stack._contains_child(child):
+            return
+        stack._show_child(child)
+        stack._trigger_event_callbacks(event = "change_visible_widget", widget = identifier, origin = origin,
+                                       destination = stack.visible_child, requests = requests)
+
+    def discard(self) -> None:
+        """
+        forgets the pending target without showing it, the scheduled flush then does nothing.
+        """
+        self._target = None
+        self._identifier = None
+        self._requests = 0
+
+    def cancel(self) -> None:
+        """
+        cancels the scheduled flush, if there is one.
+        """
+        if self._job is not None:
+            self._stack.after_cancel(self._job)
+            self._job = None
+
+    def get_stats(self) -> dict:
+        """
+        gets how many bursts have been applied and how many requests they saved.
+
+        Returns:
+            dict: the coalescing statistics.
+        """
+        return {
+            "bursts": self.bursts,
+            "coalesced_requests": self.coalesced_requests,
+            "pending": self._target is not None,
+        }
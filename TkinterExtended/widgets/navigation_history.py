@@ -0,0 +1,168 @@
+from typing import Callable
+
+
+class NavigationHistory:
+    """
+    A fixed capacity ring buffer of the pages a Stack has shown, with a cursor for back and forward.
+    Pushing, going back and going forward are all O(1) and memory never grows past the capacity,
+    the oldest entries are overwritten once it is full. Pushing after going back drops the forward entries.
+
+    Entries are the stack's StackChild records rather than indexes, so inserting, moving or removing
+    other pages does not change what an entry refers to. Going back or forward skips entries that are the
+    current entry again, eg the first A of A, B, A once B is removed, as moving to them would change nothing.
+
+    Args:
+        capacity (int): the most entries kept, including the current one.
+    """
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"History capacity must be at least 1, not {capacity}")
+        self._entries: list = [None] * capacity
+        self._cursor: int = -1 # slot of the current entry, -1 when empty.
+        self._back: int = 0 # entries behind the cursor.
+        self._forward: int = 0 # entries ahead of the cursor.
+
+    @property
+    def capacity(self) -> int:
+        return len(self._entries)
+
+    def __len__(self) -> int:
+        return 0 if self._cursor < 0 else self._back + 1 + self._forward
+
+    @property
+    def current(self):
+        """
+        the current entry, None if the history is empty.
+        """
+        return None if self._cursor < 0 else self._entries[self._cursor]
+
+    def push(self, entry) -> None:
+        """
+        makes an entry the current one, dropping anything ahead of the cursor.
+
+        Args:
+            entry (object): the entry to add.
+        """
+        capacity = len(self._entries)
+        if self._cursor >= 0:
+            self._back = min(self._back + 1, capacity - 1)
+        for step in range(1, self._forward + 1): # release the dropped entries.
+            self._entries[(self._cursor + step) % capacity] = None
+        self._forward = 0
+        self._cursor = (self._cursor + 1) % capacity
+        self._entries[self._cursor] = entry
+
+    def can_go_back(self, is_valid: Callable | None = None) -> bool:
+        return self._find(-1, self._back, is_valid) is not None
+
+    def can_go_forward(self, is_valid: Callable | None = None) -> bool:
+        return self._find(1, self._forward, is_valid) is not None
+
+    def back(self, is_valid: Callable | None = None):
+        """
+        moves the cursor back to the nearest earlier entry that is valid and not the current entry.
+
+        Args:
+            is_valid (Callable | None, optional): entries it returns False for are skipped. Defaults to None.
+
+        Returns:
+            object: the new current entry, or None if there is no earlier valid entry.
+        """
+        steps = self._find(-1, self._back, is_valid)
+        if steps is None:
+            return None
+        self._move(-steps)
+        return self._entries[self._cursor]
+
+    def forward(self, is_valid: Callable | None = None):
+        """
+        moves the cursor forward to the nearest later entry that is valid and not the current entry.
+
+        Args:
+            is_valid (Callable | None, optional): entries it returns False for are skipped. Defaults to None.
+
+        Returns:
+            object: the new current entry, or None if there is no later valid entry.
+        """
+        steps = self._find(1, self._forward, is_valid)
+        if steps is None:
+            return None
+        self._move(steps)
+        return self._entries[self._cursor]
+
+    def move_to(self, position: int) -> None:
+        """
+        moves the cursor to an entry by its index in entries(), without skipping any, eg to restore a
+        saved position.
+
+        Args:
+            position (int): the index, clamped to the entries there are.
+        """
+        if self._cursor >= 0:
+            self._move(min(max(position, 0), len(self) - 1) - self._back)
+
+    def resize(self, capacity: int) -> None:
+        """
+        changes the capacity, keeping the entries closest to the cursor.
+
+        Args:
+            capacity (int): the new capacity.
+        """
+        if capacity < 1:
+            raise ValueError(f"History capacity must be at least 1, not {capacity}")
+        if self._cursor < 0:
+            self._entries = [None] * capacity
+            return
+
+        # trim the oldest entries first, then the newest forward entries.
+        entries = self.entries()
+        keep_back = min(self._back, capacity - 1)
+        keep_forward = min(self._forward, capacity - 1 - keep_back)
+        kept = entries[self._back - keep_back:self._back + keep_forward + 1]
+        self._entries = kept + [None] * (capacity - len(kept))
+        self._cursor = keep_back
+        self._back = keep_back
+        self._forward = keep_forward
+
+    def clear(self) -> None:
+        """
+        removes every entry.
+        """
+        self._entries = [None] * len(self._entries)
+        self._cursor = -1
+        self._back = 0
+        self._forward = 0
+
+    def entries(self) -> list:
+        """
+        gets every entry from oldest to newest.
+
+        Returns:
+            list: the entries.
+        """
+        if self._cursor < 0:
+            return []
+        capacity = len(self._entries)
+        start = self._cursor - self._back
+        return [self._entries[(start + offset) % capacity] for offset in range(len(self))]
+
+    @property
+    def position(self) -> int:
+        """
+        the index of the current entry in entries().
+        """
+        return self._back
+
+    def _find(self, direction: int, available: int, is_valid: Callable | None) -> int | None:
+        capacity = len(self._entries)
+        current = self._entries[self._cursor]
+        for steps in range(1, available + 1):
+            entry = self._entries[(self._cursor + direction * steps) % capacity]
+            if entry is not current and (is_valid is None or is_valid(entry)):
+                return steps
+        return None
+
+    def _move(self, steps: int) -> None:
+        self._cursor = (self._cursor + steps) % len(self._entries)
+        self._back += steps
+        self._forward -= steps
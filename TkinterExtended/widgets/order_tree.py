@@ -0,0 +1,351 @@
+import random
+from collections.abc import MutableSequence
+from typing import Iterable, Iterator
+
+
+class _OrderNode:
+    """
+    A node of the order tree, one item and the size of the subtree below it.
+    """
+    __slots__ = ("item", "left", "right", "parent", "size")
+
+    def __init__(self, item) -> None:
+        self.item = item
+        self.left: _OrderNode | None = None
+        self.right: _OrderNode | None = None
+        self.parent: _OrderNode | None = None
+        self.size: int = 1
+
+
+def _size(node: _OrderNode | None) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: _OrderNode) -> None:
+    """
+    recalculates the size of a node and points its children back at it after they have changed.
+    """
+    left, right = node.left, node.right
+    size = 1
+    if left is not None:
+        left.parent = node
+        size += left.size
+    if right is not None:
+        right.parent = node
+        size += right.size
+    node.size = size
+
+
+def _merge(first: _OrderNode | None, second: _OrderNode | None) -> _OrderNode | None:
+    """
+    joins two trees, every item of first coming before every item of second. the root is picked at random
+    weighted by the sizes of the trees, which keeps the tree balanced on average without storing priorities.
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if random.random() * (first.size + second.size) < first.size:
+        first.right = _merge(first.right, second)
+        _update(first)
+        return first
+    second.left = _merge(first, second.left)
+    _update(second)
+    return second
+
+
+def _split(node: _OrderNode | None, count: int) -> tuple[_OrderNode | None, _OrderNode | None]:
+    """
+    splits a tree into its first count items and the rest.
+    """
+    if node is None:
+        return None, None
+    left_size = _size(node.left)
+    if count <= left_size:
+        first, node.left = _split(node.left, count)
+        _update(node)
+        if first is not None:
+            first.parent = None
+        return first, node
+    node.right, second = _split(node.right, count - left_size - 1)
+    _update(node)
+    if second is not None:
+        second.parent = None
+    return node, second
+
+
+def _build(nodes: list[_OrderNode], start: int, stop: int) -> _OrderNode | None:
+    """
+    builds a balanced tree from a run of nodes in order.
+    """
+    if start >= stop:
+        return None
+    middle = (start + stop) // 2
+    node = nodes[middle]
+    node.left = _build(nodes, start, middle)
+    node.right = _build(nodes, middle + 1, stop)
+    _update(node)
+    return node
+
+
+class OrderTree(MutableSequence):
+    """
+    An ordered sequence of unique, hashable items that can be used like a list, where inserting at a position,
+    removing, moving, looking up the item at a position and finding the position of an item are all O(log n).
+    It is a randomised binary search tree ordered by position, each node knows the size of its subtree and
+    its parent, and a dictionary finds the node of an item, so index and in do not scan the sequence.
+
+    Args:
+        items (Iterable, optional): the starting items, in order. Defaults to ().
+
+    Raises:
+        ValueError: if an item is added that is already in the sequence.
+    """
+    def __init__(self, items: Iterable = ()) -> None:
+        self._root: _OrderNode | None = None
+        self._nodes: dict = {}
+        self.reset(items)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __contains__(self, item) -> bool:
+        return item in self._nodes
+
+    def __iter__(self) -> Iterator:
+        pending = []
+        node = self._root
+        while pending or node is not None:
+            while node is not None:
+                pending.append(node)
+                node = node.left
+            node = pending.pop()
+            yield node.item
+            node = node.right
+
+    def __reversed__(self) -> Iterator:
+        pending = []
+        node = self._root
+        while pending or node is not None:
+            while node is not None:
+                pending.append(node)
+                node = node.right
+            node = pending.pop()
+            yield node.item
+            node = node.left
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._node_at(index).item
+
+    def __setitem__(self, index: int | slice, item) -> None:
+        if isinstance(index, slice):
+            if index != slice(None):
+                raise TypeError("only the whole sequence can be assigned, use tree[:] = items")
+            self.reset(item)
+            return
+        self.replace(self._node_at(index).item, item)
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            doomed = self[index]
+            if len(doomed) == len(self):
+                self.clear()
+                return
+            for item in doomed:
+                self.remove(item)
+            return
+        self.remove(self._node_at(index).item)
+
+    def __repr__(self) -> str:
+        return f"OrderTree({list(self)!r})"
+
+    def insert(self, index: int, item) -> None:
+        """
+        inserts an item before the given position, following the same index rules as list.insert.
+        """
+        if item in self._nodes:
+            raise ValueError(f"{item!r} is already in the sequence")
+        size = len(self)
+        if index < 0:
+            index = max(size + index, 0)
+        node = self._nodes[item] = _OrderNode(item)
+        self._insert_node(min(index, size), node)
+
+    def append(self, item) -> None:
+        self.insert(len(self), item)
+
+    def index(self, item, start: int = 0, stop: int | None = None) -> int:
+        """
+        gets the position of an item.
+
+        Raises:
+            ValueError: if the item is not in the sequence, or not between start and stop.
+        """
+        node = self._nodes.get(item)
+        if node is None:
+            raise ValueError(f"{item!r} is not in the sequence")
+        position = _size(node.left)
+        while node.parent is not None:
+            if node is node.parent.right:
+                position += _size(node.parent.left) + 1
+            node = node.parent
+        if position < start or (stop is not None and position >= stop):
+            raise ValueError(f"{item!r} is not in the sequence between {start} and {stop}")
+        return position
+
+    def count(self, item) -> int:
+        return 1 if item in self._nodes else 0
+
+    def remove(self, item) -> None:
+        """
+        removes an item.
+
+        Raises:
+            ValueError: if the item is not in the sequence.
+        """
+        node = self._nodes.pop(item, None)
+        if node is None:
+            raise ValueError(f"{item!r} is not in the sequence")
+        self._unlink(node)
+
+    def move(self, item, index: int) -> None:
+        """
+        moves an item so it ends up at the given position, the items in between shift by one.
+
+        Raises:
+            ValueError: if the item is not in the sequence.
+            IndexError: if the position is out of range.
+        """
+        node = self._nodes.get(item)
+        if node is None:
+            raise ValueError(f"{item!r} is not in the sequence")
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index {index} is out of range.")
+        self._unlink(node)
+        node.left = node.right = node.parent = None
+        node.size = 1
+        self._insert_node(index, node)
+
+    def swap(self, first, second) -> None:
+        """
+        swaps the positions of two items, without changing the shape of the tree.
+
+        Raises:
+            ValueError: if either item is not in the sequence.
+        """
+        try:
+            first_node, second_node = self._nodes[first], self._nodes[second]
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not in the sequence") from None
+        first_node.item, second_node.item = second, first
+        self._nodes[first], self._nodes[second] = second_node, first_node
+
+    def replace(self, old, new) -> None:
+        """
+        puts a new item in the place of an old one.
+
+        Raises:
+            ValueError: if old is not in the sequence, or new already is.
+        """
+        if new is old:
+            return
+        if new in self._nodes:
+            raise ValueError(f"{new!r} is already in the sequence")
+        node = self._nodes.pop(old, None)
+        if node is None:
+            raise ValueError(f"{old!r} is not in the sequence")
+        node.item = new
+        self._nodes[new] = node
+
+    def clear(self) -> None:
+        self._root = None
+        self._nodes = {}
+
+    def reset(self, items: Iterable) -> None:
+        """
+        replaces every item, building a balanced tree in O(n).
+
+        Raises:
+            ValueError: if an item appears twice.
+        """
+        nodes = [_OrderNode(item) for item in items]
+        lookup = {node.item: node for node in nodes}
+        if len(lookup) != len(nodes):
+            raise ValueError("the items of an OrderTree must be unique")
+        self._nodes = lookup
+        self._set_root(_build(nodes, 0, len(nodes)))
+
+    def _insert_node(self, index: int, new: _OrderNode) -> None:
+        """
+        private method that inserts a single node at a position. on the way down each subtree is replaced by 
+        the new node with a chance of one in its size plus one, so the tree stays a random binary search tree, 
+        and the subtree it replaces is split around it.
+        """
+        chance = random.random
+        parent = None
+        went_left = False
+        node = self._root
+        while node is not None and chance() * (node.size + 1) >= 1:
+            node.size += 1
+            parent = node
+            left = node.left
+            left_size = left.size if left is not None else 0
+            went_left = index <= left_size
+            if went_left:
+                node = left
+            else:
+                index -= left_size + 1
+                node = node.right
+
+        new.left, new.right = _split(node, index)
+        _update(new)
+        new.parent = parent
+        if parent is None:
+            self._root = new
+        elif went_left:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _unlink(self, node: _OrderNode) -> None:
+        """
+        private method that takes a node out of the tree, putting its two subtrees merged in its place.
+        """
+        replacement = _merge(node.left, node.right)
+        parent = node.parent
+        if replacement is not None:
+            replacement.parent = parent
+        if parent is None:
+            self._root = replacement
+            return
+        if parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        while parent is not None:
+            parent.size -= 1
+            parent = parent.parent
+
+    def _set_root(self, node: _OrderNode | None) -> None:
+        if node is not None:
+            node.parent = None
+        self._root = node
+
+    def _node_at(self, index: int) -> _OrderNode:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("OrderTree index out of range")
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
@@ -0,0 +1,353 @@
+import time
+import weakref
+from contextlib import contextmanager
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+SUMMED_FIELDS = ("built", "descendants", "tcl_commands", "images", "memory_bytes", "build_seconds")
+_image_classes: dict[type, bool] = {} # widget classes that have an image option.
+
+
+class PageWeight:
+    """
+    What one page of a stack costs. The counts come from walking the page's widgets once and are kept
+    until the page changes, the timings and memory are recorded as the page is built and shown.
+
+    Attributes:
+        counted (bool): if the counts are up to date, and added to the stack's totals.
+        built (bool): if the page was built when it was counted.
+        descendants (int): the widgets inside the page, not counting the page itself or the pages of
+            stacks nested in it, those are counted by the nested stack.
+        tcl_commands (int): the Tcl commands the page's widgets created, eg for commands and bindings.
+        images (int): the distinct images the page's widgets show.
+        nested (list[weakref.ref]): the stacks nested in the page.
+        builds (int): how many times the page was built from its factory.
+        build_seconds (float | None): how long the last build took.
+        memory_bytes (int | None): the Python memory the last build allocated and kept, None unless memory
+            is traced.
+        shows (int): how many times the page was shown.
+        show_seconds (float): the total time of those shows, until the event loop was idle again.
+    """
+    __slots__ = ("counted", "built", "descendants", "tcl_commands", "images", "nested", "builds", "build_seconds", "memory_bytes",
+                 "shows", "show_seconds", "pending_seconds", "pending_memory")
+
+    def __init__(self) -> None:
+        self.counted: bool = False
+        self.built: bool = False
+        self.descendants: int = 0
+        self.tcl_commands: int = 0
+        self.images: int = 0
+        self.nested: list[weakref.ref] = []
+        self.builds: int = 0
+        self.build_seconds: float | None = None
+        self.memory_bytes: int | None = None
+        self.shows: int = 0
+        self.show_seconds: float = 0.0
+        self.pending_seconds: float = 0.0 # time spent so far on a generator build that has not finished.
+        self.pending_memory: int | None = None
+
+
+class PageAccountant:
+    """
+    Keeps the weight of every page of a Stack, so an app can tell which pages are expensive to keep and
+    decide which to build lazily, evict or prefetch.
+
+    Nothing is counted when it is asked for unless it changed. The stack tells the accountant when a page
+    is added, built, evicted, replaced or removed, which marks that page to be counted again the next time
+    it is needed, and the totals of the stack are kept as running sums that are only adjusted for the pages
+    that were counted again. Stacks nested in a page are found while it is counted and are accounted for
+    by their own accountant, which this one enables, so the report covers the whole tree.
+
+    Build times and memory are measured around the page's factory, so pages added with add_widget have
+    neither. Memory is the net size of the Python objects allocated during the build, sampled with
+    tracemalloc, which slows the whole program down while it traces. Show times run from the switch
+    until the event loop is next idle, so they include the geometry work Tk does for the page.
+
+    Args:
+        stack (Stack): the stack to account for.
+        trace_memory (bool, optional): measure the memory of each build with tracemalloc, starting it if it is
+            not tracing. Defaults to False.
+    """
+    def __init__(self, stack, trace_memory: bool = False) -> None:
+        self.trace_memory: bool = trace_memory
+
+        self._stack = stack
+        self._weights: dict[StackChild, PageWeight] = {}
+        self._uncounted: set[StackChild] = set()
+        self._totals: dict[str, float] = dict.fromkeys(SUMMED_FIELDS, 0)
+        self._with_nested: set[StackChild] = set() # the pages that have stacks nested in them.
+        self._enabled_nested: weakref.WeakSet = weakref.WeakSet() # nested stacks this accountant enabled.
+        self._started_tracing: bool = False
+        self._probe: str | None = None
+        self._probe_child: StackChild | None = None
+        self._probe_started: float = 0.0
+        self._probe_seconds: float = 0.0
+
+        if trace_memory:
+            import tracemalloc # only imported when memory is traced.
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        for child in stack.children_list:
+            self.page_added(child)
+
+    def close(self) -> None:
+        """
+        stops accounting, disabling it on the nested stacks it was enabled on and stopping tracemalloc if
+        it was started for this.
+        """
+        if self._probe is not None:
+            self._stack.after_cancel(self._probe)
+            self._probe = None
+        for stack in list(self._enabled_nested):
+            if stack.winfo_exists():
+                stack.disable_accounting()
+        self._enabled_nested.clear()
+        if self._started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    # called by the stack
+
+    def page_added(self, child: StackChild) -> None:
+        self._weights[child] = PageWeight()
+        self._uncounted.add(child)
+
+    def invalidate(self, child: StackChild) -> None:
+        """
+        marks a page to be counted again the next time its weight is needed.
+        """
+        weight = self._weights.get(child)
+        if weight is None or not weight.counted:
+            return
+        self._add_to_totals(weight, -1)
+        weight.counted = False
+        self._uncounted.add(child)
+
+    def page_replaced(self, child: StackChild) -> None:
+        """
+        forgets the build of a page whose widget was replaced, the new widget was not built by the stack.
+        """
+        self.invalidate(child) # before the build is forgotten, so it is taken off the totals.
+        weight = self._weights.get(child)
+        if weight is not None:
+            weight.build_seconds = weight.memory_bytes = None
+            weight.pending_seconds, weight.pending_memory = 0.0, None
+
+    def forget(self, child: StackChild) -> None:
+        weight = self._weights.pop(child, None)
+        if weight is not None and weight.counted:
+            self._add_to_totals(weight, -1)
+        self._uncounted.discard(child)
+        self._with_nested.discard(child)
+        if self._probe_child is child:
+            self._stack.after_cancel(self._probe)
+            self._probe = self._probe_child = None
+
+    @contextmanager
+    def measure_build(self, child: StackChild):
+        """
+        times a build step of a page, and samples the memory it allocated if memory is traced. a generator
+        factory builds in several steps, they are added up until the page is built.
+        """
+        memory = None
+        if self.trace_memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                memory = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            weight = self._weights.get(child)
+            if weight is not None:
+                weight.pending_seconds += time.perf_counter() - started
+                if memory is not None:
+                    import tracemalloc
+                    weight.pending_memory = (weight.pending_memory or 0) + tracemalloc.get_traced_memory()[0] - memory
+                if child.pending_build is None: # finished, or failed.
+                    if child.widget is not None:
+                        self.invalidate(child)
+                        weight.builds += 1
+                        weight.build_seconds, weight.memory_bytes = weight.pending_seconds, weight.pending_memory
+                    weight.pending_seconds, weight.pending_memory = 0.0, None
+
+    def page_shown(self, child: StackChild, started: float) -> None:
+        """
+        starts timing a show until the event loop is idle. a show that is followed by another before then
+        only counts the time the stack spent showing it.
+        """
+        seconds = time.perf_counter() - started
+        if self._probe is not None:
+            self._stack.after_cancel(self._probe)
+            self._record_show(self._probe_child, self._probe_seconds)
+        self._probe_child, self._probe_started, self._probe_seconds = child, started, seconds
+        self._probe = self._stack.after_idle(self._on_idle)
+
+    # queries
+
+    def weight(self, child: StackChild) -> PageWeight:
+        """
+        gets the weight of a page, counting it first if it changed.
+        """
+        if child in self._uncounted:
+            self._count(child)
+        return self._weights[child]
+
+    def page_report(self, child: StackChild, index: int) -> dict:
+        weight = self.weight(child)
+        nested = self._nested_stacks(weight)
+        descendants = weight.descendants
+        tcl_commands, images = weight.tcl_commands, weight.images
+        for stack in nested:
+            totals = stack._accountant.totals()
+            descendants += totals["descendants"] + totals["built"] # the nested pages are descendants too.
+            tcl_commands += totals["tcl_commands"]
+            images += totals["images"]
+        return {
+            "page": child.name if child.name is not None else index,
+            "index": index,
+            "built": child.widget is not None,
+            "descendants": descendants,
+            "tcl_commands": tcl_commands,
+            "images": images,
+            "builds": weight.builds,
+            "build_ms": weight.build_seconds * 1000 if weight.build_seconds is not None else None,
+            "memory_bytes": weight.memory_bytes,
+            "shows": weight.shows,
+            "average_show_ms": weight.show_seconds / weight.shows * 1000 if weight.shows else None,
+            "cost": child.cost,
+            "nested_stacks": len(nested),
+        }
+
+    def totals(self) -> dict:
+        """
+        gets the totals of the stack, and of the stacks nested in it for the counts, which include every
+        widget in the tree. memory is that of the pages that are built, build time that of every page's last
+        build. they are running sums, only the pages that changed are counted again.
+        """
+        for child in list(self._uncounted):
+            self._count(child)
+        totals = dict(self._totals)
+        for child in self._with_nested:
+            for stack in self._nested_stacks(self._weights[child]):
+                nested = stack._accountant.totals()
+                totals["descendants"] += nested["descendants"] + nested["built"] # the nested pages are descendants too.
+                totals["tcl_commands"] += nested["tcl_commands"]
+                totals["images"] += nested["images"]
+        totals["pages"] = len(self._weights)
+        totals["build_ms"] = totals.pop("build_seconds") * 1000
+        return totals
+
+    def report(self, include_pages: bool = True) -> dict:
+        """
+        gets the totals of the stack, the weight of each page in stack order and the reports of the stacks
+        nested in its pages.
+        """
+        report = {"totals": self.totals()}
+        if include_pages:
+            report["pages"] = [self.page_report(child, index) for index, child in enumerate(self._stack.children_list)]
+        nested = []
+        children = self._stack.children_list
+        for index, child in sorted((children.index(child), child) for child in self._with_nested):
+            for stack in self._nested_stacks(self._weights[child]):
+                nested.append({"page": child.name if child.name is not None else index,
+                               "report": stack._accountant.report(include_pages)})
+        report["nested"] = nested
+        return report
+
+    # counting
+
+    def _count(self, child: StackChild) -> None:
+        """
+        private method that walks the widgets of a page once, without going into the stacks nested in it.
+        """
+        weight = self._weights[child]
+        self._uncounted.discard(child)
+        if weight.counted:
+            self._add_to_totals(weight, -1)
+        descendants = tcl_commands = 0
+        images = set()
+        nested = []
+        page = child.widget
+        pending = [page] if page is not None else []
+        while pending:
+            widget = pending.pop()
+            descendants += 1
+            tcl_commands += len(getattr(widget, "_tclCommands", None) or ())
+            image = _get_image(widget)
+            if image is not None:
+                images.add(image)
+            if "_accountant" in getattr(widget, "__dict__", ()): # a nested stack, its pages are its own.
+                nested.append(weakref.ref(widget))
+                self._account_nested(widget)
+                continue
+            pending.extend(widget.children.values())
+        weight.built = page is not None
+        weight.descendants = max(descendants - 1, 0)
+        weight.tcl_commands = tcl_commands
+        weight.images = len(images)
+        weight.nested = nested
+        if nested:
+            self._with_nested.add(child)
+        else:
+            self._with_nested.discard(child)
+        weight.counted = True
+        self._add_to_totals(weight, 1)
+
+    def _account_nested(self, stack) -> None:
+        if stack._accountant is None:
+            stack.enable_accounting(self.trace_memory)
+            self._enabled_nested.add(stack)
+
+    def _nested_stacks(self, weight: PageWeight) -> list:
+        stacks = (reference() for reference in weight.nested)
+        return [stack for stack in stacks if stack is not None and stack._accountant is not None]
+
+    def _add_to_totals(self, weight: PageWeight, sign: int) -> None:
+        totals = self._totals
+        for field in SUMMED_FIELDS:
+            totals[field] += sign * (getattr(weight, field) or 0)
+        if not weight.built and weight.memory_bytes: # an evicted page gave its memory back.
+            totals["memory_bytes"] -= sign * weight.memory_bytes
+
+    def _on_idle(self) -> None:
+        self._probe = None
+        self._record_show(self._probe_child, time.perf_counter() - self._probe_started)
+        self._probe_child = None
+
+    def _record_show(self, child: StackChild, seconds: float) -> None:
+        weight = self._weights.get(child)
+        if weight is not None:
+            weight.shows += 1
+            weight.show_seconds += seconds
+
+
+def _get_image(widget):
+    """
+    gets something that identifies the image a widget shows, None if it shows none.
+    """
+    attributes = getattr(widget, "__dict__", {})
+    image = attributes.get("_image") # customtkinter keeps its CTkImage here.
+    options = attributes.get("_options")
+    if image is None and isinstance(options, dict): # the headless backend only knows the options that were set.
+        image = options.get("image")
+    elif image is None:
+        cls = type(widget)
+        supported = _image_classes.get(cls)
+        if supported is None:
+            try:
+                supported = _image_classes[cls] = "image" in widget.keys()
+            except Exception:
+                supported = _image_classes[cls] = False
+        if not supported:
+            return None
+        try:
+            image = widget.cget("image")
+        except Exception:
+            return None
+    if not image:
+        return None
+    return image if isinstance(image, str) else id(image)
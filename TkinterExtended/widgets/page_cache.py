@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+class PageCache:
+    """
+    Least recently shown bookkeeping for the built pages of a Stack that can be rebuilt from a factory.
+    The cache only decides which pages should go, the stack does the destroying and rebuilding.
+    Both limits are optional, with neither set nothing is ever evicted.
+
+    Attributes:
+        max_live_pages (int | None): the most rebuildable pages that may be built at once.
+        cost_budget (int | float | None): the most total cost the built rebuildable pages may have.
+        hits (int): times a rebuildable page was shown while it was still built.
+        misses (int): times a rebuildable page had to be built to be shown.
+        evictions (int): times a hidden page was destroyed to stay within the limits.
+    """
+    def __init__(self, max_live_pages: int | None = None, cost_budget: int | float | None = None) -> None:
+        self.max_live_pages: int | None = max_live_pages
+        self.cost_budget: int | float | None = cost_budget
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._live: OrderedDict[StackChild, int | float] = OrderedDict() # oldest shown first.
+        self._live_cost: int | float = 0
+
+    def record_show(self, child: StackChild, was_built: bool) -> None:
+        """
+        marks a page as the most recently shown and counts the hit or miss.
+
+        Args:
+            child (StackChild): the page being shown.
+            was_built (bool): if the page was already built before it was shown.
+        """
+        if was_built:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.record_built(child)
+        self._live.move_to_end(child)
+
+    def record_built(self, child: StackChild) -> None:
+        """
+        starts tracking a page that has just been built, without counting it as shown.
+
+        Args:
+            child (StackChild): the page that was built.
+        """
+        if child not in self._live:
+            self._live[child] = child.cost
+            self._live_cost += child.cost
+
+    def discard(self, child: StackChild) -> None:
+        """
+        stops tracking a page, eg when it is destroyed or removed from the stack.
+
+        Args:
+            child (StackChild): the page to forget.
+        """
+        cost = self._live.pop(child, None)
+        if cost is not None:
+            self._live_cost -= cost
+
+    def is_full(self, extra_cost: int | float = 0) -> bool:
+        """
+        checks if building one more page with the given cost would go over a limit.
+
+        Args:
+            extra_cost (int | float, optional): the cost of the page that would be built. Defaults to 0.
+
+        Returns:
+            bool: if a limit would be exceeded.
+        """
+        if self.max_live_pages is not None and len(self._live) + 1 > self.max_live_pages:
+            return True
+        return self.cost_budget is not None and self._live_cost + extra_cost > self.cost_budget
+
+    def pick_evictions(self, keep: StackChild | None) -> list[StackChild]:
+        """
+        chooses the least recently shown pages to evict until the cache is back within its limits.
+
+        Args:
+            keep (StackChild | None): a page that must not be evicted, normally the visible one.
+
+        Returns:
+            list[StackChild]: the pages to evict, oldest first.
+        """
+        count = len(self._live)
+        cost = self._live_cost
+        victims = []
+        for child, child_cost in self._live.items():
+            if not self._over_limits(count, cost):
+                break
+            if child is keep:
+                continue
+            victims.append(child)
+            count -= 1
+            cost -= child_cost
+        return victims
+
+    def get_stats(self) -> dict:
+        """
+        gets the counters and current usage of the cache.
+
+        Returns:
+            dict: hits, misses, evictions, hit_rate, live_pages, live_cost, max_live_pages and cost_budget.
+        """
+        shows = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / shows if shows else 0.0,
+            "live_pages": len(self._live),
+            "live_cost": self._live_cost,
+            "max_live_pages": self.max_live_pages,
+            "cost_budget": self.cost_budget,
+        }
+
+    def _over_limits(self, count: int, cost: int | float) -> bool:
+        if self.max_live_pages is not None and count > self.max_live_pages:
+            return True
+        return self.cost_budget is not None and cost > self.cost_budget
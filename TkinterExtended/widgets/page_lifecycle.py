@@ -0,0 +1,291 @@
+import itertools
+import weakref
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+LIFECYCLE_HOOKS = ("on_show", "on_hide", "on_suspend", "on_resume")
+
+_job_ids = itertools.count(1)
+_hooked_types: dict[type, bool] = {} # widget classes that define at least one lifecycle hook.
+
+
+def _defines_hooks(widget) -> bool:
+    cls = type(widget)
+    defined = _hooked_types.get(cls)
+    if defined is None:
+        defined = _hooked_types[cls] = any(callable(getattr(cls, hook, None)) for hook in LIFECYCLE_HOOKS)
+    return defined
+
+
+class _PageJob:
+    """
+    A job scheduled for a page through the stack, and where it is in its countdown.
+    """
+    __slots__ = ("child", "callback", "args", "delay_ms", "repeat", "catch_up", "due", "remaining", "after_id")
+
+    def __init__(self, child: StackChild, callback: callable, args: tuple, delay_ms: int, repeat: bool, catch_up: bool) -> None:
+        self.child = child
+        self.callback = callback
+        self.args = args
+        self.delay_ms = delay_ms
+        self.repeat = repeat
+        self.catch_up = catch_up
+        self.due: float = 0.0 # the stack's monotonic time the job fires at.
+        self.remaining: float | None = None # seconds left when it was paused, None while it is running.
+        self.after_id: str | None = None
+
+
+class PageLifecycle:
+    """
+    Tells the pages of a Stack when they are shown, hidden, suspended and resumed, and runs the jobs
+    scheduled for them through the stack only while they are active.
+
+    on_show and on_hide follow what the stack itself shows. on_suspend and on_resume follow whether the page
+    is active, which is when it is visible and the stack is too: a stack nested in a page of another stack
+    is only active while that page is the visible one, so switching the outer stack suspends the visible
+    page of every stack nested in the page being left. Hooks are methods of the page widget's class with
+    those names, or functions registered with set_hooks, both are called with no arguments.
+
+    A paused job's countdown stops while its page is inactive and carries on when it is resumed, unless it
+    catches up, then its countdown keeps going and if it came due while the page was inactive it fires once
+    as soon as the page is resumed.
+
+    Args:
+        stack (Stack): the stack whose pages are managed.
+    """
+    def __init__(self, stack) -> None:
+        self._stack = stack
+        self._hooks: dict[StackChild, dict[str, callable]] = {}
+        self._jobs: dict[str, _PageJob] = {}
+        self._jobs_by_child: dict[StackChild, set[str]] = {}
+        self._nested: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() # page widget -> stacks nested in it.
+        self._resumed: StackChild | None = None
+        self.active: bool = True
+
+    def attach_to_enclosing_stack(self) -> None:
+        """
+        finds the stack this stack is nested in, if any, and follows whether the page holding it is active.
+        """
+        page = self._stack
+        parent = page.master
+        while parent is not None:
+            lifecycle = getattr(parent, "_lifecycle", None)
+            if isinstance(lifecycle, PageLifecycle):
+                lifecycle._nested.setdefault(page, weakref.WeakSet()).add(self._stack)
+                self.active = lifecycle.active and parent.visible_child is page
+                return
+            page = parent
+            parent = parent.master
+
+    def set_hooks(self, child: StackChild, hooks: dict[str, callable]) -> None:
+        """
+        registers hook functions for a page, a hook set to None is removed.
+
+        Args:
+            child (StackChild): the page.
+            hooks (dict[str, callable]): the functions by hook name, eg {"on_show": refresh}.
+
+        Raises:
+            ValueError: if a hook name is invalid.
+        """
+        for hook in hooks:
+            if hook not in LIFECYCLE_HOOKS:
+                raise ValueError(f"{hook} is an invalid hook. valid hooks: {', '.join(LIFECYCLE_HOOKS)}")
+        registered = self._hooks.setdefault(child, {})
+        for hook, function in hooks.items():
+            if function is None:
+                registered.pop(hook, None)
+            else:
+                registered[hook] = function
+        if not registered:
+            del self._hooks[child]
+
+    def page_switched(self, previous: StackChild | None, child: StackChild) -> None:
+        """
+        called by the stack after it shows a different page.
+        """
+        if not (self._hooks or self._jobs or self._nested) and not (
+            (previous is not None and previous.widget is not None and _defines_hooks(previous.widget))
+            or (child.widget is not None and _defines_hooks(child.widget))):
+            # nothing to tell or pause, which is most switches, so only the bookkeeping is kept.
+            self._resumed = child if self.active else None
+            return
+        if previous is not None:
+            self._call(previous, "on_hide")
+            if self._resumed is previous:
+                self._suspend(previous)
+        self._call(child, "on_show")
+        if self.active:
+            self._resume(child)
+
+    def page_hidden(self, child: StackChild) -> None:
+        """
+        called by the stack when the visible page is removed without another one being shown.
+        """
+        self._call(child, "on_hide")
+        if self._resumed is child:
+            self._suspend(child)
+
+    def page_replaced(self, child: StackChild, old_widget) -> None:
+        """
+        called by the stack when the widget of a page is replaced. the old widget is hidden and suspended if
+        it was showing, its jobs are cancelled, and the new one is shown and resumed.
+        """
+        if old_widget is not None and child is self._stack._visible_record:
+            self._call(child, "on_hide", old_widget)
+            if self._resumed is child:
+                self._call(child, "on_suspend", old_widget)
+                self._resumed = None
+        self.forget(child, keep_hooks = True)
+        if child is self._stack._visible_record:
+            self._call(child, "on_show")
+            if self.active:
+                self._resume(child)
+
+    def set_active(self, active: bool) -> None:
+        """
+        called when the page this stack is nested in becomes active or inactive.
+        """
+        if active == self.active:
+            return
+        self.active = active
+        visible = self._stack._visible_record
+        if visible is None:
+            return
+        if active:
+            self._resume(visible)
+        elif self._resumed is visible:
+            self._suspend(visible)
+
+    def forget(self, child: StackChild, keep_hooks: bool = False) -> None:
+        """
+        cancels the jobs of a page that has left the stack or been destroyed, and drops its hooks.
+        """
+        for job_id in list(self._jobs_by_child.get(child, ())):
+            self.cancel(job_id)
+        if not keep_hooks:
+            self._hooks.pop(child, None)
+        if self._resumed is child:
+            self._resumed = None
+
+    def close(self) -> None:
+        """
+        cancels every job, called when the stack is destroyed.
+        """
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def schedule(self, child: StackChild, delay_ms: int, callback: callable, args: tuple, repeat: bool, catch_up: bool) -> str:
+        """
+        schedules a job for a page, paused straight away if the page is not active.
+
+        Returns:
+            str: the id of the job for cancel.
+        """
+        job = _PageJob(child, callback, args, delay_ms, repeat, catch_up)
+        job_id = f"page_job#{next(_job_ids)}"
+        self._jobs[job_id] = job
+        self._jobs_by_child.setdefault(child, set()).add(job_id)
+        job.due = self._stack._monotonic() + delay_ms / 1000
+        if self._resumed is child:
+            self._start(job_id, job)
+        else:
+            job.remaining = delay_ms / 1000
+        return job_id
+
+    def cancel(self, job_id: str) -> None:
+        """
+        cancels a job, does nothing if it has already finished or been cancelled.
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        if job.after_id is not None:
+            self._stack.after_cancel(job.after_id)
+        ids = self._jobs_by_child[job.child]
+        ids.discard(job_id)
+        if not ids:
+            del self._jobs_by_child[job.child]
+
+    def job_counts(self, child: StackChild) -> dict[str, int]:
+        """
+        gets how many jobs of a page are running and how many are paused.
+        """
+        running = paused = 0
+        for job_id in self._jobs_by_child.get(child, ()):
+            if self._jobs[job_id].remaining is None:
+                running += 1
+            else:
+                paused += 1
+        return {"running": running, "paused": paused}
+
+    def children_with_jobs(self) -> list[StackChild]:
+        return list(self._jobs_by_child)
+
+    def _resume(self, child: StackChild) -> None:
+        if self._resumed is child:
+            return
+        self._resumed = child
+        self._call(child, "on_resume")
+        job_ids = self._jobs_by_child.get(child)
+        now = self._stack._monotonic() if job_ids else 0.0
+        for job_id in list(job_ids or ()):
+            job = self._jobs[job_id]
+            if job.catch_up:
+                if job.due <= now: # came due while the page was inactive, fire it once.
+                    job.due = now
+            else:
+                job.due = now + job.remaining
+            self._start(job_id, job)
+        self._set_nested_active(child, True)
+
+    def _suspend(self, child: StackChild) -> None:
+        self._set_nested_active(child, False)
+        self._resumed = None
+        job_ids = self._jobs_by_child.get(child)
+        now = self._stack._monotonic() if job_ids else 0.0
+        for job_id in job_ids or ():
+            job = self._jobs[job_id]
+            if job.after_id is not None:
+                self._stack.after_cancel(job.after_id)
+                job.after_id = None
+            job.remaining = max(job.due - now, 0.0)
+        self._call(child, "on_suspend")
+
+    def _set_nested_active(self, child: StackChild, active: bool) -> None:
+        if not self._nested or child.widget is None: # most stacks have no stacks nested in their pages.
+            return
+        nested = self._nested.get(child.widget)
+        if nested:
+            for stack in list(nested):
+                stack._lifecycle.set_active(active)
+
+    def _start(self, job_id: str, job: _PageJob) -> None:
+        job.remaining = None
+        delay = max(round((job.due - self._stack._monotonic()) * 1000), 0)
+        job.after_id = self._stack.after(delay, self._run, job_id)
+
+    def _run(self, job_id: str) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.after_id = None
+        if job.repeat:
+            # the next run is counted from when this one was due, so a repeating job does not drift.
+            job.due = max(job.due + job.delay_ms / 1000, self._stack._monotonic())
+            self._start(job_id, job)
+        else:
+            self.cancel(job_id)
+        job.callback(*job.args)
+
+    def _call(self, child: StackChild, hook: str, widget = None) -> None:
+        widget = child.widget if widget is None else widget
+        if widget is not None and _defines_hooks(widget):
+            method = getattr(widget, hook, None)
+            if method is not None:
+                method()
+        if self._hooks:
+            function = self._hooks.get(child, {}).get(hook)
+            if function is not None:
+                function()
@@ -0,0 +1,165 @@
+import functools
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+class _PageLoad:
+    """
+    The loader registered for one page and the state of its data.
+    """
+    __slots__ = ("load", "apply", "placeholder", "ttl", "data", "loaded_at", "future", "generation")
+
+    def __init__(self, load: callable, apply: callable, placeholder: Callable | None, ttl: float | None) -> None:
+        self.load = load
+        self.apply = apply
+        self.placeholder = placeholder
+        self.ttl = ttl
+        self.data = None
+        self.loaded_at: float | None = None
+        self.future: Future | None = None
+        self.generation: int = 0
+
+    def is_fresh(self) -> bool:
+        if self.loaded_at is None:
+            return False
+        return self.ttl is None or time.monotonic() - self.loaded_at < self.ttl
+
+
+class PageDataLoader:
+    """
+    Loads the data for Stack pages on an executor when they are about to be shown, so slow fetches and
+    calculations do not block the UI. Results are passed back to the Tk thread through the stack's
+    thread safe command queue and applied to the page only if it is still the visible one, loads for
+    pages the user has already moved away from are cancelled. Each load carries the generation of its
+    page when it started, a load that was already running or finished when it was cancelled is dropped
+    when its result arrives, neither applied nor cached, as are results that arrive once the command
+    queue has stopped, eg after the stack is destroyed. Results are cached per page for ttl seconds.
+
+    Args:
+        stack (Stack): the stack whose pages are loaded.
+        executor (Executor | None, optional): where loads run. Defaults to None, a small thread pool
+            created on first use.
+    """
+    def __init__(self, stack, executor: Executor | None = None) -> None:
+        self._stack = stack
+        self._executor: Executor | None = executor
+        self._owns_executor: bool = False
+        self._loads: dict[StackChild, _PageLoad] = {}
+        self._showing: _PageLoad | None = None
+
+    def set_executor(self, executor: Executor) -> None:
+        """
+        sets the executor loads run on, eg a ProcessPoolExecutor for CPU heavy loads.
+
+        Args:
+            executor (Executor): the executor to use.
+        """
+        self.shutdown()
+        self._executor = executor
+
+    def register(self, child: StackChild, load: callable, apply: callable, placeholder: Callable | None = None,
+                 ttl: float | None = None) -> None:
+        self.unregister(child)
+        self._loads[child] = _PageLoad(load, apply, placeholder, ttl)
+
+    def unregister(self, child: StackChild) -> None:
+        page_load = self._loads.pop(child, None)
+        if page_load is not None:
+            self._cancel(page_load)
+            if page_load is self._showing:
+                self._showing = None
+
+    def invalidate(self, child: StackChild) -> None:
+        page_load = self._loads.get(child)
+        if page_load is not None:
+            page_load.loaded_at = None
+            page_load.data = None
+
+    def page_showing(self, child: StackChild) -> None:
+        """
+        called by the stack as a page is shown. cancels the load of the page being left, then applies
+        fresh cached data or starts a load.
+
+        Args:
+            child (StackChild): the built page being shown.
+        """
+        previous = self._showing
+        page_load = self._loads.get(child)
+        self._showing = page_load
+        if previous is not None and previous is not page_load:
+            self._cancel(previous)
+
+        if page_load is None:
+            return
+        if page_load.is_fresh():
+            page_load.apply(child.widget, page_load.data)
+            return
+        if page_load.future is not None:
+            return # already loading, eg the page was shown again before its load finished.
+
+        if page_load.placeholder is not None:
+            page_load.placeholder(child.widget)
+
+        stack = self._stack
+        if stack._thread_bridge is None:
+            stack.enable_thread_safe_calls()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers = 4, thread_name_prefix = "StackPageLoader")
+            self._owns_executor = True
+
+        page_load.generation += 1
+        generation = page_load.generation
+        future = self._executor.submit(page_load.load)
+        page_load.future = future
+        future.add_done_callback(functools.partial(self._deliver, stack._thread_bridge, child, page_load, generation))
+
+    def shutdown(self) -> None:
+        """
+        cancels every load and shuts down the executor if the loader created it.
+        """
+        for page_load in self._loads.values():
+            self._cancel(page_load)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
+            self._executor = None
+            self._owns_executor = False
+
+    def _cancel(self, page_load: _PageLoad) -> None:
+        if page_load.future is not None:
+            page_load.future.cancel()
+            page_load.future = None
+        page_load.generation += 1 # a load that could not be cancelled is dropped when it finishes.
+
+    def _deliver(self, bridge, child: StackChild, page_load: _PageLoad, generation: int, future: Future) -> None:
+        """
+        private method that passes a finished load to the Tk thread, called on the thread that ran it.
+        """
+        if future.cancelled() or generation != page_load.generation or not bridge.is_running:
+            return
+        try:
+            bridge.call_soon_threadsafe(self._finish, child, page_load, generation, future)
+        except RuntimeError:
+            pass # the command queue stopped since it was checked, the result is not wanted any more.
+
+    def _finish(self, child: StackChild, page_load: _PageLoad, generation: int, future: Future) -> None:
+        if self._loads.get(child) is not page_load:
+            return # the loader was replaced or the page was removed.
+        if page_load.future is future:
+            page_load.future = None
+        if generation != page_load.generation:
+            return # cancelled after it finished, or superseded by a later load.
+
+        error = future.exception()
+        if error is not None:
+            if child.widget is not None:
+                self._stack._trigger_event_callbacks(event = "page_data_failed", widget = child.widget, error = error)
+            return
+
+        page_load.data = future.result()
+        page_load.loaded_at = time.monotonic()
+        if self._showing is page_load and child.widget is not None:
+            page_load.apply(child.widget, page_load.data)
+            self._stack._trigger_event_callbacks(event = "page_data_loaded", widget = child.widget, data = page_load.data)
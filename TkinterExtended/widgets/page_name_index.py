@@ -0,0 +1,142 @@
+import bisect
+from typing import Hashable, Iterable, Iterator
+
+
+GRAM_LENGTH = 3
+
+
+class PageNameIndex:
+    """
+    An index of page titles for filtering a long list of pages as the user types. Titles are compared
+    case insensitively. A prefix search bisects a sorted list of the titles, so it costs O(log n) plus the
+    matches. A substring search looks up every piece of up to three characters of the titles, a query that
+    short is answered by one lookup, a longer one intersects the pages of its three character pieces, rarest
+    first, and checks the few that are left. Pages are added and removed one at a time, nothing is rebuilt.
+    """
+    def __init__(self) -> None:
+        self._sorted_keys: list[str] = [] # the folded titles in order, a title shared by several pages repeats.
+        self._records_by_key: dict[str, list[Hashable]] = {}
+        self._keys: dict[Hashable, str] = {}
+        self._grams: dict[str, set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, record: Hashable) -> bool:
+        return record in self._keys
+
+    def add(self, record: Hashable, title: str) -> None:
+        """
+        adds a page, or updates its title if it is already in the index.
+
+        Args:
+            record (Hashable): the page.
+            title (str): the title it is searched by.
+        """
+        if record in self._keys:
+            self.remove(record)
+        key = title.casefold()
+        self._keys[record] = key
+        bisect.insort(self._sorted_keys, key)
+        self._records_by_key.setdefault(key, []).append(record)
+        for gram in _grams(key):
+            self._grams.setdefault(gram, set()).add(record)
+
+    def remove(self, record: Hashable) -> None:
+        """
+        removes a page, does nothing if it is not in the index.
+        """
+        key = self._keys.pop(record, None)
+        if key is None:
+            return
+        del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+        records = self._records_by_key[key]
+        records.remove(record)
+        if not records:
+            del self._records_by_key[key]
+        for gram in _grams(key):
+            pages = self._grams[gram]
+            pages.discard(record)
+            if not pages:
+                del self._grams[gram]
+
+    def clear(self) -> None:
+        self._sorted_keys.clear()
+        self._records_by_key.clear()
+        self._keys.clear()
+        self._grams.clear()
+
+    def key_of(self, record: Hashable) -> str:
+        """
+        gets the folded title a page is searched by.
+        """
+        return self._keys[record]
+
+    def prefix(self, text: str) -> Iterator[Hashable]:
+        """
+        finds the pages whose title starts with text, in title order.
+        """
+        text = text.casefold()
+        keys = self._sorted_keys
+        position = bisect.bisect_left(keys, text)
+        previous = None
+        while position < len(keys) and keys[position].startswith(text):
+            key = keys[position]
+            if key != previous:
+                yield from self._records_by_key[key]
+                previous = key
+            position += 1
+
+    def substring(self, text: str) -> set[Hashable]:
+        """
+        finds the pages whose title contains text.
+        """
+        text = text.casefold()
+        if not text:
+            return set(self._keys)
+        if len(text) <= GRAM_LENGTH:
+            return set(self._grams.get(text, ()))
+        postings = []
+        for start in range(len(text) - GRAM_LENGTH + 1):
+            pages = self._grams.get(text[start:start + GRAM_LENGTH])
+            if not pages:
+                return set()
+            postings.append(pages)
+        postings.sort(key = len)
+        candidates = postings[0].intersection(*postings[1:])
+        keys = self._keys
+        return {record for record in candidates if text in keys[record]}
+
+    def narrow(self, records: Iterable[Hashable], text: str, mode: str) -> list[Hashable]:
+        """
+        keeps the pages whose title matches a folded query, in the order given. used to narrow the results
+        of a shorter query without the index.
+
+        Args:
+            records (Iterable[Hashable]): the pages to check.
+            text (str): the query, already casefolded.
+            mode (str): "prefix" or "substring".
+        """
+        keys = self._keys
+        if mode == "prefix":
+            return [record for record in records if keys[record].startswith(text)]
+        return [record for record in records if text in keys[record]]
+
+    def matches(self, record: Hashable, text: str, mode: str) -> bool:
+        """
+        checks a single page against a folded query.
+
+        Args:
+            record (Hashable): the page.
+            text (str): the query, already casefolded.
+            mode (str): "prefix" or "substring".
+        """
+        key = self._keys[record]
+        return key.startswith(text) if mode == "prefix" else text in key
+
+
+def _grams(key: str) -> set[str]:
+    """
+    gets every piece of one to GRAM_LENGTH characters of a title.
+    """
+    return {key[start:start + length] for length in range(1, GRAM_LENGTH + 1) for start in range(len(key) - length + 1)}
@@ -0,0 +1,105 @@
+import time
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+class PrefetchScheduler:
+    """
+    Builds the lazy pages of a Stack that are likely to be shown next while the Tk event loop is idle.
+    Work is done in slices that each stop once their time budget is spent, the next slice is scheduled
+    with after so pending events are handled in between. Factories that are generators are stepped one
+    yield at a time, so a single large page can also be spread over several slices.
+
+    Candidates are the neighbours used by show_next and show_previous, then any pages marked as likely.
+    Navigating to another page cancels the pending slice and picks new candidates, a page that was
+    part way through being built keeps its progress.
+
+    Attributes:
+        slice_budget_ms (float): the most time one slice may spend building pages.
+        neighbours (int): how many pages either side of the visible page are prefetched.
+        slice_gap_ms (int): the delay between the end of one slice and the start of the next.
+    """
+    def __init__(self, stack, slice_budget_ms: float = 8, neighbours: int = 1, slice_gap_ms: int = 1) -> None:
+        self.slice_budget_ms: float = slice_budget_ms
+        self.neighbours: int = neighbours
+        self.slice_gap_ms: int = slice_gap_ms
+
+        self._stack = stack
+        self._likely_names: list[str] = []
+        self._candidates: list[StackChild] = []
+        self._job: str | None = None
+
+    def set_likely_pages(self, names: list[str]) -> None:
+        """
+        sets the pages, by name, that the application expects to be shown soon, most likely first.
+
+        Args:
+            names (list[str]): the names of the likely pages.
+        """
+        self._likely_names = list(names)
+        self.reschedule()
+
+    def reschedule(self) -> None:
+        """
+        cancels any pending slice and schedules prefetching of the current candidates.
+        """
+        self.cancel()
+        self._candidates = self._find_candidates()
+        if self._candidates:
+            self._job = self._stack.after_idle(self._run_slice)
+
+    def cancel(self) -> None:
+        """
+        cancels the pending slice, if there is one.
+        """
+        if self._job is not None:
+            self._stack.after_cancel(self._job)
+            self._job = None
+
+    def _find_candidates(self) -> list[StackChild]:
+        stack = self._stack
+        children = stack.children_list
+        candidates = []
+        if stack._visible_record is not None and len(children) > 1:
+            position = stack._get_child_index(stack._visible_record)
+            for offset in range(1, self.neighbours + 1):
+                candidates.append(children[(position + offset) % len(children)])
+                candidates.append(children[(position - offset) % len(children)])
+
+        for name in self._likely_names:
+            child = stack._children_by_name.get(name)
+            if child is not None:
+                candidates.append(child)
+
+        seen = set()
+        unbuilt = []
+        for child in candidates:
+            if child not in seen and not child.is_built:
+                seen.add(child)
+                unbuilt.append(child)
+        return unbuilt
+
+    def _run_slice(self) -> None:
+        self._job = None
+        stack = self._stack
+        deadline = time.perf_counter() + self.slice_budget_ms / 1000
+
+        while self._candidates:
+            child = self._candidates[0]
+            if child.is_built or stack._children_by_name.get(child.name) is not child:
+                self._candidates.pop(0) # already shown or removed since it was picked.
+                continue
+            if child.pending_build is None and stack._page_cache.is_full(child.cost):
+                self._candidates.pop(0) # building it would evict a page the user has seen.
+                continue
+            if stack._step_build(child, deadline):
+                stack._page_cache.record_built(child)
+                self._candidates.pop(0)
+            if time.perf_counter() >= deadline:
+                break
+
+        if self._candidates:
+            self._job = stack.after(self.slice_gap_ms, self._queue_idle_slice)
+
+    def _queue_idle_slice(self) -> None:
+        self._job = self._stack.after_idle(self._run_slice)
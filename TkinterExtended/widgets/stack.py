@@ -1,48 +1,124 @@
+from __future__ import annotations # the annotations name BASECLASS, which is only looked up once a backend is chosen.
+
 from TkinterExtended.exceptions import WidgetAlreadyInStackError, NotInStackError, DuplicateNameError
+from TkinterExtended.backends import Backend, get_backend, get_default_backend
+from TkinterExtended.widgets.stack_child import StackChild
+from TkinterExtended.widgets.order_tree import OrderTree
+from TkinterExtended.widgets.page_cache import PageCache
+from TkinterExtended.widgets.prefetch_scheduler import PrefetchScheduler
+from TkinterExtended.widgets.callback_dispatcher import CallbackDispatcher
+from TkinterExtended.widgets.navigation_history import NavigationHistory
+from TkinterExtended.widgets.transitions import TransitionEngine
+from TkinterExtended.widgets.navigation_coalescer import NavigationCoalescer
+from TkinterExtended.widgets.page_lifecycle import PageLifecycle
+from TkinterExtended.widgets.instrumentation import StackProfiler
+from TkinterExtended.widgets.stack_snapshot import SNAPSHOT_VERSION, SnapshotAutosaver, read_snapshot_file, write_snapshot_file
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterable
 import inspect
-import warnings
-
-try:
-    import customtkinter as ctk
-    STACKBASE = ctk.CTkFrame
-    BASECLASS = ctk.CTkBaseClass
-except ModuleNotFoundError:
-    import tkinter as tk
-    STACKBASE = tk.Frame
-    BASECLASS = tk.Widget
-
-class Stack(STACKBASE):
+import os
+import threading
+import time
+import weakref
+
+if TYPE_CHECKING: # only used in annotations, the modules are imported when the features are first used.
+    from concurrent.futures import Executor, Future
+    from TkinterExtended.widgets.thread_bridge import TkThreadBridge
+    from TkinterExtended.widgets.page_loader import PageDataLoader
+    from TkinterExtended.widgets.page_accounting import PageAccountant
+
+
+class StackMixin:
     """
     A stack wiget based on the c++ gtkmm4 widget of the same name.
     This widgetis ideal for setting up multi page applications.
     The widget automatically takes the colour of the widget beneath it.
 
-    Args:
-        STACKBASE (Frame): A container widget
+    StackMixin holds all of the stack's logic and only uses the widget methods every backend provides, 
+    the Stack class combines it with the container widget of the default backend. The default backend is 
+    only chosen when Stack is first used, see TkinterExtended.set_backend. get_stack_class builds the same 
+    stack for another backend, eg get_stack_class("headless") runs without a display.
 
     Attributes:
-        children_list (array): an array of all the widgets in the stack.
+        children_list (OrderTree): the StackChild records of all the widgets in the stack, in order. it is used 
+            like a list, but inserting, removing, moving and finding the position of a record are O(log n).
         visible_child (Widget): the widget component of the child currently visible.
         children_expandable (bool): if the widgets in the stack can expand.
+        saved_history_length (int): how many shown pages are remembered for undo and redo.
+        stack_history (NavigationHistory): the pages that have been shown, used by undo and redo.
+
+    Lazy pages that are hidden can be destroyed to save memory by setting max_live_pages and/or 
+    page_cost_budget, they are rebuilt from their factory the next time they are shown. A page can keep 
+    lightweight state across this by defining save_page_state() and restore_page_state(state).
+    Lazy pages near the visible one can be built ahead of time while the app is idle with enable_prefetch.
+
+    Only the Tk thread may change the stack directly. After enable_thread_safe_calls, other threads can use 
+    the *_threadsafe methods and asyncio code can await show, the calls are queued and run on the Tk thread.
+    Pages that need slow data can be given a loader with set_page_loader, it runs off the Tk thread each 
+    time the page is shown.
+    The whole state of a stack tree can be saved with snapshot or save_snapshot and brought back with restore 
+    or load_snapshot, enable_autosave keeps a snapshot file up to date.
+    Pages are told when they are shown, hidden, suspended and resumed through on_show, on_hide, on_suspend 
+    and on_resume methods or set_page_hooks, and page_after runs jobs for a page only while it is active.
+    StackSwitcher and StackSidebar are buttons that navigate a stack and follow its events, StackSidebar 
+    for stacks with thousands of pages.
+    Pages can be reordered with move_widget and swap_widgets and swapped for another widget in place with 
+    replace_widget, the order is kept in an OrderTree so this stays O(log n) in large stacks.
+    How pages are swapped is chosen with switch_strategy, see set_switch_strategy. Bursts of switches, eg from a 
+    held key, can be collapsed into one switch per frame with enable_coalescing.
+    What each page costs, its widgets, Tcl commands, images, build and show times and memory, is kept 
+    after enable_accounting, see get_page_weight and get_accounting_report.
     """
-    def __init__(self, *args, children_expandable = False, **kwargs):
-        super().__init__(*args, bg_color = "transparent", fg_color = "transparent", **kwargs)
+    _autosaving_stacks: int = 0 # how many stacks have autosave enabled, changes only look for an autosaver when there is one.
+    _backend: Backend # set by get_stack_class on each concrete Stack class.
+
+    def __init__(self, *args, children_expandable = False, max_live_pages: int | None = None, 
+                 page_cost_budget: int | float | None = None, saved_history_length: int = 5, 
+                 switch_strategy: str = "grid", **kwargs):
+        super().__init__(*args, **{**self._backend.frame_options, **kwargs})
 
-        self.children_list: list[dict] = [] #cant be a set as it needs to be ordered.
+        self.children_list: OrderTree = OrderTree() #cant be a set as it needs to be ordered.
         self.visible_child: BASECLASS = None # type: ignore
-        self.children_expandable: bool = children_expandable
+        self._visible_record: StackChild | None = None
+
+        # hash indexes over children_list so lookups by widget and name do not scan the stack.
+        self._children_by_widget: dict[BASECLASS, StackChild] = {} # type: ignore
+        self._children_by_name: dict[str, StackChild] = {}
 
-        self.saved_history_length: int = 5
-        self.stack_history: list[Stack] = []
+        self._page_cache: PageCache = PageCache(max_live_pages, page_cost_budget)
+        self._prefetcher: PrefetchScheduler | None = None
 
-        self._on_add_widget_callbacks: set[callable] = set() 
-        self._on_remove_widget_callbacks: set[callable] = set()
-        self._on_change_visible_widget_callbacks: set[callable] = set()
+        self._thread_bridge: TkThreadBridge | None = None
+        self._tk_thread: int = threading.get_ident() # widgets are created on the thread that runs Tk.
+        self._page_loader: PageDataLoader | None = None
+
+        self._batch_depth: int = 0
+        self._batched_events: dict[str, list] = {}
+        self.children_expandable: bool = children_expandable
+        if switch_strategy not in SWITCH_STRATEGIES:
+            raise ValueError(f"{switch_strategy} is an invalid switch strategy. valid strategies: {', '.join(SWITCH_STRATEGIES)}")
+        self.switch_strategy: str = switch_strategy
+        self._backdrop: BASECLASS | None = None # type: ignore
+        self._destroying: bool = False
+
+        self.stack_history: NavigationHistory = NavigationHistory(saved_history_length)
+        self._navigating_history: bool = False
+        self._autosaver: SnapshotAutosaver | None = None
+        self._transition: TransitionEngine | None = None
+        self._coalescer: NavigationCoalescer | None = None
+        self._lifecycle: PageLifecycle = PageLifecycle(self)
+        self._profiler: StackProfiler | None = None
+        self._accountant: PageAccountant | None = None
+
+        self._callbacks: CallbackDispatcher = CallbackDispatcher(("add_widget", "remove_widget", "change_visible_widget", 
+                                                                   "page_data_loaded", "page_data_failed", "replace_widget", "reorder"))
 
         if self.children_expandable:
             self.grid_rowconfigure(0, weight=1)
             self.grid_columnconfigure(0, weight=1)
 
+        self._lifecycle.attach_to_enclosing_stack()
+
     def add_widget(self, widget: BASECLASS, name: str | None = None, index: int | None = None, expandable: bool | None = None) -> None: # type: ignore
         """
         Based on the arguments provided it calls the necessary private add method to add a widget to the stack.
@@ -60,37 +136,161 @@ class Stack(STACKBASE):
             DuplicateNameError: Throws an error if the optional identifier being specified is already in use 
                 for this stack.
         """
-        for child in self.children_list:
-            if child["widget"] == widget:
-                raise WidgetAlreadyInStackError(widget)
+        if widget in self._children_by_widget:
+            raise WidgetAlreadyInStackError(widget)
                 
-        if name is not None:
-            for child in self.children_list:
-                if child["name"] == name:
-                    widget = child["widget"]
-                    name = child["name"]
-                    raise DuplicateNameError(widget, name)
+        if name is not None and name in self._children_by_name:
+            raise DuplicateNameError(self._children_by_name[name].widget, name)
 
         if expandable is None:
             expandable = self.children_expandable
-        
-        if expandable:
-            widget.grid(row = 0, column = 0, sticky = "nsew")
-        else:
-            widget.grid(row = 0, column = 0)
 
-        widget.grid_remove()
-
-        if index is not None:
-            self.children_list.insert(index, {"widget": widget, "name": name})
-        else:
-            self.children_list.append({"widget": widget, "name": name})
+        self._hide_widget(widget)
+        self._insert_child(StackChild(widget, name, expandable = expandable), index)
 
         if self.visible_child is None:  
             self.set_visible_child(widget)
+        elif self._prefetcher is not None:
+            self._prefetcher.reschedule() # the new page may be a neighbour of the visible one.
         
         self._trigger_event_callbacks(event = "add_widget", widget = widget)
 
+    def add_lazy_widget(self, factory: callable, name: str, index: int | None = None, expandable: bool | None = None, 
+                        cost: int | float = 1) -> None:
+        """
+        Adds a page to the stack without building it. A placeholder holds the page's place in the stack and 
+        the factory is only called, with the stack as its only argument, the first time the page is shown.
+        The add_widget callbacks are passed the name of the page as the widget.
+
+        Args:
+            factory (callable): called with the stack as the master and returns the widget for the page, 
+                a widget class works as a factory. A generator function may also be used, it yields while 
+                it builds the page and returns the widget, so prefetching can spread the work out.
+            name (str): the identifier for the page, needed to show it before it has been built.
+            index (int | None, optional): An optional index to add the page to a certain point in 
+                the stack. Defaults to None.
+            expandable(bool | None, optional): An optional bool to allow the page to expand or not, 
+                defaults to the children_expandable attribute of the stack.
+            cost (int | float, optional): the weight of the page against page_cost_budget. Defaults to 1.
+
+        Raises:
+            TypeError: if the factory is not callable.
+            DuplicateNameError: Throws an error if the name is already in use for this stack.
+        """
+        if not callable(factory):
+            raise TypeError(f"Object {factory} is not callable")
+
+        if name in self._children_by_name:
+            raise DuplicateNameError(self._children_by_name[name].widget, name)
+
+        if expandable is None:
+            expandable = self.children_expandable
+
+        self._insert_child(StackChild(None, name, factory, expandable, cost), index)
+
+        if self.visible_child is None:
+            self.set_visible_child(name)
+        elif self._prefetcher is not None:
+            self._prefetcher.reschedule() # the new page may be a neighbour of the visible one.
+
+        self._trigger_event_callbacks(event = "add_widget", widget = name)
+
+    def add_widgets(self, widgets: Iterable) -> None:
+        """
+        Adds several widgets to the stack at once. Every widget and name is checked before any are added, 
+        and the add_widget callbacks are called once with the list of added widgets.
+
+        Args:
+            widgets (Iterable): widgets, or tuples of (widget, name) or (widget, name, expandable).
+
+        Raises:
+            WidgetAlreadyInStackError: if a widget is already in the stack or appears twice.
+            DuplicateNameError: if a name is already in use for this stack or appears twice.
+        """
+        entries = []
+        seen_widgets = set()
+        seen_names = {}
+        for item in widgets:
+            if isinstance(item, tuple):
+                widget, name, expandable = item + (None,) * (3 - len(item))
+            else:
+                widget, name, expandable = item, None, None
+
+            if widget in self._children_by_widget or widget in seen_widgets:
+                raise WidgetAlreadyInStackError(widget)
+            seen_widgets.add(widget)
+
+            if name is not None:
+                if name in self._children_by_name:
+                    raise DuplicateNameError(self._children_by_name[name].widget, name)
+                if name in seen_names:
+                    raise DuplicateNameError(seen_names[name], name)
+                seen_names[name] = widget
+
+            entries.append(StackChild(widget, name, expandable = self.children_expandable if expandable is None else expandable))
+
+        with self.batch():
+            for child in entries:
+                self._hide_widget(child.widget)
+                self._insert_child(child)
+
+            if self.visible_child is None and entries:
+                self.set_visible_child(entries[0].widget)
+            elif self._prefetcher is not None and entries:
+                self._prefetcher.reschedule()
+
+            for child in entries:
+                self._trigger_event_callbacks(event = "add_widget", widget = child.widget)
+
+    def remove_widgets(self, widgets_or_identifiers: Iterable) -> None:
+        """
+        Removes several widgets from the stack at once. Every identifier is checked before any are removed, 
+        the visible child is only replaced once and the remove_widget callbacks are called once with the 
+        list of identifiers. a widget given more than once is only removed and reported once.
+
+        Args:
+            widgets_or_identifiers (Iterable): widgets, names or indexes of the widgets to remove. Indexes refer 
+                to positions before any of the widgets are removed.
+
+        Raises:
+            NotInStackError: if a widget or name is not in the stack.
+            IndexError: index out of range.
+        """
+        # a page given more than once, by the same or different identifiers, is removed and reported once, 
+        # by the first identifier given for it.
+        identifiers_by_child = {}
+        for identifier in widgets_or_identifiers:
+            identifiers_by_child.setdefault(self._get_child(identifier), identifier)
+        if not identifiers_by_child:
+            return
+
+        with self.batch():
+            self._discard_children(list(identifiers_by_child), reselect = False)
+            if self.visible_child is None and self.children_list:
+                self.set_visible_child(self._get_child_identifier(self.children_list[0]))
+
+            for identifier in identifiers_by_child.values():
+                self._trigger_event_callbacks(event = "remove_widget", widget = identifier)
+
+    @contextmanager
+    def batch(self):
+        """
+        A context manager that holds back event callbacks until the outermost batch ends. Each event that 
+        happened is then sent once, with the list of affected widgets passed as the widget.
+
+        Example:
+            with stack.batch():
+                for page in pages:
+                    stack.add_widget(page)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batched_events()
+
     def remove_widget(self, widget_or_identifier: BASECLASS | str | int) -> None: # type: ignore
         """
             Based on the arguments provided it calls the necessary private remove method to remove a widget to 
@@ -100,7 +300,7 @@ class Stack(STACKBASE):
         Args:
             widget_or_identifier (BASECLASS | str | int): any identifier used to remove a widget.
         """
-        if isinstance(widget_or_identifier, BASECLASS):
+        if isinstance(widget_or_identifier, self._backend.widget_class):
             self._remove_widget_by_object(widget_or_identifier)
             
         if isinstance(widget_or_identifier, str):
@@ -115,12 +315,24 @@ class Stack(STACKBASE):
         """
             Based on the arguments provided it calls the necessary private set visible method to set a widget 
             to be visible. Valid options are the widget object to be removed, the name of the widget, or the 
-            index of the widget in the stack.
+            index of the widget in the stack. The change_visible_widget callbacks can also take origin and 
+            destination, the widgets visible before and after. With coalescing enabled the widget is shown 
+            at the next flush instead, see enable_coalescing.
 
         Args:
             widget_or_identifier (BASECLASS | str | int): any identifier used to set the widget as visible.
         """
-        if isinstance(widget_or_identifier, BASECLASS):
+        coalescer = self._coalescer
+        if coalescer is not None and self._visible_record is not None:
+            if isinstance(widget_or_identifier, int) and widget_or_identifier == -1: # show_previous wraps around with -1.
+                child = self._get_child(len(self.children_list) - 1)
+            else:
+                child = self._get_child(widget_or_identifier)
+            coalescer.request(child, widget_or_identifier)
+            return
+
+        origin = self.visible_child
+        if isinstance(widget_or_identifier, self._backend.widget_class):
             self._set_visible_child_by_object(widget_or_identifier)
             
         if isinstance(widget_or_identifier, str):
@@ -129,7 +341,8 @@ class Stack(STACKBASE):
         if isinstance(widget_or_identifier, int):
             self._set_visible_child_by_index(widget_or_identifier)
         
-        self._trigger_event_callbacks(event = "change_visible_widget", widget = widget_or_identifier)
+        self._trigger_event_callbacks(event = "change_visible_widget", widget = widget_or_identifier, origin = origin, 
+                                      destination = self.visible_child)
 
     def get_visible_child(self) -> BASECLASS | None: # type: ignore
         """
@@ -159,20 +372,20 @@ class Stack(STACKBASE):
         Returns:
             bool: if the widget is in the stack.
         """
-        for child in self.children_list:
-            if child["widget"] == widget:
-                return True
-        return False
+        return widget in self._children_by_widget
 
-    def get_stack_state(self) -> int:
+    def get_stack_state(self) -> int | None:
         """
         gets the index of the current widget set to be visible.
-        allows user to save the state of the stack.
+        allows user to save the state of the stack. use snapshot to save the full state, including 
+        the order, the history and nested stacks.
 
         Returns:
-            int: the index of the currently visible widget.
+            int | None: the index of the currently visible widget, None if the stack is empty.
         """
-        return self.children_list.index(self.visible_child)
+        if self._visible_record is None:
+            return None
+        return self._get_child_index(self._visible_record)
 
     def load_stack_state(self, index: int) -> None:
         """
@@ -184,20 +397,212 @@ class Stack(STACKBASE):
         """
         self._set_visible_child_by_index(index)
 
+    def snapshot(self) -> dict:
+        """
+        gets the full state of the stack as a JSON serialisable dict: the visible page, the order of the 
+        pages, the history and the state of every page that defines save_page_state. a page that is a 
+        stack is included through its own save_page_state, the stacks nested anywhere else inside a page 
+        are included under "nested". pages are identified by name, or by index if they have no name.
+
+        Returns:
+            dict: the snapshot, for restore or save_snapshot.
+        """
+        keys = [child.name if child.name is not None else index for index, child in enumerate(self.children_list)]
+        key_of = dict(zip(self.children_list, keys))
+
+        pages = []
+        nested = []
+        for child, key in key_of.items():
+            if child.widget is not None:
+                save_page_state = getattr(child.widget, "save_page_state", None)
+                state = save_page_state() if save_page_state is not None else None
+                nested_states = _save_nested_stacks(child.widget)
+            else:
+                state = child.saved_state
+                nested_states = child.saved_nested
+            if state is not None:
+                pages.append([key, state])
+            if nested_states:
+                nested.append([key, nested_states])
+
+        history = []
+        history_position = 0
+        for position, child in enumerate(self.stack_history.entries()):
+            if child in key_of:
+                if position <= self.stack_history.position:
+                    history_position = len(history)
+                history.append(key_of[child])
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "visible": key_of.get(self._visible_record),
+            "order": keys,
+            "history": {"entries": history, "position": history_position},
+            "pages": pages,
+            "nested": nested,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        restores a snapshot from the snapshot method. only the visible page is built, saved state for lazy 
+        pages that are not built is kept until they are first shown. pages in the snapshot that are no 
+        longer in the stack are ignored, pages not in the snapshot keep their order after the others. 
+        if the order changes the reorder event is sent with the pages that moved.
+
+        Args:
+            snapshot (dict): the snapshot to restore.
+        """
+        children = self.children_list
+        def resolve(key: str | int) -> StackChild | None:
+            if isinstance(key, str):
+                return self._children_by_name.get(key)
+            return children[key] if 0 <= key < len(children) else None
+
+        resolved = {}
+        for key in snapshot.get("order", ()):
+            child = resolve(key)
+            if child is not None:
+                resolved[key] = child
+        for key, _ in (*snapshot.get("pages", ()), *snapshot.get("nested", ())):
+            resolved.setdefault(key, resolve(key))
+        history = snapshot.get("history", {})
+        for key in history.get("entries", ()):
+            resolved.setdefault(key, resolve(key))
+        if snapshot.get("visible") is not None:
+            resolved.setdefault(snapshot["visible"], resolve(snapshot["visible"]))
+
+        ordered = list(dict.fromkeys(resolved[key] for key in snapshot.get("order", ()) if resolved.get(key) is not None))
+        placed = set(ordered)
+        order = ordered + [child for child in children if child not in placed]
+        moved = [child for child, previous in zip(order, children) if child is not previous]
+        children.reset(order)
+        if moved:
+            if self._prefetcher is not None:
+                self._prefetcher.reschedule()
+            self._trigger_event_callbacks(event = "reorder", widget = [self._get_child_identifier(child) for child in moved])
+
+        for key, state in snapshot.get("pages", ()):
+            child = resolved.get(key)
+            if child is None:
+                continue
+            if child.widget is not None:
+                restore_page_state = getattr(child.widget, "restore_page_state", None)
+                if restore_page_state is not None:
+                    restore_page_state(state)
+            else:
+                child.saved_state = state
+
+        for key, nested_states in snapshot.get("nested", ()):
+            child = resolved.get(key)
+            if child is None:
+                continue
+            if child.widget is not None:
+                _restore_nested_stacks(child.widget, nested_states)
+            else:
+                child.saved_nested = nested_states
+
+        if self._coalescer is not None:
+            self._coalescer.discard() # a pending burst would switch away from the restored page.
+        visible = resolved.get(snapshot.get("visible"))
+        if visible is not None and visible is not self._visible_record:
+            self._show_from_history(visible)
+
+        entries = [resolved[key] for key in history.get("entries", ()) if resolved.get(key) is not None]
+        if entries:
+            self.stack_history.clear()
+            for child in entries:
+                self.stack_history.push(child)
+            self.stack_history.move_to(history.get("position", len(entries) - 1))
+
+    def save_page_state(self) -> dict:
+        """
+        the page state hook, so a stack nested in another stack's page is saved with it.
+
+        Returns:
+            dict: the snapshot of this stack.
+        """
+        return self.snapshot()
+
+    def restore_page_state(self, state: dict) -> None:
+        """
+        the page state hook, so a stack nested in another stack's page is restored with it.
+
+        Args:
+            state (dict): a snapshot of this stack.
+        """
+        self.restore(state)
+
+    def save_snapshot(self, path: str | os.PathLike) -> None:
+        """
+        writes the snapshot of the stack to a JSON file, replacing any existing file atomically.
+
+        Args:
+            path (str | os.PathLike): the file to write.
+        """
+        write_snapshot_file(self.snapshot(), path)
+
+    def load_snapshot(self, path: str | os.PathLike) -> bool:
+        """
+        restores the stack from a file written by save_snapshot or autosave.
+
+        Args:
+            path (str | os.PathLike): the file to read.
+
+        Raises:
+            ValueError: if the file is from an unsupported snapshot version.
+
+        Returns:
+            bool: if a snapshot was restored, False if the file does not exist.
+        """
+        snapshot = read_snapshot_file(path)
+        if snapshot is None:
+            return False
+        self.restore(snapshot)
+        return True
+
+    def enable_autosave(self, path: str | os.PathLike, delay_ms: int = 500) -> None:
+        """
+        saves the snapshot of the stack to a file shortly after any change to it, or to a stack nested in it.
+
+        Args:
+            path (str | os.PathLike): the file to write.
+            delay_ms (int, optional): how long after a change the file is written, changes in between are 
+                saved together. Defaults to 500.
+        """
+        if self._autosaver is None:
+            StackMixin._autosaving_stacks += 1
+        else:
+            self._autosaver.cancel()
+        self._autosaver = SnapshotAutosaver(self, path, delay_ms)
+
+    def disable_autosave(self, flush: bool = True) -> None:
+        """
+        stops saving the stack automatically.
+
+        Args:
+            flush (bool, optional): if a pending change should be written first. Defaults to True.
+        """
+        if self._autosaver is not None:
+            if flush and self._autosaver._job is not None:
+                self._autosaver.flush()
+            self._autosaver.cancel()
+            self._autosaver = None
+            StackMixin._autosaving_stacks -= 1
+
     def clear_stack(self) -> None:
         """
-        removes all widgets from the stack
+        removes all widgets from the stack, sending a single remove_widget event.
         """
-        for child in self.children_list.copy():
-            self.remove_widget(child["widget"])
+        self.remove_widgets([self._get_child_identifier(child) for child in self.children_list])
     
     def show_next(self) -> None:
         """
-        Shows the next widget in the stack by index
+        Shows the next widget in the stack by index, counting from the pending page when coalescing.
         """
-        for child in self.children_list:
-            if child["widget"] == self.visible_child:
-                current_index = self.children_list.index(child)
+        current = self._get_navigation_target()
+        if current is None:
+            return
+        current_index = self._get_child_index(current)
         if current_index < len(self.children_list) -1:
             self.set_visible_child(current_index+1)
         else:
@@ -205,272 +610,1538 @@ class Stack(STACKBASE):
 
     def show_previous(self) -> None:
         """
-        Shows the previous widget in the stack by index.
+        Shows the previous widget in the stack by index, counting from the pending page when coalescing.
         """
-        for child in self.children_list:
-            if child["widget"] == self.visible_child:
-                current_index = self.children_list.index(child)
+        current = self._get_navigation_target()
+        if current is None:
+            return
+        current_index = self._get_child_index(current)
         if current_index > 0:
             self.set_visible_child(current_index-1)
         else:
             self.set_visible_child(-1)
 
-    def _remove_widget_by_object(self, widget: BASECLASS): # type: ignore
+    def set_page_cache_limits(self, max_live_pages: int | None = None, page_cost_budget: int | float | None = None) -> None:
         """
-        the private method for removing a widget by its object.
+        sets how many lazy pages may stay built at once, and/or the total cost they may add up to. 
+        hidden pages over the limits are evicted straight away, least recently shown first.
 
         Args:
-            widget (BASECLASS): the object to remove.
+            max_live_pages (int | None, optional): the most lazy pages that may be built. Defaults to None, no limit.
+            page_cost_budget (int | float | None, optional): the most total cost the built lazy pages may have. 
+                Defaults to None, no limit.
+        """
+        self._page_cache.max_live_pages = max_live_pages
+        self._page_cache.cost_budget = page_cost_budget
+        self._evict_hidden_pages()
 
-        Raises:
-            NotInStackError: the widget is not in the stack.
+    def get_page_cache_stats(self) -> dict:
         """
-        if any(child["widget"] == widget for child in self.children_list):
-            for child in self.children_list:
-                if child["widget"] == widget:
-                    widget = child["widget"]
-                    widget.grid_forget()
-                    self.children_list.remove(child)
+        gets the hit, miss and eviction counters of the lazy page cache, for tuning its limits.
 
-            if widget == self.visible_child:
-                if self.children_list:
-                    self.set_visible_child(self.children_list[0]) 
-                else:
-                    self.visible_child = None
+        Returns:
+            dict: the counters and current usage of the cache.
+        """
+        return self._page_cache.get_stats()
+
+    def enable_prefetch(self, slice_budget_ms: float = 8, neighbours: int = 1) -> None:
+        """
+        starts building the lazy pages either side of the visible page, and any pages set with 
+        set_likely_pages, while the event loop is idle. pages are not prefetched if that would evict a page.
+
+        Args:
+            slice_budget_ms (float, optional): the most time spent building per idle slice. Defaults to 8.
+            neighbours (int, optional): how many pages either side of the visible page to prefetch. Defaults to 1.
+        """
+        if self._prefetcher is None:
+            self._prefetcher = PrefetchScheduler(self, slice_budget_ms, neighbours)
         else:
-            raise NotInStackError(widget)
+            self._prefetcher.slice_budget_ms = slice_budget_ms
+            self._prefetcher.neighbours = neighbours
+        self._prefetcher.reschedule()
 
-    def _remove_widget_by_name(self, name: str):
+    def disable_prefetch(self) -> None:
         """
-        the private method for removing a widget by its name
+        stops prefetching and cancels any pending work.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher = None
+
+    def set_likely_pages(self, names: list[str]) -> None:
+        """
+        sets the lazy pages, by name, that should be prefetched after the neighbours of the visible page.
 
         Args:
-            name (str): the name of the widget given to the stack
+            names (list[str]): the names of the pages, most likely first.
 
         Raises:
-            NotInStackError: the widget is not in the stack.
+            RuntimeError: if prefetching is not enabled.
         """
-        if any(child["name"] == name for child in self.children_list):
-            for child in self.children_list:
-                if child["name"] == name:
-                    widget = child["widget"]
-                    widget.grid_forget()
-                    self.children_list.remove(child)
-
-                    if widget == self.visible_child:
-                        if self.children_list:
-                            self.set_visible_child(self.children_list[0]) 
-                        else:
-                            self.visible_child = None
-        else:
-            raise NotInStackError(name)
+        if self._prefetcher is None:
+            raise RuntimeError("Prefetching is not enabled, call enable_prefetch first")
+        self._prefetcher.set_likely_pages(names)
 
-    def _remove_widget_by_index(self, index: int):
+    def enable_thread_safe_calls(self, min_poll_ms: int = 1, max_poll_ms: int = 50) -> None:
         """
-        the private method for removing a widget by its index
+        starts the command queue that lets other threads change the stack. must be called on the Tk thread.
 
         Args:
-            index (int): the index of the widget to remove.
+            min_poll_ms (int, optional): how often the queue is checked while commands are arriving. Defaults to 1.
+            max_poll_ms (int, optional): how often the queue is checked at most once it has been empty for a 
+                while. Defaults to 50.
+        """
+        if self._thread_bridge is None:
+            from TkinterExtended.widgets.thread_bridge import TkThreadBridge # imports concurrent.futures, only when used.
+            self._thread_bridge = TkThreadBridge(self, min_poll_ms, max_poll_ms)
+        else:
+            self._thread_bridge.min_poll_ms = min_poll_ms
+            self._thread_bridge.max_poll_ms = max_poll_ms
+        self._thread_bridge.start()
 
-        Raises:
-            IndexError: index out of range.
+    def disable_thread_safe_calls(self) -> None:
         """
-        if index < 0 or index > len(self.children_list)-1:
-            raise IndexError(f"Index {index} is out of range.")
-    
-        child = self.children_list[index]
-        widget = child["widget"]
-        self.children_list.remove(child)
+        stops the command queue, any commands still waiting are cancelled.
+        """
+        if self._thread_bridge is not None:
+            self._thread_bridge.stop()
+            self._thread_bridge = None
 
-        if widget == self.visible_child:
-            if self.children_list:
-                self.set_visible_child(self.children_list[0]) 
-            else:
-                self.visible_child = None
+    def get_thread_call_stats(self) -> dict:
+        """
+        gets the latency and throughput of the commands run through the command queue.
 
-    def _set_visible_child_by_object(self, widget: BASECLASS): #type: ignore
+        Raises:
+            RuntimeError: if thread safe calls are not enabled.
+
+        Returns:
+            dict: the command queue statistics.
         """
-        the private method for making a widget visible by its object.
+        return self._get_thread_bridge().get_stats()
+
+    def call_soon_threadsafe(self, callback: callable, *args, **kwargs) -> Future:
+        """
+        runs a function on the Tk thread as soon as possible, safe to call from any thread.
 
         Args:
-            widget (BASECLASS): the object to remove.
+            callback (callable): the function to call.
+            *args: positional arguments for the function.
+            **kwargs: keyword arguments for the function.
 
         Raises:
-            NotInStackError: The widget is not in the stack.
+            RuntimeError: if thread safe calls are not enabled.
+
+        Returns:
+            Future: resolves to the return value of the function.
         """
-        if any(child["widget"] == widget for child in self.children_list):
-            if self.visible_child:
-                self.visible_child.grid_remove()
+        return self._get_thread_bridge().call_soon_threadsafe(callback, *args, **kwargs)
 
-            widget.grid()
-            self.visible_child = widget
-        else:
-            raise NotInStackError(widget)
+    def set_visible_child_threadsafe(self, widget_or_identifier: BASECLASS | str | int) -> Future: # type: ignore
+        """
+        a thread safe version of set_visible_child.
 
-    def _set_visible_child_by_name(self, name: str):
+        Args:
+            widget_or_identifier (BASECLASS | str | int): any identifier used to set the widget as visible.
+
+        Returns:
+            Future: resolves once the widget is visible, or to the error raised.
         """
-        the private method for making a widget visible by its name
+        return self.call_soon_threadsafe(self.set_visible_child, widget_or_identifier)
+
+    def add_widget_threadsafe(self, widget: BASECLASS, name: str | None = None, index: int | None = None, expandable: bool | None = None) -> Future: # type: ignore
+        """
+        a thread safe version of add_widget.
+
+        Returns:
+            Future: resolves once the widget is added, or to the error raised.
+        """
+        return self.call_soon_threadsafe(self.add_widget, widget, name, index, expandable)
+
+    def remove_widget_threadsafe(self, widget_or_identifier: BASECLASS | str | int) -> Future: # type: ignore
+        """
+        a thread safe version of remove_widget.
+
+        Returns:
+            Future: resolves once the widget is removed, or to the error raised.
+        """
+        return self.call_soon_threadsafe(self.remove_widget, widget_or_identifier)
+
+    async def run_on_tk(self, callback: callable, *args, **kwargs):
+        """
+        awaitable that runs a function on the Tk thread. when awaited on the Tk thread, eg by an asyncio loop 
+        that drives Tk, the function is called straight away.
 
         Args:
-            name (str): the name of the widget given to the stack
+            callback (callable): the function to call.
+            *args: positional arguments for the function.
+            **kwargs: keyword arguments for the function.
 
         Raises:
-            NotInStackError: The widget is not in the stack.
+            RuntimeError: if it is awaited on another thread and thread safe calls are not enabled.
+
+        Returns:
+            the return value of the function.
         """
-        if any(child["name"] == name for child in self.children_list):
-            for child in self.children_list:
-                if child["name"] == name:
-                    if self.visible_child:
-                        self.visible_child.grid_remove()  # Hide the current visible widget
+        import asyncio # only imported when it is used, it is one of the slowest modules to import.
 
-                    widget = child["widget"]
-                    widget.grid()  # Show the widget associated with the name
-                    self.visible_child = widget
-        else:
-            raise NotInStackError(widget)
+        if threading.get_ident() == self._tk_thread:
+            return callback(*args, **kwargs)
+        future = self._get_thread_bridge().call_soon_threadsafe(callback, *args, **kwargs)
+        return await asyncio.wrap_future(future)
 
-    def _set_visible_child_by_index(self, index: int):
+    async def show(self, widget_or_identifier: BASECLASS | str | int) -> None: # type: ignore
         """
-        the private method for making a widget visible by its index.
+        awaitable version of set_visible_child, eg await stack.show("page").
 
         Args:
-            index (int): the index of the widget in the stack
+            widget_or_identifier (BASECLASS | str | int): any identifier used to set the widget as visible.
+        """
+        await self.run_on_tk(self.set_visible_child, widget_or_identifier)
+
+    def set_page_loader(self, widget_or_identifier: BASECLASS | str | int, load: callable, apply: callable, # type: ignore
+                        placeholder: Callable | None = None, ttl: float | None = None) -> None:
+        """
+        sets a function that loads the data for a page off the Tk thread whenever the page is shown. 
+        while it runs the page shows its placeholder, when it finishes the data is applied on the Tk thread 
+        if the page is still visible, and the page_data_loaded event is sent. if the load raises, the 
+        page_data_failed event is sent with the error. moving to another page cancels the load.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page, use the name for lazy pages.
+            load (callable): called with no arguments on the executor, returns the data. must be picklable 
+                when a process pool is used, eg a functools.partial of a module level function.
+            apply (callable): called on the Tk thread as apply(widget, data).
+            placeholder (callable | None, optional): called on the Tk thread as placeholder(widget) when a 
+                load starts. Defaults to None.
+            ttl (float | None, optional): how many seconds loaded data is reused for, showing the page again 
+                within this time applies the cached data without loading. Defaults to None, forever.
 
         Raises:
+            NotInStackError: the widget or name is not in the stack.
             IndexError: index out of range.
         """
-        if (index < 0 or index > len(self.children_list)-1) and index != -1:
-            raise IndexError(f"Index {index} is out of range.")
-        
-        child = self.children_list[index]
+        child = self._get_child(widget_or_identifier)
+        if self._page_loader is None:
+            from TkinterExtended.widgets.page_loader import PageDataLoader # imports concurrent.futures, only when used.
+            self._page_loader = PageDataLoader(self)
+        self._page_loader.register(child, load, apply, placeholder, ttl)
+        if child is self._visible_record:
+            self._page_loader.page_showing(child)
+
+    def remove_page_loader(self, widget_or_identifier: BASECLASS | str | int) -> None: # type: ignore
+        """
+        removes the loader of a page, cancelling its load.
 
-        if self.visible_child:
-            self.visible_child.grid_remove()  # Hide the current visible widget
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+        """
+        if self._page_loader is not None:
+            self._page_loader.unregister(self._get_child(widget_or_identifier))
+
+    def invalidate_page_data(self, widget_or_identifier: BASECLASS | str | int) -> None: # type: ignore
+        """
+        drops the cached data of a page, so it is loaded again the next time it is shown.
 
-        widget = child["widget"]
-        widget.grid()  # Show the widget associated with the name
-        self.visible_child = widget
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+        """
+        if self._page_loader is not None:
+            self._page_loader.invalidate(self._get_child(widget_or_identifier))
 
-    def add_callback_function(self, event: str, callback_function: callable) -> None: 
+    def set_page_loader_executor(self, executor: Executor) -> None:
         """
-        Adds a callback function for the specified event. All callback function will automatically be passed
-        the event and widget effected in the key word arguments **kwargs. if this is not present in your funtion
-        these arguments will be discarded using a try-catch.
+        sets the executor page loads run on. by default a small thread pool is used, a 
+        ProcessPoolExecutor suits loads that are CPU heavy.
 
         Args:
-            event (str): events are, add_widget, remove_widget and change_visible_widget.
-            callback_function (callable): the callback function to be added.
+            executor (Executor): the executor to use.
+        """
+        if self._page_loader is None:
+            from TkinterExtended.widgets.page_loader import PageDataLoader # imports concurrent.futures, only when used.
+            self._page_loader = PageDataLoader(self)
+        self._page_loader.set_executor(executor)
 
-        Raises:
-            TypeError: an error if the callback_function passed is not callable.
-            ValueError: if the event is invalid.
+    def set_transition(self, mode: str = "slide_left", duration_ms: int = 250, fps: int = 60) -> None:
         """
-        if callable(callback_function): 
+        sets the animation used when the visible page changes, like the transitions of Gtk.Stack. 
+        switching again while a transition runs redirects it to the new page.
 
-            signature = inspect.signature(callback_function)
-            parameters = signature.parameters
+        Args:
+            mode (str, optional): none, crossfade, slide_left, slide_right, slide_up, slide_down, cover_left, 
+                cover_right, cover_up or cover_down. crossfade cuts half way through, as Tk widgets cannot be 
+                partly transparent. Defaults to "slide_left".
+            duration_ms (int, optional): how long each transition lasts. Defaults to 250.
+            fps (int, optional): the frame rate to aim for, frames are skipped if the app cannot keep up. 
+                Defaults to 60.
 
-            if ("event" not in parameters or "widget" not in parameters) and "**kwargs" not in parameters:
-                warnings.warn(f"Warning: The callback function {callback_function.__name__} does not accept 'event' "
-                                "and/or 'widget' parameters. These will not be passed to the function.")
-        
-            match event:
-                case "add_widget":
-                    self._on_add_widget_callbacks.add(callback_function)
-                case "remove_widget":
-                    self._on_remove_widget_callbacks.add(callback_function)
-                case "change_visible_widget":
-                    self._on_change_visible_widget_callbacks.add(callback_function)
-                case _:
-                    raise ValueError(f"{event} is an invalid event. valid events: add_widget, remove_widget, and change_visible_widget")
+        Raises:
+            ValueError: if the mode is invalid.
+        """
+        if mode != "none":
+            transition = TransitionEngine(self, mode, duration_ms, fps)
         else:
-            raise TypeError(f"Object {callback_function} is not callable")
-        
-    def remove_callback_function(self, event: str, callback_function: callable) -> None: 
+            transition = None
+        if self._transition is not None:
+            self._transition.finish()
+        self._transition = transition
+
+    def get_transition_stats(self) -> dict | None:
         """
-        removes a callback function for the specified event.
+        gets the frame rate achieved by the last transition and how many frames were skipped.
+
+        Returns:
+            dict | None: the transition statistics, None if transitions are off.
+        """
+        return self._transition.get_stats() if self._transition is not None else None
+
+    def set_page_hooks(self, widget_or_identifier: BASECLASS | str | int, **hooks: Callable | None) -> None: # type: ignore
+        """
+        registers functions called when a page is shown, hidden, suspended or resumed, as well as any 
+        on_show, on_hide, on_suspend and on_resume methods the page widget defines. hooks are called with 
+        no arguments. on_show and on_hide follow what this stack shows, on_suspend and on_resume follow 
+        whether the page is active, visible in this stack and in every stack this one is nested in. 
+        hooks of a lazy page are kept when it is evicted and rebuilt.
+
+        Example:
+            stack.set_page_hooks("chart", on_suspend = chart.stop_animation, on_resume = chart.start_animation)
 
         Args:
-            event (str): events are, add_widget, remove_widget and change_visible_widget.
-            callback_function (callable): the callback function to be removed.
+            widget_or_identifier (BASECLASS | str | int): the page, use the name for lazy pages.
+            **hooks (Callable | None): the functions by hook name, None removes a hook.
 
         Raises:
-            TypeError: an error if the callback_function passed is not callable.
-            ValueError: if the event is invalid.
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+            ValueError: if a hook name is invalid.
         """
-        if callable(callback_function): 
-            match event:
-                case "add_widget":
-                    self._on_add_widget_callbacks.discard(callback_function)
-                case "remove_widget":
-                    self._on_remove_widget_callbacks.discard(callback_function)
-                case "change_visible_widget":
-                    self._on_change_visible_widget_callbacks.discard(callback_function)
-                case _:
-                    raise ValueError(f"{event} is an invalid event. valid events: add_widget, remove_widget, and change_visible_widget")
-        else:
-            raise TypeError(f"Object {callback_function} is not callable")
-    
-    def get_callback_functions(self, event: str) -> set[callable]:
+        self._lifecycle.set_hooks(self._get_child(widget_or_identifier), hooks)
+
+    def page_after(self, widget_or_identifier: BASECLASS | str | int, ms: int, callback: callable, *args, # type: ignore
+                   repeat: bool = False, catch_up: bool = False) -> str:
         """
-        gets the specified set of callback functions relating to the event.
+        like after, but the job belongs to a page and only runs while the page is active. while the page is 
+        suspended its countdown stops and carries on when it is resumed. with catch_up the countdown keeps 
+        going instead, and a job that came due while the page was suspended fires once when it is resumed. 
+        jobs are cancelled when their page is removed, replaced, destroyed or evicted.
 
         Args:
-            event (str): events are, add_widget, remove_widget and change_visible_widget.
+            widget_or_identifier (BASECLASS | str | int): the page, use the name for lazy pages.
+            ms (int): the delay, and the interval of a repeating job, in milliseconds.
+            callback (callable): the function to call.
+            *args: positional arguments for the function.
+            repeat (bool, optional): run the job every ms until it is cancelled. Defaults to False.
+            catch_up (bool, optional): keep counting while the page is suspended. Defaults to False.
 
         Raises:
-            ValueError: if the event is invalid.
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
 
         Returns:
-            set[callable]: the set of callback functions.
+            str: the id of the job, for page_after_cancel.
         """
-        match event:
-            case "add_widget":
-                return self._on_add_widget_callbacks
-            case "remove_widget":
-                return self._on_remove_widget_callbacks
-            case "change_visible_widget":
-                return self._on_change_visible_widget_callbacks
-            case _:
-                raise ValueError(f"{event} is an invalid event. valid events: add_widget, remove_widget, and change_visible_widget")
-        
-    def _trigger_event_callbacks(self, event: str, **kwargs):
+        return self._lifecycle.schedule(self._get_child(widget_or_identifier), ms, callback, args, repeat, catch_up)
+
+    def page_after_cancel(self, job_id: str) -> None:
         """
-        private method that calls the callback functions when an event happens.
+        cancels a job from page_after, does nothing if it has already run or been cancelled.
 
         Args:
-            event (str): events are, add_widget, remove_widget and change_visible_widget.
-            **kwargs: Keyword arguments passed to the callback fucntions.
+            job_id (str): the id page_after returned.
+        """
+        self._lifecycle.cancel(job_id)
+
+    def get_page_job_counts(self, widget_or_identifier: BASECLASS | str | int | None = None) -> dict: # type: ignore
+        """
+        gets how many page_after jobs are running and how many are paused, for one page or every page 
+        that has jobs.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int | None, optional): the page. Defaults to None, 
+                every page with jobs.
 
         Raises:
-            TypeError: if the users function doesnt accept given keyword arguments it will recall it 
-            without them.
-
-        """
-        match event:
-            case "add_widget":
-                for callback in set(self._on_add_widget_callbacks): #copying the set prevents modification while executing.
-                    try:
-                        callback(**kwargs)
-                    except TypeError:
-                        callback()
-            case "remove_widget":
-                for callback in set(self._on_remove_widget_callbacks):
-                    try:
-                        callback(**kwargs)
-                    except TypeError:
-                        callback()
-            case "change_visible_widget":
-                for callback in set(self._on_change_visible_widget_callbacks):
-                    try:
-                        callback(**kwargs)
-                    except TypeError:
-                        callback()
-
-    def replace_widget(self, widget_to_replace, new_widget) -> None:
-        pass
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
 
-    def undo(self) -> None:
-        pass
+        Returns:
+            dict: {"running": int, "paused": int} for a page, otherwise those counts keyed by the widget, 
+                or the name of pages that are not built.
+        """
+        if widget_or_identifier is not None:
+            return self._lifecycle.job_counts(self._get_child(widget_or_identifier))
+        return {self._get_child_identifier(child): self._lifecycle.job_counts(child) 
+                for child in self._lifecycle.children_with_jobs()}
+
+    def enable_coalescing(self, frame_ms: int | None = None) -> None:
+        """
+        collapses bursts of set_visible_child, show_next and show_previous calls into one switch. each call 
+        only sets the page to show, the last one is shown at the end of the burst and change_visible_widget 
+        is sent once, with origin and destination the widgets visible before and after the burst and 
+        requests the number of calls it replaced. pages passed through are never built or shown. while a 
+        burst is pending visible_child is still the page on screen, show_next and show_previous count from 
+        the pending page. switching from an empty stack, and navigation through undo, redo, a router or 
+        restore, happen straight away, the latter drop the pending page.
+
+        Args:
+            frame_ms (int | None, optional): how long after the first call of a burst it is shown, eg 16 to 
+                switch at most once per 60Hz frame. Defaults to None, show it once the event loop is idle.
+        """
+        if self._coalescer is None:
+            self._coalescer = NavigationCoalescer(self, frame_ms)
+        else:
+            self._coalescer.frame_ms = frame_ms
+
+    def disable_coalescing(self, flush: bool = True) -> None:
+        """
+        stops coalescing switches.
 
-   
\ No newline at end of file
+        Args:
+            flush (bool, optional): if the pending page should be shown first, otherwise it is dropped. 
+                Defaults to True.
+        """
+        if self._coalescer is not None:
+            coalescer, self._coalescer = self._coalescer, None
+            if flush:
+                coalescer.flush()
+            coalescer.cancel()
+
+    def flush_navigation(self) -> None:
+        """
+        shows the pending page of a coalesced burst straight away, eg before reading visible_child.
+        """
+        if self._coalescer is not None:
+            self._coalescer.flush()
+
+    def get_coalescing_stats(self) -> dict | None:
+        """
+        gets how many bursts have been shown and how many switches coalescing saved.
+
+        Returns:
+            dict | None: the coalescing statistics, None if coalescing is off.
+        """
+        return self._coalescer.get_stats() if self._coalescer is not None else None
+
+    def _get_navigation_target(self) -> StackChild | None:
+        """
+        private method that gets the page navigation is relative to, the pending page of a coalesced burst 
+        if there is one, otherwise the visible page.
+
+        Returns:
+            StackChild | None: the record, None if the stack shows nothing.
+        """
+        if self._coalescer is not None:
+            target = self._coalescer.target
+            if target is not None and self._contains_child(target):
+                return target
+        return self._visible_record
+
+    def enable_instrumentation(self, stall_threshold_ms: float = 50, trace_capacity: int = 10_000) -> None:
+        """
+        starts timing the stack's operations, page construction, gridding and every event callback. 
+        when instrumentation is off the stack runs without any timing code.
+
+        Args:
+            stall_threshold_ms (float, optional): operations, or waits for the event loop to go idle after 
+                a switch, at least this long are recorded as stalls with the slowest callback behind them. 
+                Defaults to 50.
+            trace_capacity (int, optional): how many trace events and stalls are kept. Defaults to 10_000.
+        """
+        self.disable_instrumentation()
+        self._profiler = StackProfiler(self, stall_threshold_ms, trace_capacity)
+        self._profiler.install()
+
+    def disable_instrumentation(self) -> None:
+        """
+        stops timing the stack, discarding what was recorded.
+        """
+        if self._profiler is not None:
+            self._profiler.uninstall()
+            self._profiler = None
+
+    def get_instrumentation_stats(self) -> dict:
+        """
+        gets the timings recorded since instrumentation was enabled.
+
+        Raises:
+            RuntimeError: if instrumentation is not enabled.
+
+        Returns:
+            dict: per operation and per callback histograms, idle latency after switches and recent stalls.
+        """
+        return self._get_profiler().get_stats()
+
+    def export_trace(self, path: str | os.PathLike | None = None) -> dict:
+        """
+        exports the recorded timings in the Chrome trace event format, for chrome://tracing or Perfetto.
+
+        Args:
+            path (str | os.PathLike | None, optional): a file to write the trace to. Defaults to None.
+
+        Raises:
+            RuntimeError: if instrumentation is not enabled.
+
+        Returns:
+            dict: the trace.
+        """
+        return self._get_profiler().export_chrome_trace(path)
+
+    def enable_accounting(self, trace_memory: bool = False) -> None:
+        """
+        starts keeping the weight of every page, what it costs to keep built and to show. pages are only 
+        counted when their weight is asked for and again after they change, and stacks nested in the pages 
+        are accounted for too. when accounting is off the stack does no counting or timing.
+
+        Args:
+            trace_memory (bool, optional): measure the Python memory each page's build allocates with 
+                tracemalloc, which is started if it is not running. it slows the whole program down while it 
+                traces. Defaults to False.
+        """
+        self.disable_accounting()
+        from TkinterExtended.widgets.page_accounting import PageAccountant # only imported when it is used.
+        self._accountant = PageAccountant(self, trace_memory)
+
+    def disable_accounting(self) -> None:
+        """
+        stops keeping page weights, discarding them, and stops accounting on the nested stacks it was 
+        started on.
+        """
+        if self._accountant is not None:
+            self._accountant.close()
+            self._accountant = None
+
+    def get_page_weight(self, widget_or_identifier: BASECLASS | str | int) -> dict: # type: ignore
+        """
+        gets what one page costs. only the widgets built since it was last counted are walked.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+
+        Raises:
+            RuntimeError: if accounting is not enabled.
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+
+        Returns:
+            dict: the page's name or index, if it is built, its descendant widgets, Tcl commands and images, 
+                including those of stacks nested in it, how many times it was built and the last build's time 
+                and memory, how many times it was shown and the average show time, and its cost.
+        """
+        accountant = self._get_accountant()
+        child = self._get_child(widget_or_identifier)
+        return accountant.page_report(child, self.children_list.index(child))
+
+    def get_accounting_report(self, include_pages: bool = True) -> dict:
+        """
+        gets the weight of the whole stack tree, eg to log which pages to make lazy or evict sooner.
+
+        Args:
+            include_pages (bool, optional): include the weight of every page, not just the totals. 
+                Defaults to True.
+
+        Raises:
+            RuntimeError: if accounting is not enabled.
+
+        Returns:
+            dict: "totals" of the stack and the stacks nested in it, "pages" in stack order, and "nested" 
+                with the report of each stack nested in a page.
+        """
+        return self._get_accountant().report(include_pages)
+
+    def invalidate_page_weight(self, widget_or_identifier: BASECLASS | str | int | None = None) -> None: # type: ignore
+        """
+        marks a page to be counted again, for when the app adds or removes widgets in a page itself. the 
+        stack already does this when it builds, evicts or replaces a page.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int | None, optional): the page. Defaults to None, every page.
+
+        Raises:
+            RuntimeError: if accounting is not enabled.
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+        """
+        accountant = self._get_accountant()
+        children = self.children_list if widget_or_identifier is None else (self._get_child(widget_or_identifier),)
+        for child in children:
+            accountant.invalidate(child)
+
+    def _get_accountant(self) -> PageAccountant:
+        """
+        private method that gets the active page accountant.
+
+        Raises:
+            RuntimeError: if accounting is not enabled.
+        """
+        if self._accountant is None:
+            raise RuntimeError("Accounting is not enabled, call enable_accounting first")
+        return self._accountant
+
+    def _get_profiler(self) -> StackProfiler:
+        """
+        private method that gets the active profiler.
+
+        Raises:
+            RuntimeError: if instrumentation is not enabled.
+        """
+        if self._profiler is None:
+            raise RuntimeError("Instrumentation is not enabled, call enable_instrumentation first")
+        return self._profiler
+
+    def _monotonic(self) -> float:
+        """
+        private method that gets the time of the event loop the stack runs on in seconds, the real clock 
+        except on a simulated loop.
+        """
+        return self._backend.monotonic(self)
+
+    def _get_thread_bridge(self) -> TkThreadBridge:
+        """
+        private method that gets the running command queue.
+
+        Raises:
+            RuntimeError: if thread safe calls are not enabled.
+        """
+        if self._thread_bridge is None:
+            raise RuntimeError("Thread safe calls are not enabled, call enable_thread_safe_calls on the Tk thread first")
+        return self._thread_bridge
+
+    def _insert_child(self, child: StackChild, index: int | None = None) -> None:
+        """
+        private method that adds a child record to the ordered list and to the lookup indexes.
+        follows the same index rules as list.insert.
+
+        Args:
+            child (StackChild): the record to insert.
+            index (int | None, optional): the position to insert at, defaults to the end of the stack.
+        """
+        self.children_list.insert(len(self.children_list) if index is None else index, child)
+        if child.widget is not None:
+            self._children_by_widget[child.widget] = child
+            self._watch_destroy(child)
+        if child.name is not None:
+            self._children_by_name[child.name] = child
+        if self._accountant is not None:
+            self._accountant.page_added(child)
+
+    def _discard_child(self, child: StackChild) -> None:
+        """
+        private method that removes a child record from the ordered list and the lookup indexes, 
+        then hides its widget and picks a new visible child if needed.
+
+        Args:
+            child (StackChild): the record to remove.
+        """
+        self._discard_children([child])
+
+    def _discard_children(self, children: list[StackChild], reselect: bool = True) -> None:
+        """
+        private method that removes child records from the ordered list and the lookup indexes, then hides 
+        their widgets and picks a new visible child if needed.
+
+        Args:
+            children (list[StackChild]): the records to remove.
+            reselect (bool, optional): if the first remaining child should be shown when the visible child 
+                is removed. Defaults to True.
+        """
+        if self._transition is not None:
+            self._transition.finish()
+
+        if self._visible_record in children:
+            self._lifecycle.page_hidden(self._visible_record)
+
+        if len(children) == len(self.children_list):
+            self.children_list.clear()
+        else:
+            for child in children:
+                self.children_list.remove(child)
+
+        for child in children:
+            if child.name is not None:
+                del self._children_by_name[child.name]
+            self._lifecycle.forget(child)
+            if self._accountant is not None:
+                self._accountant.forget(child)
+
+            self._page_cache.discard(child)
+            if self._page_loader is not None:
+                self._page_loader.unregister(child)
+            if child.pending_build is not None:
+                child.pending_build.close()
+                child.pending_build = None
+
+            widget = child.widget
+            if widget is not None:
+                del self._children_by_widget[widget]
+                if child.destroy_binding is not None:
+                    self._backend.unbind_destroy(widget, child.destroy_binding)
+                    child.destroy_binding = None
+                self._hide_widget(widget)
+
+        if self._visible_record in children:
+            self._visible_record = None
+            self.visible_child = None
+            if reselect and self.children_list:
+                self.set_visible_child(self._get_child_identifier(self.children_list[0]))
+
+    def _get_child_identifier(self, child: StackChild) -> BASECLASS | str: # type: ignore
+        """
+        private method that gets the identifier used for a child in events, its widget, or its name if it 
+        has not been built yet.
+
+        Args:
+            child (StackChild): the record.
+
+        Returns:
+            BASECLASS | str: the widget or the name of the child.
+        """
+        return child.widget if child.widget is not None else child.name
+
+    def _get_child(self, widget_or_identifier: BASECLASS | str | int) -> StackChild: # type: ignore
+        """
+        private method that finds the child record for a widget, name or index.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): any identifier used for a widget.
+
+        Raises:
+            NotInStackError: the widget or name is not in the stack.
+            IndexError: index out of range.
+
+        Returns:
+            StackChild: the record.
+        """
+        if isinstance(widget_or_identifier, int) and not isinstance(widget_or_identifier, bool):
+            if widget_or_identifier < 0 or widget_or_identifier > len(self.children_list)-1:
+                raise IndexError(f"Index {widget_or_identifier} is out of range.")
+            return self.children_list[widget_or_identifier]
+
+        if isinstance(widget_or_identifier, str):
+            child = self._children_by_name.get(widget_or_identifier)
+        else:
+            child = self._children_by_widget.get(widget_or_identifier)
+        if child is None:
+            raise NotInStackError(widget_or_identifier)
+        return child
+
+    def _get_child_index(self, child: StackChild) -> int:
+        """
+        private method that gets the position of a child record, walking up the order tree from its node.
+
+        Args:
+            child (StackChild): the record to look up.
+
+        Returns:
+            int: the index of the child in the stack.
+        """
+        return self.children_list.index(child)
+
+    def _hide_widget(self, widget: BASECLASS) -> None: # type: ignore
+        """
+        private method that makes sure a widget joining the stack starts hidden. the widget is only gridded 
+        into the stack's cell when it is shown, so adding a widget that is not yet managed costs no layout work.
+
+        Args:
+            widget (BASECLASS): the widget joining the stack.
+        """
+        manager = widget.winfo_manager()
+        if manager:
+            getattr(widget, f"{manager}_forget")()
+
+    def _watch_destroy(self, child: StackChild) -> None:
+        """
+        private method that binds the <Destroy> event of a child's widget, so a page destroyed outside the 
+        stack is removed from it. the handler only holds weak references, it does not keep the stack or the 
+        page alive.
+
+        Args:
+            child (StackChild): the record of the widget.
+        """
+        stack_ref = weakref.ref(self)
+        widget_ref = weakref.ref(child.widget)
+
+        def on_destroy(event = None) -> None:
+            stack = stack_ref()
+            widget = widget_ref()
+            if stack is not None and widget is not None:
+                stack._on_child_destroyed(widget)
+
+        child.destroy_binding = self._backend.bind_destroy(child.widget, on_destroy)
+
+    def _on_child_destroyed(self, widget: BASECLASS) -> None: # type: ignore
+        """
+        private method called when the widget of a child is destroyed, removes the child from the stack and 
+        sends remove_widget as if it had been removed. nothing is done while the stack itself is destroyed.
+
+        Args:
+            widget (BASECLASS): the destroyed widget.
+        """
+        child = self._children_by_widget.get(widget)
+        if child is None or self._destroying:
+            return
+        child.destroy_binding = None # the binding goes with the widget.
+        self._discard_child(child)
+        child.widget = None # the history can still hold the record, it should not keep the dead page alive.
+        self._trigger_event_callbacks(event = "remove_widget", widget = widget)
+
+    def destroy(self) -> None:
+        """
+        destroys the stack and its pages, without removing the pages one at a time as they are destroyed.
+        """
+        self._destroying = True
+        # every subsystem with after jobs, futures or wrappers referencing the stack is closed, so none of
+        # them outlives it or keeps it alive.
+        self.disable_coalescing(flush = False)
+        self.disable_prefetch()
+        if self._transition is not None:
+            self._transition.cancel()
+        self.disable_autosave()
+        if self._page_loader is not None:
+            self._page_loader.shutdown()
+            self._page_loader = None
+        self.disable_thread_safe_calls()
+        self.disable_instrumentation()
+        self._lifecycle.close()
+        self.disable_accounting()
+        super().destroy()
+
+    def _build_child(self, child: StackChild) -> None:
+        """
+        private method that calls the factory of a lazy child and registers the widget it returns.
+
+        Args:
+            child (StackChild): the unbuilt record.
+
+        Raises:
+            WidgetAlreadyInStackError: if the factory returns a widget that is already in the stack.
+        """
+        self._step_build(child)
+
+    def _step_build(self, child: StackChild, deadline: float | None = None) -> bool:
+        """
+        private method that builds a lazy child, stopping early once the deadline has passed if the 
+        factory is a generator. calling it again carries on from where it stopped.
+
+        Args:
+            child (StackChild): the unbuilt record.
+            deadline (float | None, optional): a time.perf_counter value to stop at. Defaults to None, 
+                build it completely.
+
+        Raises:
+            WidgetAlreadyInStackError: if the factory returns a widget that is already in the stack.
+
+        Returns:
+            bool: if the child is now built.
+        """
+        if self._accountant is not None:
+            with self._accountant.measure_build(child):
+                return self._run_build(child, deadline)
+        return self._run_build(child, deadline)
+
+    def _run_build(self, child: StackChild, deadline: float | None) -> bool:
+        """
+        private method that runs the factory of a lazy child for _step_build.
+        """
+        if child.pending_build is None:
+            widget = child.factory(self)
+            if not inspect.isgenerator(widget):
+                self._register_built_child(child, widget)
+                return True
+            child.pending_build = widget
+
+        while True:
+            try:
+                next(child.pending_build)
+            except StopIteration as finished:
+                child.pending_build = None
+                self._register_built_child(child, finished.value)
+                return True
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+
+    def _register_built_child(self, child: StackChild, widget: BASECLASS) -> None: # type: ignore
+        """
+        private method that places a freshly built widget in the stack and gives it back any saved state.
+
+        Args:
+            child (StackChild): the record that was built.
+            widget (BASECLASS): the widget the factory returned.
+
+        Raises:
+            WidgetAlreadyInStackError: if the widget is already in the stack.
+        """
+        if widget in self._children_by_widget:
+            raise WidgetAlreadyInStackError(widget)
+
+        self._hide_widget(widget)
+        child.widget = widget
+        self._children_by_widget[widget] = child
+        self._watch_destroy(child)
+
+        if child.saved_state is not None:
+            widget.restore_page_state(child.saved_state)
+            child.saved_state = None
+        if child.saved_nested is not None:
+            _restore_nested_stacks(widget, child.saved_nested)
+            child.saved_nested = None
+
+    def _evict_child(self, child: StackChild) -> None:
+        """
+        private method that destroys the widget of a hidden lazy child, keeping its place in the stack so it 
+        can be rebuilt from its factory. the page is given the chance to save its state first.
+
+        Args:
+            child (StackChild): the built, hidden record to evict.
+        """
+        widget = child.widget
+        save_page_state = getattr(widget, "save_page_state", None)
+        if save_page_state is not None:
+            child.saved_state = save_page_state()
+        child.saved_nested = _save_nested_stacks(widget)
+
+        del self._children_by_widget[widget]
+        child.widget = None
+        child.destroy_binding = None # destroying the widget removes the binding.
+        self._lifecycle.forget(child, keep_hooks = True) # its jobs belong to the widget being destroyed.
+        if self._accountant is not None:
+            self._accountant.invalidate(child)
+        self._page_cache.discard(child)
+        self._page_cache.evictions += 1
+        widget.destroy()
+
+    def _evict_hidden_pages(self) -> None:
+        """
+        private method that evicts the least recently shown hidden pages until the page cache is within its limits.
+        does nothing while a transition runs, the page being left is still on screen until it ends.
+        """
+        if self._transition is not None and self._transition.running:
+            return
+        for child in self._page_cache.pick_evictions(keep = self._visible_record):
+            self._evict_child(child)
+
+    def _grid_child(self, child: StackChild) -> None:
+        """
+        private method that puts the widget of a child on top in the stack's cell. with the grid strategy it is 
+        gridded, with raise and place it is gridded or placed the first time and raised above the other pages, 
+        and the backdrop is raised beneath a page that does not expand so the pages under it are covered.
+
+        Args:
+            child (StackChild): the built record to show.
+        """
+        widget = child.widget
+        strategy = self.switch_strategy
+        if strategy == "grid":
+            if child.expandable:
+                widget.grid(row = 0, column = 0, sticky = "nsew")
+            else:
+                widget.grid(row = 0, column = 0)
+            return
+
+        manager = "grid" if strategy == "raise" else "place"
+        if widget.winfo_manager() != manager: # a new page, or one a transition or strategy change unmanaged.
+            if strategy == "raise":
+                if child.expandable:
+                    widget.grid(row = 0, column = 0, sticky = "nsew")
+                else:
+                    widget.grid(row = 0, column = 0)
+            elif child.expandable:
+                widget.place(relx = 0, rely = 0, relwidth = 1, relheight = 1)
+            else:
+                widget.place(relx = 0.5, rely = 0.5, anchor = "center")
+        if not child.expandable:
+            self._get_backdrop().lift()
+        widget.lift()
+
+    def _get_backdrop(self) -> BASECLASS: # type: ignore
+        """
+        private method that gets the frame covering the whole cell, used under pages that do not expand with 
+        the raise and place strategies, creating it the first time.
+
+        Returns:
+            BASECLASS: the backdrop.
+        """
+        if self._backdrop is None:
+            self._backdrop = self._backend.frame_class(self, **self._backend.frame_options)
+        manager = self._backdrop.winfo_manager()
+        if self.switch_strategy == "raise" and manager != "grid":
+            self._backdrop.grid(row = 0, column = 0, sticky = "nsew")
+        elif self.switch_strategy == "place" and manager != "place":
+            self._backdrop.place(relx = 0, rely = 0, relwidth = 1, relheight = 1)
+        return self._backdrop
+
+    def set_switch_strategy(self, strategy: str) -> None:
+        """
+        sets how the visible page is swapped.
+
+        grid, the default, removes the old page from the grid and grids the new one. the stack is the size of 
+        the visible page, but every switch makes Tk recalculate the layout of the stack.
+
+        raise keeps every page that has been shown gridded in the same cell and raises the new one above the 
+        others, so no layout is recalculated. the stack is the size of the largest page shown so far, and 
+        hidden pages stay mapped underneath, so they keep their size and still receive <Configure>.
+
+        place places the pages over one another and raises the new one, which avoids the grid layout entirely. 
+        placed pages do not set the size of the stack, it has to be sized by its own grid or width and height.
+
+        With raise and place a page that does not expand is drawn on a backdrop that covers the pages beneath it.
+
+        Args:
+            strategy (str): grid, raise or place.
+
+        Raises:
+            ValueError: if the strategy is invalid.
+        """
+        if strategy not in SWITCH_STRATEGIES:
+            raise ValueError(f"{strategy} is an invalid switch strategy. valid strategies: {', '.join(SWITCH_STRATEGIES)}")
+        if strategy == self.switch_strategy:
+            return
+        if self._transition is not None:
+            self._transition.finish()
+
+        for widget in self._children_by_widget:
+            self._hide_widget(widget)
+        if self._backdrop is not None:
+            self._hide_widget(self._backdrop)
+        self.switch_strategy = strategy
+        if self._visible_record is not None:
+            self._grid_child(self._visible_record)
+
+    def _show_child(self, child: StackChild) -> None:
+        """
+        private method that hides the current visible widget and shows the widget of the given child, 
+        building it first if it is a lazy child that has not been shown before.
+
+        Args:
+            child (StackChild): the record to make visible.
+        """
+        if self._coalescer is not None:
+            self._coalescer.discard() # showing a page directly replaces a pending burst.
+
+        was_built = child.widget is not None
+        if not was_built:
+            self._build_child(child)
+        started = time.perf_counter() if self._accountant is not None else None
+
+        previous_record = self._visible_record
+        transition = self._transition
+        if transition is not None and (transition.running or (previous_record is not None and previous_record is not child 
+                                                               and self.winfo_ismapped())):
+            transition.start(previous_record, child)
+        else:
+            if self.visible_child and self.switch_strategy == "grid":
+                self.visible_child.grid_remove()  # Hide the current visible widget
+            self._grid_child(child)
+
+        self.visible_child = child.widget
+        self._visible_record = child
+        if child is not previous_record:
+            self._lifecycle.page_switched(previous_record, child)
+
+        if child is not previous_record and not self._navigating_history:
+            self.stack_history.push(child)
+
+        if child.factory is not None:
+            self._page_cache.record_show(child, was_built)
+            self._evict_hidden_pages()
+
+        if self._page_loader is not None:
+            self._page_loader.page_showing(child)
+
+        if self._prefetcher is not None:
+            self._prefetcher.reschedule()
+
+        if started is not None:
+            self._accountant.page_shown(child, started)
+
+    def _remove_widget_by_object(self, widget: BASECLASS): # type: ignore
+        """
+        the private method for removing a widget by its object.
+
+        Args:
+            widget (BASECLASS): the object to remove.
+
+        Raises:
+            NotInStackError: the widget is not in the stack.
+        """
+        child = self._children_by_widget.get(widget)
+        if child is None:
+            raise NotInStackError(widget)
+        self._discard_child(child)
+
+    def _remove_widget_by_name(self, name: str):
+        """
+        the private method for removing a widget by its name
+
+        Args:
+            name (str): the name of the widget given to the stack
+
+        Raises:
+            NotInStackError: the widget is not in the stack.
+        """
+        child = self._children_by_name.get(name)
+        if child is None:
+            raise NotInStackError(name)
+        self._discard_child(child)
+
+    def _remove_widget_by_index(self, index: int):
+        """
+        the private method for removing a widget by its index
+
+        Args:
+            index (int): the index of the widget to remove.
+
+        Raises:
+            IndexError: index out of range.
+        """
+        if index < 0 or index > len(self.children_list)-1:
+            raise IndexError(f"Index {index} is out of range.")
+    
+        self._discard_child(self.children_list[index])
+
+    def _set_visible_child_by_object(self, widget: BASECLASS): #type: ignore
+        """
+        the private method for making a widget visible by its object.
+
+        Args:
+            widget (BASECLASS): the object to remove.
+
+        Raises:
+            NotInStackError: The widget is not in the stack.
+        """
+        child = self._children_by_widget.get(widget)
+        if child is None:
+            raise NotInStackError(widget)
+        self._show_child(child)
+
+    def _set_visible_child_by_name(self, name: str):
+        """
+        the private method for making a widget visible by its name
+
+        Args:
+            name (str): the name of the widget given to the stack
+
+        Raises:
+            NotInStackError: The widget is not in the stack.
+        """
+        child = self._children_by_name.get(name)
+        if child is None:
+            raise NotInStackError(name)
+        self._show_child(child)
+
+    def _set_visible_child_by_index(self, index: int):
+        """
+        the private method for making a widget visible by its index.
+
+        Args:
+            index (int): the index of the widget in the stack
+
+        Raises:
+            IndexError: index out of range.
+        """
+        if (index < 0 or index > len(self.children_list)-1) and index != -1:
+            raise IndexError(f"Index {index} is out of range.")
+        
+        self._show_child(self.children_list[index])
+
+    def add_callback_function(self, event: str, callback_function: callable, priority: int = 0, weak: bool = False) -> None: 
+        """
+        Adds a callback function for the specified event. All callback function will automatically be passed
+        the event and widget effected as key word arguments. The signature of the function is checked once here, 
+        any of these arguments it does not accept will not be passed to it.
+
+        Args:
+            event (str): events are, add_widget, remove_widget, change_visible_widget, replace_widget and 
+                reorder, plus any added with register_event.
+            callback_function (callable): the callback function to be added.
+            priority (int, optional): callbacks with a higher priority are called first, callbacks with the 
+                same priority are called in the order they were added. Defaults to 0.
+            weak (bool, optional): only keep a weak reference to the callback, so adding a bound method does 
+                not keep its object alive. the callback is removed once its object is garbage collected. 
+                Defaults to False.
+
+        Raises:
+            TypeError: an error if the callback_function passed is not callable, or cannot be weakly referenced.
+            ValueError: if the event is invalid.
+        """
+        self._callbacks.add(event, callback_function, priority, weak)
+        
+    def remove_callback_function(self, event: str, callback_function: callable) -> None: 
+        """
+        removes a callback function for the specified event.
+
+        Args:
+            event (str): events are, add_widget, remove_widget, change_visible_widget, replace_widget and 
+                reorder, plus any added with register_event.
+            callback_function (callable): the callback function to be removed.
+
+        Raises:
+            TypeError: an error if the callback_function passed is not callable.
+            ValueError: if the event is invalid.
+        """
+        self._callbacks.remove(event, callback_function)
+    
+    def get_callback_functions(self, event: str) -> set[callable]:
+        """
+        gets the specified set of callback functions relating to the event.
+
+        Args:
+            event (str): events are, add_widget, remove_widget, change_visible_widget, replace_widget and 
+                reorder, plus any added with register_event.
+
+        Raises:
+            ValueError: if the event is invalid.
+
+        Returns:
+            set[callable]: the set of callback functions.
+        """
+        return self._callbacks.get(event)
+
+    def register_event(self, event: str) -> None:
+        """
+        adds a custom event that callbacks can be added to and that can be sent with emit_event.
+
+        Args:
+            event (str): the name of the event.
+        """
+        self._callbacks.register_event(event)
+
+    def emit_event(self, event: str, **kwargs) -> None:
+        """
+        sends an event to its callbacks, the same way the stack sends its own events.
+
+        Args:
+            event (str): the name of the event.
+            **kwargs: Keyword arguments passed to the callback fucntions.
+
+        Raises:
+            ValueError: if the event is invalid.
+        """
+        self._trigger_event_callbacks(event, **kwargs)
+        
+    def _trigger_event_callbacks(self, event: str, **kwargs):
+        """
+        private method that calls the callback functions when an event happens. inside a batch the event 
+        is held back until the batch ends.
+
+        Args:
+            event (str): the name of the event.
+            **kwargs: Keyword arguments passed to the callback fucntions.
+
+        Raises:
+            ValueError: if the event is invalid.
+        """
+        if self._batch_depth:
+            self._batched_events.setdefault(event, []).append(kwargs.get("widget"))
+            return
+
+        if StackMixin._autosaving_stacks:
+            self._mark_autosave_dirty()
+
+        self._callbacks.dispatch(event, **kwargs)
+
+    def _mark_autosave_dirty(self) -> None:
+        """
+        private method that tells this stack, and any stack it is nested in, that its state has changed.
+        """
+        widget = self
+        while widget is not None:
+            autosaver = getattr(widget, "_autosaver", None)
+            if autosaver is not None:
+                autosaver.mark_dirty()
+            widget = widget.master
+
+    def _flush_batched_events(self) -> None:
+        """
+        private method that sends each event held back by a batch once, with the list of affected widgets.
+        """
+        batched_events, self._batched_events = self._batched_events, {}
+        for event, widgets in batched_events.items():
+            self._trigger_event_callbacks(event = event, widget = widgets)
+
+    def replace_widget(self, widget_to_replace: BASECLASS | str | int, new_widget: BASECLASS, # type: ignore
+                       expandable: bool | None = None) -> None:
+        """
+        puts a new widget in the place of a page. the page keeps its position, name and place in the history, 
+        and if it is visible the new widget is shown straight away. the old widget is hidden but not destroyed, 
+        a lazy page stops being lazy. the replace_widget event is sent with the new widget as the widget and 
+        the old one as old_widget, instead of a remove_widget and an add_widget.
+
+        Args:
+            widget_to_replace (BASECLASS | str | int): the widget, name or index of the page to replace.
+            new_widget (BASECLASS): the widget to put in its place.
+            expandable (bool | None, optional): if the new widget expands, defaults to the same as the page.
+
+        Raises:
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+            WidgetAlreadyInStackError: if the new widget is already in the stack.
+        """
+        child = self._get_child(widget_to_replace)
+        if new_widget is child.widget:
+            return
+        if new_widget in self._children_by_widget:
+            raise WidgetAlreadyInStackError(new_widget)
+        if self._transition is not None:
+            self._transition.finish()
+
+        old_widget = child.widget
+        if old_widget is not None:
+            del self._children_by_widget[old_widget]
+            if child.destroy_binding is not None:
+                self._backend.unbind_destroy(old_widget, child.destroy_binding)
+                child.destroy_binding = None
+            self._hide_widget(old_widget)
+        if child.pending_build is not None:
+            child.pending_build.close()
+            child.pending_build = None
+        self._page_cache.discard(child)
+        child.factory = None
+        child.saved_state = child.saved_nested = None
+        if expandable is not None:
+            child.expandable = expandable
+
+        self._hide_widget(new_widget)
+        child.widget = new_widget
+        self._children_by_widget[new_widget] = child
+        self._watch_destroy(child)
+        if child is self._visible_record:
+            self.visible_child = new_widget
+            self._grid_child(child)
+        self._lifecycle.page_replaced(child, old_widget)
+        if self._accountant is not None:
+            self._accountant.page_replaced(child)
+
+        self._trigger_event_callbacks(event = "replace_widget", widget = new_widget, old_widget = old_widget)
+
+    def move_widget(self, widget_or_identifier: BASECLASS | str | int, new_index: int) -> None: # type: ignore
+        """
+        moves a page to a new position, the pages in between shift by one. costs O(log n) however large 
+        the stack is, eg for dragging tabs. the reorder event is sent with old_index and new_index.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the widget, name or index of the page to move.
+            new_index (int): the position the page ends up at.
+
+        Raises:
+            NotInStackError: if the page is not in the stack.
+            IndexError: if either index is out of range.
+        """
+        child = self._get_child(widget_or_identifier)
+        if new_index < 0 or new_index > len(self.children_list)-1:
+            raise IndexError(f"Index {new_index} is out of range.")
+        old_index = self._get_child_index(child)
+        if old_index == new_index:
+            return
+
+        self.children_list.move(child, new_index)
+        if self._prefetcher is not None:
+            self._prefetcher.reschedule() # the neighbours of the visible page may have changed.
+        self._trigger_event_callbacks(event = "reorder", widget = widget_or_identifier, old_index = old_index, 
+                                      new_index = new_index)
+
+    def swap_widgets(self, first: BASECLASS | str | int, second: BASECLASS | str | int) -> None: # type: ignore
+        """
+        swaps the positions of two pages. the reorder event is sent once, with both identifiers as the widget.
+
+        Args:
+            first (BASECLASS | str | int): the widget, name or index of one page.
+            second (BASECLASS | str | int): the widget, name or index of the other page.
+
+        Raises:
+            NotInStackError: if a page is not in the stack.
+            IndexError: index out of range.
+        """
+        first_child = self._get_child(first)
+        second_child = self._get_child(second)
+        if first_child is second_child:
+            return
+
+        self.children_list.swap(first_child, second_child)
+        if self._prefetcher is not None:
+            self._prefetcher.reschedule()
+        self._trigger_event_callbacks(event = "reorder", widget = [first, second])
+
+    @property
+    def saved_history_length(self) -> int:
+        return self.stack_history.capacity
+
+    @saved_history_length.setter
+    def saved_history_length(self, length: int) -> None:
+        self.stack_history.resize(length)
+
+    def undo(self) -> None:
+        """
+        shows the page that was visible before the current one. pages that have since been removed, and 
+        entries for the page already shown, are skipped. does nothing if there is no earlier page.
+        """
+        child = self.stack_history.back(self._is_history_target)
+        if child is not None:
+            self._show_from_history(child)
+
+    def redo(self) -> None:
+        """
+        shows the page that undo moved away from. does nothing if there is no later page.
+        """
+        child = self.stack_history.forward(self._is_history_target)
+        if child is not None:
+            self._show_from_history(child)
+
+    def can_go_back(self) -> bool:
+        """
+        checks if undo has an earlier page to show.
+
+        Returns:
+            bool: if there is an earlier page.
+        """
+        return self.stack_history.can_go_back(self._is_history_target)
+
+    def can_go_forward(self) -> bool:
+        """
+        checks if redo has a later page to show.
+
+        Returns:
+            bool: if there is a later page.
+        """
+        return self.stack_history.can_go_forward(self._is_history_target)
+
+    def clear_history(self) -> None:
+        """
+        forgets every page in the history apart from the visible one.
+        """
+        self.stack_history.clear()
+        if self._visible_record is not None:
+            self.stack_history.push(self._visible_record)
+
+    def _show_from_history(self, child: StackChild) -> None:
+        """
+        private method that shows a page picked by undo, redo or restore without adding it to the history 
+        again. it is never coalesced, a deferred switch would run after the flag is cleared and push the 
+        page, so any pending burst is dropped and the page is shown straight away.
+
+        Args:
+            child (StackChild): the record to show.
+        """
+        if self._coalescer is not None:
+            self._coalescer.discard()
+        origin = self.visible_child
+        self._navigating_history = True
+        try:
+            self._show_child(child)
+        finally:
+            self._navigating_history = False
+        self._trigger_event_callbacks(event = "change_visible_widget", widget = self._get_child_identifier(child), 
+                                      origin = origin, destination = self.visible_child)
+
+    def _is_history_target(self, child: StackChild) -> bool:
+        """
+        private method that checks if undo or redo can show a page from the history, it must still be in 
+        the stack and not be the page already shown.
+        """
+        return child is not self._visible_record and self._contains_child(child)
+
+    def _contains_child(self, child: StackChild) -> bool:
+        """
+        private method that checks if a child record is still part of the stack.
+
+        Args:
+            child (StackChild): the record to check.
+
+        Returns:
+            bool: if the record is in the stack.
+        """
+        if child.name is not None:
+            return self._children_by_name.get(child.name) is child
+        return child.widget is not None and self._children_by_widget.get(child.widget) is child
+
+
+def _find_nested_stacks(widget) -> list:
+    """
+    finds the stacks inside a page widget, without looking inside the stacks found.
+
+    Args:
+        widget (BASECLASS): the page widget.
+
+    Returns:
+        list[Stack]: the stacks, the page itself if it is a stack.
+    """
+    if isinstance(widget, StackMixin):
+        return [widget]
+    found = []
+    pending = list(reversed(widget.winfo_children()))
+    while pending:
+        child = pending.pop()
+        if isinstance(child, StackMixin):
+            found.append(child)
+        else:
+            pending.extend(reversed(child.winfo_children()))
+    return found
+
+
+def _save_nested_stacks(widget) -> list[dict] | None:
+    """
+    snapshots the stacks nested inside a page that is not a stack itself, a stack page saves itself 
+    through save_page_state.
+
+    Returns:
+        list[dict] | None: the snapshots in the order _find_nested_stacks finds the stacks, None if there are none.
+    """
+    if isinstance(widget, StackMixin):
+        return None
+    return [stack.snapshot() for stack in _find_nested_stacks(widget)] or None
+
+
+def _restore_nested_stacks(widget, snapshots: list[dict]) -> None:
+    """
+    restores the snapshots from _save_nested_stacks into the stacks nested inside a page, matched by order.
+    """
+    if isinstance(widget, StackMixin):
+        return
+    for stack, snapshot in zip(_find_nested_stacks(widget), snapshots):
+        stack.restore(snapshot)
+
+
+SWITCH_STRATEGIES = ("grid", "raise", "place")
+
+STACK_DOC = """
+    The stack widget built on the default backend, see StackMixin.
+    """
+_stack_classes: dict[str, type] = {}
+
+def get_stack_class(backend: str | Backend | None = None) -> type:
+    """
+    gets the Stack class for a backend, the same stack built on that backend's container widget.
+
+    Args:
+        backend (str | Backend | None, optional): the backend or its name, eg "headless". Defaults to None, 
+            the default backend.
+
+    Raises:
+        ValueError: if there is no backend with that name.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        type: the Stack class.
+    """
+    if not isinstance(backend, Backend):
+        backend = get_default_backend() if backend is None else get_backend(backend)
+    stack_class = _stack_classes.get(backend.name)
+    if stack_class is None or stack_class._backend is not backend:
+        stack_class = type("Stack", (StackMixin, backend.frame_class), 
+                           {"_backend": backend, "__module__": __name__, "__doc__": STACK_DOC})
+        _stack_classes[backend.name] = stack_class
+    return stack_class
+
+
+def __getattr__(name: str):
+    """
+    picks the default backend the first time Stack, or one of the names describing its backend, is used.
+    """
+    if name == "Stack":
+        value = get_stack_class()
+    elif name in ("BACKEND", "STACKBASE", "BASECLASS", "STACKOPTIONS"):
+        backend = get_default_backend()
+        value = {"BACKEND": backend, "STACKBASE": backend.frame_class, "BASECLASS": backend.widget_class, 
+                 "STACKOPTIONS": backend.frame_options}[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value # later lookups are plain module attributes.
+    return value
@@ -0,0 +1,54 @@
+class StackChild:
+    """
+    A compact record describing a single child of a Stack.
+    The stack keeps one of these per page and indexes them by widget and by name so lookups
+    do not have to walk the children list.
+
+    Attributes:
+        widget (Widget | None): the widget shown for this child, None until a lazy child is first built.
+        name (str | None): the optional identifier given to the stack for this child.
+        factory (callable | None): for lazy children, called with the stack to build the widget.
+        expandable (bool | None): if the widget expands to fill the stack once it is built.
+        cost (int | float): the weight of the built page against the stack's page cost budget.
+        saved_state (object): state saved by the page when it was evicted, given back when it is rebuilt.
+        saved_nested (list[dict] | None): the snapshots of the stacks nested in the page, kept like saved_state.
+        pending_build (generator | None): the unfinished build of a generator factory.
+        destroy_binding (str | None): the id of the stack's <Destroy> handler on the widget.
+    """
+    __slots__ = ("widget", "name", "factory", "expandable", "cost", "saved_state", "saved_nested", "pending_build", "destroy_binding")
+
+    def __init__(self, widget, name: str | None = None, factory = None, expandable: bool | None = None, 
+                 cost: int | float = 1) -> None:
+        self.widget = widget
+        self.name = name
+        self.factory = factory
+        self.expandable = expandable
+        self.cost = cost
+        self.saved_state = None
+        self.saved_nested = None
+        self.pending_build = None
+        self.destroy_binding = None
+
+    @property
+    def is_built(self) -> bool:
+        """
+        if the widget for this child exists yet.
+        """
+        return self.widget is not None
+
+    def __getitem__(self, key: str):
+        """
+        allows the record to be read like the dictionaries the stack used to store, eg child["widget"].
+
+        Args:
+            key (str): the attribute to read.
+
+        Raises:
+            KeyError: if the key is not an attribute of the record.
+        """
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"StackChild(widget={self.widget!r}, name={self.name!r}, factory={self.factory!r})"
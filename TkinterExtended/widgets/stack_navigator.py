@@ -0,0 +1,246 @@
+from __future__ import annotations # the annotations name BASECLASS, which is only looked up once a backend is chosen.
+
+import abc
+from typing import Callable
+
+from TkinterExtended.exceptions import NotInStackError
+from TkinterExtended.backends import Backend, get_backend, get_default_backend
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+NAVIGATOR_EVENTS = ("add_widget", "remove_widget", "change_visible_widget", "replace_widget", "reorder")
+
+
+class StackNavigatorMixin(abc.ABC):
+    """
+    The shared part of the widgets that navigate a Stack, StackSwitcher and StackSidebar. It follows the
+    add, remove, change, replace and reorder events of the stack and passes on only the pages each event
+    affected, so a navigator updates the buttons of those pages instead of rebuilding itself. It keeps the
+    widget and name of every page it knows, so a page can still be found after the stack has removed it.
+
+    Args:
+        stack (Stack): the stack to navigate.
+        title (callable | None, optional): called with a page's widget, or its name if it is a lazy page that
+            has not been built, returns the text shown for the page. Defaults to None, the name of the page,
+            or the class of its widget if it has no name.
+        button_options (dict | None, optional): options passed to every button, eg a font. Defaults to None.
+    """
+    _backend: Backend # set by get_navigator_class on each concrete navigator class.
+
+    def __init__(self, *args, stack, title: Callable | None = None, button_options: dict | None = None, **kwargs):
+        super().__init__(*args, **{**self._backend.frame_options, **kwargs})
+        self.stack = stack
+        self.button_options: dict = button_options or {}
+
+        self._title: Callable | None = title
+        self._records: dict = {} # widget or name -> page, to find pages after the stack has removed them.
+        self._keys: dict[StackChild, tuple] = {} # page -> the widget and name it was known by.
+        self._selected: StackChild | None = None
+
+        # weak, so the stack does not keep a navigator that was never destroyed alive.
+        for event, handler in self._handlers().items():
+            stack.add_callback_function(event, handler, weak = True)
+
+    def get_title(self, widget_or_identifier: BASECLASS | str | int) -> str: # type: ignore
+        """
+        gets the text shown for a page.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+
+        Raises:
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+
+        Returns:
+            str: the title of the page.
+        """
+        return self._get_title(self.stack._get_child(widget_or_identifier))
+
+    def refresh(self) -> None:
+        """
+        rebuilds the navigator from the stack. it is kept up to date from the stack's events, this is only
+        needed after the titles returned by the title function change.
+        """
+        self._records.clear()
+        self._keys.clear()
+        for record in self.stack.children_list:
+            self._remember(record)
+        self._selected = self.stack._visible_record
+        self._rebuild()
+
+    def destroy(self) -> None:
+        """
+        stops following the stack and destroys the navigator.
+        """
+        for event, handler in self._handlers().items():
+            try:
+                self.stack.remove_callback_function(event, handler)
+            except Exception: # the stack may already be destroyed.
+                pass
+        super().destroy()
+
+    def _handlers(self) -> dict[str, Callable]:
+        return dict(zip(NAVIGATOR_EVENTS, (self._on_added, self._on_removed, self._on_visible_changed, self._on_replaced,
+                                           self._on_reordered)))
+
+    def _get_title(self, record: StackChild) -> str:
+        """
+        private method that gets the text shown for a page.
+        """
+        if self._title is not None:
+            return str(self._title(self.stack._get_child_identifier(record)))
+        if record.name is not None:
+            return record.name
+        return type(record.widget).__name__
+
+    def _show_page(self, record: StackChild) -> None:
+        """
+        private method that shows a page when its button is clicked.
+        """
+        if self.stack._contains_child(record):
+            self.stack.set_visible_child(self.stack._get_child_identifier(record))
+
+    def _position(self, record: StackChild) -> int:
+        return self.stack.children_list.index(record)
+
+    def _remember(self, record: StackChild) -> None:
+        keys = tuple(key for key in (record.widget, record.name) if key is not None)
+        self._keys[record] = keys
+        for key in keys:
+            self._records[key] = record
+
+    def _forget(self, record: StackChild) -> None:
+        for key in self._keys.pop(record, ()):
+            if self._records.get(key) is record:
+                del self._records[key]
+
+    def _resolve(self, widget) -> list[StackChild] | None:
+        """
+        private method that finds the pages an event was sent for, the widget of a batched event is a list.
+        None if any of them cannot be found.
+        """
+        records = []
+        for identifier in _flatten(widget):
+            if isinstance(identifier, int): # an index may already point at a different page.
+                return None
+            try:
+                records.append(self.stack._get_child(identifier))
+            except (NotInStackError, IndexError):
+                return None
+        return records
+
+    def _on_added(self, event: str, widget) -> None:
+        records = self._resolve(widget)
+        if records is None:
+            records = [record for record in self.stack.children_list if record not in self._keys]
+        records = [record for record in dict.fromkeys(records) if record not in self._keys]
+        for record in records:
+            self._remember(record)
+        if records:
+            self._insert_pages(records)
+        self._on_visible_changed()
+
+    def _on_removed(self, event: str, widget) -> None:
+        identifiers = _flatten(widget)
+        records = [self._records.get(identifier) for identifier in identifiers if not isinstance(identifier, int)]
+        if len(records) != len(identifiers) or None in records:
+            # removed by index, or by the widget of a lazy page, check which known pages are gone.
+            records = list(self._keys)
+        stale = [record for record in dict.fromkeys(records) if not self.stack._contains_child(record)]
+        for record in stale:
+            self._forget(record)
+            if record is self._selected:
+                self._selected = None
+        if stale:
+            self._remove_pages(stale)
+        self._on_visible_changed()
+
+    def _on_visible_changed(self, event: str | None = None, widget = None) -> None:
+        record = self.stack._visible_record
+        if record is not None and record not in self._keys:
+            return # a page shown as it is added, its add_widget event comes next and selects it.
+        if record is not self._selected:
+            previous, self._selected = self._selected, record
+            self._select(previous, record)
+
+    def _on_replaced(self, event: str, widget) -> None:
+        for record in self._resolve(widget) or ():
+            if record in self._keys:
+                self._forget(record)
+                self._remember(record)
+                self._retitle_page(record)
+
+    def _on_reordered(self, event: str, widget, new_index: int | None = None) -> None:
+        if isinstance(widget, int) and new_index is not None:
+            records = [self.stack.children_list[new_index]]
+        else:
+            records = self._resolve(widget)
+        self._move_pages(records)
+
+    # the parts each navigator implements, a navigator missing one cannot be created.
+
+    @abc.abstractmethod
+    def _rebuild(self) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _insert_pages(self, records: list[StackChild]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _remove_pages(self, records: list[StackChild]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _move_pages(self, records: list[StackChild] | None) -> None:
+        """
+        private method called after pages changed position, None if it is not known which.
+        """
+
+    @abc.abstractmethod
+    def _retitle_page(self, record: StackChild) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _select(self, previous: StackChild | None, record: StackChild | None) -> None:
+        ...
+
+
+def _flatten(widget) -> list:
+    """
+    gets the identifiers an event was sent for. batched events pass a list, and swap_widgets passes a pair.
+    """
+    if not isinstance(widget, list):
+        return [widget]
+    return [identifier for item in widget for identifier in _flatten(item)]
+
+
+def get_navigator_class(mixin: type, doc: str, classes: dict[str, type], backend: str | Backend | None = None) -> type:
+    """
+    gets the class of a navigator built on a backend, creating it the first time.
+
+    Args:
+        mixin (type): the navigator mixin, eg StackSwitcherMixin.
+        doc (str): the docstring of the concrete class.
+        classes (dict[str, type]): the classes already created, by backend name.
+        backend (str | Backend | None, optional): the backend or its name. Defaults to None, the default backend.
+
+    Raises:
+        ValueError: if there is no backend with that name, or it has no button class.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        type: the navigator class.
+    """
+    if not isinstance(backend, Backend):
+        backend = get_default_backend() if backend is None else get_backend(backend)
+    if backend.button_class is None:
+        raise ValueError(f"the {backend.name} backend has no button class, navigators need one")
+    navigator_class = classes.get(backend.name)
+    if navigator_class is None or navigator_class._backend is not backend:
+        name = mixin.__name__.removesuffix("Mixin")
+        navigator_class = type(name, (mixin, backend.frame_class), {"_backend": backend, "__module__": mixin.__module__,
+                                                                    "__doc__": doc})
+        classes[backend.name] = navigator_class
+    return navigator_class
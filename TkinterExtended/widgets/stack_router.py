@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import functools
+from typing import Iterator
+
+from TkinterExtended.exceptions import NotInStackError
+from TkinterExtended.widgets.callback_dispatcher import CallbackDispatcher
+from TkinterExtended.widgets.stack import StackMixin, _find_nested_stacks
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+class _RouteNode:
+    """
+    A node of the route trie, one named page of a stack.
+
+    Attributes:
+        stack (Stack | None): the stack the page belongs to, None for the root node.
+        record (StackChild | None): the page, None for the root node.
+        parent (_RouteNode | None): the node of the page the stack is nested in.
+        children (dict[str, _RouteNode]): the named pages of the stacks nested in this page.
+        substacks (list[Stack]): the stacks nested in this page.
+        scanned (object): the widget the nested stacks were found in, the page is scanned again if its
+            widget changes, eg when a lazy page is built or rebuilt after eviction.
+    """
+    __slots__ = ("stack", "record", "parent", "children", "substacks", "scanned")
+
+    def __init__(self, stack, record: StackChild | None, parent: _RouteNode | None) -> None:
+        self.stack = stack
+        self.record = record
+        self.parent = parent
+        self.children: dict[str, _RouteNode] = {}
+        self.substacks: list = []
+        self.scanned = None
+
+
+class StackRouter:
+    """
+    Navigates a tree of nested Stacks by path, eg "settings/network/wifi", where each segment is the name
+    of a page in the stack nested in the page before it. Stacks nested anywhere inside a page widget are
+    found automatically, including in lazy pages once they are built.
+
+    The routes are kept in a trie that is updated from the add_widget and remove_widget events of every
+    stack in the tree, so resolving a path costs one dictionary lookup per level. navigate switches every
+    level in one pass and sends a single change_route event for the whole path, after each stack that
+    switched has sent its change_visible_widget event. Only named pages can be routed to.
+
+    Args:
+        stack (Stack): the outermost stack.
+        separator (str, optional): the separator between the segments of a path. Defaults to "/".
+    """
+    def __init__(self, stack, separator: str = "/") -> None:
+        self.stack = stack
+        self.separator: str = separator
+
+        self._root: _RouteNode = _RouteNode(None, None, None)
+        self._subscriptions: dict = {} # stack -> (its route node, add callback, remove callback)
+        self._callbacks: CallbackDispatcher = CallbackDispatcher(("change_route",))
+        self._attach(self._root, stack)
+        self._root.scanned = stack
+
+    def navigate(self, path: str | list[str]) -> None:
+        """
+        shows the page at a path, and every page above it, in one pass. once every level has switched, each
+        stack whose visible page changed sends change_visible_widget, outermost first, so switchers and 
+        sidebars follow, then change_route is sent once with the new and previous routes.
+
+        Args:
+            path (str | list[str]): the path, or its segments.
+
+        Raises:
+            NotInStackError: if a segment of the path does not exist, nothing is switched.
+        """
+        nodes = self._resolve(path)
+        previous = self.current_route()
+        switched = []
+        for node in nodes:
+            if node.stack._visible_record is not node.record:
+                origin = node.stack.visible_child
+                node.stack._show_child(node.record)
+                switched.append((node.stack, origin))
+
+        if StackMixin._autosaving_stacks and nodes:
+            nodes[-1].stack._mark_autosave_dirty() # marks every stack above it too.
+
+        for stack, origin in switched:
+            stack._trigger_event_callbacks(event = "change_visible_widget", widget = stack.visible_child, 
+                                           origin = origin, destination = stack.visible_child)
+
+        route = self.separator.join(node.record.name for node in nodes)
+        if route != previous:
+            self._callbacks.dispatch("change_route", widget = nodes[-1].record.widget if nodes else None,
+                                     route = route, previous_route = previous)
+
+    def resolve(self, path: str | list[str]) -> list[tuple]:
+        """
+        finds the stacks and pages a path leads through, without switching anything. lazy pages on the
+        path are built so the stacks nested in them can be found.
+
+        Args:
+            path (str | list[str]): the path, or its segments.
+
+        Raises:
+            NotInStackError: if a segment of the path does not exist.
+
+        Returns:
+            list[tuple]: (stack, page name) for each level, outermost first.
+        """
+        return [(node.stack, node.record.name) for node in self._resolve(path)]
+
+    def is_route(self, path: str | list[str]) -> bool:
+        """
+        checks if a path leads to a page. lazy pages on the path are built.
+
+        Args:
+            path (str | list[str]): the path, or its segments.
+
+        Returns:
+            bool: if the path exists.
+        """
+        try:
+            self._resolve(path)
+        except NotInStackError:
+            return False
+        return True
+
+    def current_route(self) -> str:
+        """
+        gets the path of the visible pages, following the visible page of each level until a page has no
+        nested stack or its nested stack's visible page has no name.
+
+        Returns:
+            str: the path, empty if the outermost stack shows an unnamed page or nothing.
+        """
+        segments = []
+        node = self._root
+        while True:
+            self._refresh(node)
+            for substack in node.substacks:
+                record = substack._visible_record
+                if record is not None and record.name is not None and record.name in node.children:
+                    node = node.children[record.name]
+                    segments.append(record.name)
+                    break
+            else:
+                return self.separator.join(segments)
+
+    def routes(self, leaves_only: bool = False) -> Iterator[str]:
+        """
+        lists every route for deep links, depth first in page order. lazy pages that have not been built are
+        listed without the routes inside them.
+
+        Args:
+            leaves_only (bool, optional): only list routes to pages without nested stacks. Defaults to False.
+
+        Returns:
+            Iterator[str]: the routes.
+        """
+        pending = [(self._root, "")]
+        while pending:
+            node, prefix = pending.pop()
+            self._refresh(node)
+            children = list(node.children.values())
+            for child in reversed(children):
+                route = f"{prefix}{self.separator}{child.record.name}" if prefix else child.record.name
+                pending.append((child, route))
+            if node is not self._root and (not leaves_only or not children):
+                yield prefix
+
+    def add_callback_function(self, event: str, callback_function: callable, priority: int = 0, weak: bool = False) -> None:
+        """
+        adds a callback for the change_route event, it can take event, widget (the deepest page shown), route
+        and previous_route.
+
+        Args:
+            event (str): the event, change_route.
+            callback_function (callable): the callback function to be added.
+            priority (int, optional): callbacks with a higher priority are called first. Defaults to 0.
+            weak (bool, optional): only keep a weak reference to the callback. Defaults to False.
+
+        Raises:
+            TypeError: an error if the callback_function passed is not callable.
+            ValueError: if the event is invalid.
+        """
+        self._callbacks.add(event, callback_function, priority, weak)
+
+    def remove_callback_function(self, event: str, callback_function: callable) -> None:
+        """
+        removes a callback function for the specified event.
+
+        Args:
+            event (str): the event, change_route.
+            callback_function (callable): the callback function to be removed.
+        """
+        self._callbacks.remove(event, callback_function)
+
+    def close(self) -> None:
+        """
+        stops following the stacks, removing the router's callbacks from all of them.
+        """
+        for stack in list(self._subscriptions):
+            self._detach(stack)
+        self._root.children.clear()
+        self._root.substacks.clear()
+
+    def _split(self, path: str | list[str]) -> list[str]:
+        if isinstance(path, str):
+            return [segment for segment in path.split(self.separator) if segment]
+        return list(path)
+
+    def _resolve(self, path: str | list[str]) -> list[_RouteNode]:
+        """
+        private method that finds the route node of every segment of a path.
+
+        Raises:
+            NotInStackError: if a segment of the path does not exist.
+        """
+        segments = self._split(path)
+        nodes = []
+        node = self._root
+        for depth, segment in enumerate(segments):
+            self._refresh(node)
+            child = node.children.get(segment)
+            if child is None:
+                raise NotInStackError(self.separator.join(segments[:depth + 1]))
+            if child.record.widget is None and depth < len(segments) - 1:
+                child.stack._build_child(child.record) # the stacks nested in it are needed for the next segment.
+            nodes.append(child)
+            node = child
+        return nodes
+
+    def _refresh(self, node: _RouteNode) -> None:
+        """
+        private method that finds the stacks nested in a page again if its widget has changed since it was
+        last scanned.
+        """
+        if node is self._root:
+            return
+        widget = node.record.widget
+        if widget is node.scanned:
+            return
+        for substack in node.substacks:
+            self._detach(substack)
+        node.substacks = []
+        node.children = {}
+        node.scanned = widget
+        if widget is not None:
+            for substack in _find_nested_stacks(widget):
+                self._attach(node, substack)
+
+    def _attach(self, node: _RouteNode, stack) -> None:
+        """
+        private method that adds a nested stack's named pages under a node and follows its events.
+        """
+        node.substacks.append(stack)
+        on_added = functools.partial(self._on_added, stack)
+        on_removed = functools.partial(self._on_removed, stack)
+        self._subscriptions[stack] = (node, on_added, on_removed)
+        stack.add_callback_function("add_widget", on_added)
+        stack.add_callback_function("remove_widget", on_removed)
+        for record in stack.children_list:
+            self._add_node(node, stack, record)
+
+    def _detach(self, stack) -> None:
+        """
+        private method that stops following a stack and every stack nested in its pages.
+        """
+        subscription = self._subscriptions.pop(stack, None)
+        if subscription is None:
+            return
+        node, on_added, on_removed = subscription
+        try:
+            stack.remove_callback_function("add_widget", on_added)
+            stack.remove_callback_function("remove_widget", on_removed)
+        except Exception: # the stack may already be destroyed, eg with an evicted page.
+            pass
+        for child in list(node.children.values()):
+            if child.stack is stack:
+                self._remove_node(child)
+
+    def _add_node(self, node: _RouteNode, stack, record: StackChild) -> None:
+        if record.name is None or record.name in node.children:
+            return # unnamed pages cannot be routed to, and the first stack to use a name in a page keeps it.
+        node.children[record.name] = _RouteNode(stack, record, node)
+
+    def _remove_node(self, node: _RouteNode) -> None:
+        for substack in node.substacks:
+            self._detach(substack)
+        if node.parent.children.get(node.record.name) is node:
+            del node.parent.children[node.record.name]
+
+    def _on_added(self, stack, event: str, widget) -> None:
+        node = self._subscriptions[stack][0]
+        for identifier in (widget if isinstance(widget, list) else [widget]):
+            try:
+                record = stack._get_child(identifier)
+            except (NotInStackError, IndexError):
+                continue # removed again before the event was sent.
+            self._add_node(node, stack, record)
+
+    def _on_removed(self, stack, event: str, widget) -> None:
+        node = self._subscriptions[stack][0]
+        identifiers = widget if isinstance(widget, list) else [widget]
+        if all(isinstance(identifier, str) for identifier in identifiers):
+            stale = [node.children.get(identifier) for identifier in identifiers]
+        else: # removed by widget or index, check which of this stack's pages are gone.
+            stale = [child for child in node.children.values() if child.stack is stack]
+        for child in stale:
+            if child is not None and child.stack is stack and not stack._contains_child(child.record):
+                self._remove_node(child)
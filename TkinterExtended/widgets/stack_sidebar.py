@@ -0,0 +1,355 @@
+from __future__ import annotations # the annotations name BASECLASS, which is only looked up once a backend is chosen.
+
+import bisect
+import functools
+from typing import Callable, Sequence
+
+from TkinterExtended.backends import Backend
+from TkinterExtended.widgets.page_name_index import PageNameIndex
+from TkinterExtended.widgets.stack_child import StackChild
+from TkinterExtended.widgets.stack_navigator import StackNavigatorMixin, get_navigator_class
+
+
+FILTER_MODES = ("prefix", "substring")
+WHEEL_UNITS = 3 # rows scrolled by one notch of the mouse wheel.
+SORT_LIMIT = 16 # matches are sorted by position if there are fewer than one in this many pages.
+
+
+class StackSidebarMixin(StackNavigatorMixin):
+    """
+    A scrolling list of the pages of a Stack, like GTK's StackSidebar, for stacks with thousands of pages.
+    It only has one button for each row that fits, set by rows. Scrolling binds the rows to the pages that
+    come into view instead of creating widgets, so memory and the cost of an update do not grow with the
+    number of pages, and a row is only configured again when the page or state it shows changes.
+
+    The list can be filtered by title as the user types, see set_filter. Titles are kept in a PageNameIndex
+    that is updated as pages are added and removed, and a query that extends the previous one only narrows
+    the previous matches. Scroll it with the mouse wheel, or connect a scrollbar through yview and
+    yscrollcommand the same way as a Tk listbox.
+
+    Example:
+        scrollbar = tkinter.Scrollbar(window, command = sidebar.yview)
+        sidebar.configure_scrolling(yscrollcommand = scrollbar.set)
+
+    Args:
+        stack (Stack): the stack to navigate.
+        rows (int, optional): how many rows are shown at once. Defaults to 20.
+        title (callable | None, optional): called with a page's widget, or its name if it is a lazy page that
+            has not been built, returns the text of its row. Defaults to None, the name of the page.
+        button_options (dict | None, optional): options passed to every row button. Defaults to None.
+        filter_mode (str, optional): how set_filter matches titles, "prefix" or "substring".
+            Defaults to "substring".
+        follow_visible (bool, optional): scroll to the visible page when it changes. Defaults to True.
+        yscrollcommand (callable | None, optional): called with the first and last visible fractions of the
+            list after it scrolls or changes, eg a scrollbar's set. Defaults to None.
+
+    Raises:
+        ValueError: if rows is less than 1 or the filter mode is invalid.
+    """
+    def __init__(self, *args, stack, rows: int = 20, title: Callable | None = None, button_options: dict | None = None,
+                 filter_mode: str = "substring", follow_visible: bool = True, yscrollcommand: Callable | None = None,
+                 **kwargs):
+        if rows < 1:
+            raise ValueError(f"Rows must be at least 1, not {rows}")
+        _check_filter_mode(filter_mode)
+        super().__init__(*args, stack = stack, title = title, button_options = button_options, **kwargs)
+        self.rows: int = rows
+        self.follow_visible: bool = follow_visible
+        self.yscrollcommand: Callable | None = yscrollcommand
+
+        self._index: PageNameIndex = PageNameIndex()
+        self._titles: dict[StackChild, str] = {} # so the title function is only called when a page changes.
+        self._filter_text: str = ""
+        self._filter: str = "" # the folded filter text.
+        self._filter_mode: str = filter_mode
+        self._matches: list[StackChild] | None = None # the matching pages in stack order, None when not filtering.
+        self._match_set: set[StackChild] = set()
+        self._top: int = 0
+        self._row_buttons: list[BASECLASS] = [] # type: ignore
+        self._row_states: list[tuple | None] = [] # what each row shows, (page, title, selected), None if hidden.
+        self._scroll_fractions: tuple[float, float] | None = None
+
+        self.grid_columnconfigure(0, weight=1)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._on_wheel, add = "+")
+        self.refresh()
+
+    def configure_scrolling(self, yscrollcommand: Callable | None) -> None:
+        """
+        sets the function called with the first and last visible fractions of the list, eg a scrollbar's set.
+        """
+        self.yscrollcommand = yscrollcommand
+        self._scroll_fractions = None
+        self._render()
+
+    def yview(self, *args) -> tuple[float, float] | None:
+        """
+        scrolls the list, taking the same arguments a scrollbar passes to its command, "moveto" and a
+        fraction, or "scroll", a number and "units" or "pages". without arguments it gets the first and last
+        visible fractions of the list.
+
+        Returns:
+            tuple[float, float] | None: the visible fractions, if no arguments were given.
+        """
+        if not args:
+            return self._get_fractions()
+        total = len(self._items())
+        if args[0] == "moveto":
+            self._top = round(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self.rows if args[2] == "pages" else 1
+            self._top += int(args[1]) * step
+        else:
+            raise ValueError(f'bad option "{args[0]}": must be moveto or scroll')
+        self._render()
+        return None
+
+    def see(self, widget_or_identifier: BASECLASS | str | int) -> None: # type: ignore
+        """
+        scrolls the list so a page's row is shown, does nothing if the page is filtered out.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+
+        Raises:
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+        """
+        self._see(self.stack._get_child(widget_or_identifier))
+        self._render()
+
+    def set_filter(self, text: str, mode: str | None = None) -> None:
+        """
+        only lists the pages whose title matches text, ignoring case. an empty text lists every page. when
+        the text extends the previous filter only the previous matches are checked, so filtering as the user
+        types costs less with every character.
+
+        Args:
+            text (str): the text to match.
+            mode (str | None, optional): "prefix" or "substring". Defaults to None, the sidebar's filter_mode.
+
+        Raises:
+            ValueError: if the mode is invalid.
+        """
+        mode = self._filter_mode if mode is None else mode
+        _check_filter_mode(mode)
+        folded = text.casefold()
+        narrows = (self._matches is not None and mode == self._filter_mode
+                   and (folded.startswith(self._filter) if mode == "prefix" else self._filter in folded))
+        self._filter_text, self._filter, self._filter_mode = text, folded, mode
+        if not folded:
+            self._matches = None
+        elif narrows:
+            self._matches = self._index.narrow(self._matches, folded, mode)
+        else:
+            found = set(self._index.prefix(folded)) if mode == "prefix" else self._index.substring(folded)
+            children = self.stack.children_list
+            if len(found) * SORT_LIMIT < len(children):
+                self._matches = sorted(found, key = self._position)
+            else: # most pages match, walking the stack in order is cheaper than finding each position.
+                self._matches = [record for record in children if record in found]
+        self._match_set = set(self._matches or ())
+        self._top = 0
+        if self.follow_visible and self._selected is not None:
+            self._see(self._selected)
+        self._render()
+
+    def get_filter(self) -> str:
+        return self._filter_text
+
+    def get_matches(self) -> list[BASECLASS | str]: # type: ignore
+        """
+        gets the pages listed with the current filter, in stack order.
+
+        Returns:
+            list[BASECLASS | str]: the widgets of the pages, or their names if they are not built.
+        """
+        return [self.stack._get_child_identifier(record) for record in self._items()]
+
+    def _items(self) -> Sequence[StackChild]:
+        return self.stack.children_list if self._matches is None else self._matches
+
+    def _rebuild(self) -> None:
+        self._index.clear()
+        self._titles.clear()
+        for record in self.stack.children_list:
+            self._add_title(record)
+        if self._filter:
+            self._matches = None # searched from the index again, the titles may have changed.
+            self.set_filter(self._filter_text)
+        else:
+            self._render()
+
+    def _insert_pages(self, records: list[StackChild]) -> None:
+        in_view = self._matches is None and len(records) == 1 and self._position(records[0]) < self._top + self.rows
+        for record in records:
+            self._add_title(record)
+            if self._matches is not None and self._index.matches(record, self._filter, self._filter_mode):
+                bisect.insort(self._matches, record, key = self._position)
+                self._match_set.add(record)
+                in_view = True
+        # a page added below the rows in view only changes the scrollbar.
+        self._render(rows = in_view or self._matches is None and len(records) > 1)
+
+    def _remove_pages(self, records: list[StackChild]) -> None:
+        for record in records:
+            self._index.remove(record)
+            self._titles.pop(record, None)
+        stale = self._match_set.intersection(records)
+        if stale:
+            self._match_set -= stale
+            self._matches = [record for record in self._matches if record not in stale]
+        self._render()
+
+    def _move_pages(self, records: list[StackChild] | None) -> None:
+        if self._matches is not None:
+            self._matches.sort(key = self._position)
+        self._render()
+
+    def _retitle_page(self, record: StackChild) -> None:
+        self._add_title(record)
+        if self._matches is not None:
+            matched = self._index.matches(record, self._filter, self._filter_mode)
+            if matched and record not in self._match_set:
+                bisect.insort(self._matches, record, key = self._position)
+                self._match_set.add(record)
+            elif not matched and record in self._match_set:
+                self._matches.remove(record)
+                self._match_set.discard(record)
+        self._render()
+
+    def _select(self, previous: StackChild | None, record: StackChild | None) -> None:
+        if self.follow_visible and record is not None:
+            self._see(record)
+        self._render()
+
+    def _add_title(self, record: StackChild) -> None:
+        title = self._titles[record] = self._get_title(record)
+        self._index.add(record, title)
+
+    def _see(self, record: StackChild) -> None:
+        """
+        private method that moves the top row so a page is shown, if it is listed.
+        """
+        if self._matches is None:
+            if record not in self._keys:
+                return
+            position = self._position(record)
+        elif record in self._match_set:
+            position = bisect.bisect_left(self._matches, self._position(record), key = self._position)
+        else:
+            return
+        if position < self._top:
+            self._top = position
+        elif position >= self._top + self.rows:
+            self._top = position - self.rows + 1
+
+    def _render(self, rows: bool = True) -> None:
+        """
+        private method that binds the rows to the pages in view. only rows whose page, title or selection
+        changed are configured.
+
+        Args:
+            rows (bool, optional): False if only the scrollbar needs updating. Defaults to True.
+        """
+        items = self._items()
+        total = len(items)
+        self._top = max(min(self._top, total - self.rows), 0)
+        if rows:
+            self._render_rows(items, total)
+
+        if self.yscrollcommand is not None:
+            fractions = self._get_fractions()
+            if fractions != self._scroll_fractions:
+                self._scroll_fractions = fractions
+                self.yscrollcommand(*fractions)
+
+    def _render_rows(self, items: Sequence[StackChild], total: int) -> None:
+        shown = min(self.rows, total - self._top)
+        visible = self.stack._visible_record
+        styles = self._backend.button_styles
+        for row in range(shown):
+            record = items[self._top + row]
+            title = self._titles.get(record)
+            if title is None: # a page the stack has added but not yet sent the add_widget event for.
+                title = self._get_title(record)
+            state = (record, title, record is visible)
+            if row == len(self._row_buttons):
+                self._create_row()
+            previous = self._row_states[row]
+            if previous == state:
+                continue
+            button = self._row_buttons[row]
+            if previous is None or previous[1:] != state[1:]:
+                button.configure(text = state[1], **styles["selected" if state[2] else "normal"])
+            if previous is None:
+                button.grid(row = row, column = 0, sticky = "ew")
+            self._row_states[row] = state
+        for row in range(shown, len(self._row_buttons)):
+            if self._row_states[row] is not None:
+                self._row_buttons[row].grid_remove()
+                self._row_states[row] = None
+
+    def _create_row(self) -> None:
+        row = len(self._row_buttons)
+        options = {"anchor": "w", **self.button_options, **self._backend.button_styles["normal"]}
+        button = self._backend.button_class(self, command = functools.partial(self._on_row_clicked, row), **options)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            button.bind(sequence, self._on_wheel, add = "+")
+        self._row_buttons.append(button)
+        self._row_states.append(None)
+
+    def _on_row_clicked(self, row: int) -> None:
+        state = self._row_states[row]
+        if state is not None:
+            self._show_page(state[0])
+
+    def _on_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.yview("scroll", -WHEEL_UNITS, "units")
+        else:
+            self.yview("scroll", WHEEL_UNITS, "units")
+
+    def _get_fractions(self) -> tuple[float, float]:
+        total = len(self._items())
+        if not total:
+            return 0.0, 1.0
+        return self._top / total, min(self._top + self.rows, total) / total
+
+
+def _check_filter_mode(mode: str) -> None:
+    if mode not in FILTER_MODES:
+        raise ValueError(f"{mode} is an invalid filter mode. valid filter modes: {', '.join(FILTER_MODES)}")
+
+
+STACK_SIDEBAR_DOC = """
+    The stack sidebar widget built on the default backend, see StackSidebarMixin.
+    """
+_stack_sidebar_classes: dict[str, type] = {}
+
+def get_stack_sidebar_class(backend: str | Backend | None = None) -> type:
+    """
+    gets the StackSidebar class for a backend, it should be the backend of the stack it navigates.
+
+    Args:
+        backend (str | Backend | None, optional): the backend or its name, eg "headless". Defaults to None,
+            the default backend.
+
+    Raises:
+        ValueError: if there is no backend with that name, or it has no button class.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        type: the StackSidebar class.
+    """
+    return get_navigator_class(StackSidebarMixin, STACK_SIDEBAR_DOC, _stack_sidebar_classes, backend)
+
+
+def __getattr__(name: str):
+    """
+    picks the default backend the first time StackSidebar is used.
+    """
+    if name != "StackSidebar":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = get_stack_sidebar_class()
+    return value
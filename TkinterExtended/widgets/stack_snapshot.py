@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+
+
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot_file(snapshot: dict, path: str | os.PathLike) -> None:
+    """
+    writes a stack snapshot as JSON, replacing the file atomically so a crash part way through a write
+    never leaves a broken snapshot behind.
+
+    Args:
+        snapshot (dict): the snapshot from Stack.snapshot.
+        path (str | os.PathLike): the file to write.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(prefix = ".stack-snapshot-", dir = directory)
+    try:
+        with os.fdopen(file_descriptor, "w", encoding = "utf-8") as file:
+            json.dump(snapshot, file, separators = (",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def read_snapshot_file(path: str | os.PathLike) -> dict | None:
+    """
+    reads a stack snapshot written by write_snapshot_file.
+
+    Args:
+        path (str | os.PathLike): the file to read.
+
+    Raises:
+        ValueError: if the file is from an unsupported snapshot version.
+
+    Returns:
+        dict | None: the snapshot, or None if the file does not exist.
+    """
+    try:
+        with open(path, encoding = "utf-8") as file:
+            snapshot = json.load(file)
+    except FileNotFoundError:
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported stack snapshot version {snapshot.get('version')}")
+    return snapshot
+
+
+class SnapshotAutosaver:
+    """
+    Writes the snapshot of a Stack to a file shortly after its state changes. Changes that happen close
+    together are written once, delay_ms after the first of them.
+
+    Args:
+        stack (Stack): the stack to save, normally the outermost one.
+        path (str | os.PathLike): the file to write.
+        delay_ms (int, optional): how long to wait after a change before writing. Defaults to 500.
+    """
+    def __init__(self, stack, path: str | os.PathLike, delay_ms: int = 500) -> None:
+        self.path = path
+        self.delay_ms: int = delay_ms
+        self.writes: int = 0
+
+        self._stack = stack
+        self._job: str | None = None
+
+    def mark_dirty(self) -> None:
+        """
+        schedules a write, if one is not already scheduled.
+        """
+        if self._job is None:
+            self._job = self._stack.after(self.delay_ms, self.flush)
+
+    def flush(self) -> None:
+        """
+        writes the snapshot now, cancelling the scheduled write.
+        """
+        self.cancel()
+        write_snapshot_file(self._stack.snapshot(), self.path)
+        self.writes += 1
+
+    def cancel(self) -> None:
+        """
+        cancels the scheduled write, if there is one.
+        """
+        if self._job is not None:
+            self._stack.after_cancel(self._job)
+            self._job = None
@@ -0,0 +1,146 @@
+from __future__ import annotations # the annotations name BASECLASS, which is only looked up once a backend is chosen.
+
+import functools
+from typing import Callable
+
+from TkinterExtended.backends import Backend
+from TkinterExtended.widgets.stack_child import StackChild
+from TkinterExtended.widgets.stack_navigator import StackNavigatorMixin, get_navigator_class
+
+
+ORIENTATIONS = ("horizontal", "vertical")
+
+
+class StackSwitcherMixin(StackNavigatorMixin):
+    """
+    A row of buttons, one for each page of a Stack, that shows a page when its button is clicked and marks
+    the button of the visible page as selected, like GTK's StackSwitcher. It follows the stack's events,
+    adding a page creates one button packed next to its neighbour, removing one destroys one, and a switch
+    restyles two buttons, so it never has to be rebuilt by hand. It is meant for stacks with a handful of
+    pages, see StackSidebar for long lists.
+
+    Args:
+        stack (Stack): the stack to switch.
+        orientation (str, optional): "horizontal" or "vertical". Defaults to "horizontal".
+        title (callable | None, optional): called with a page's widget, or its name if it is a lazy page that
+            has not been built, returns the text of its button. Defaults to None, the name of the page.
+        button_options (dict | None, optional): options passed to every button. Defaults to None.
+
+    Raises:
+        ValueError: if the orientation is invalid.
+    """
+    def __init__(self, *args, stack, orientation: str = "horizontal", title: Callable | None = None,
+                 button_options: dict | None = None, **kwargs):
+        if orientation not in ORIENTATIONS:
+            raise ValueError(f"{orientation} is an invalid orientation. valid orientations: {', '.join(ORIENTATIONS)}")
+        super().__init__(*args, stack = stack, title = title, button_options = button_options, **kwargs)
+        self.orientation: str = orientation
+        self._buttons: dict[StackChild, BASECLASS] = {} # type: ignore
+        self.refresh()
+
+    def get_button(self, widget_or_identifier: BASECLASS | str | int) -> BASECLASS: # type: ignore
+        """
+        gets the button of a page, eg to give it an image.
+
+        Args:
+            widget_or_identifier (BASECLASS | str | int): the page.
+
+        Raises:
+            NotInStackError: if the page is not in the stack.
+            IndexError: index out of range.
+
+        Returns:
+            BASECLASS: the button.
+        """
+        return self._buttons[self.stack._get_child(widget_or_identifier)]
+
+    def _rebuild(self) -> None:
+        for button in self._buttons.values():
+            button.destroy()
+        self._buttons.clear()
+        self._insert_pages(list(self.stack.children_list))
+
+    def _insert_pages(self, records: list[StackChild]) -> None:
+        # last first, so the page after each one already has its button to be packed before.
+        for record in sorted(records, key = self._position, reverse = True):
+            state = "selected" if record is self._selected else "normal"
+            options = {**self.button_options, **self._backend.button_styles[state]}
+            button = self._buttons[record] = self._backend.button_class(self, text = self._get_title(record),
+                                                                        command = functools.partial(self._show_page, record), **options)
+            self._pack_button(record, button)
+
+    def _remove_pages(self, records: list[StackChild]) -> None:
+        for record in records:
+            button = self._buttons.pop(record, None)
+            if button is not None:
+                button.destroy()
+
+    def _move_pages(self, records: list[StackChild] | None) -> None:
+        if records is None:
+            for button in self._buttons.values():
+                button.pack_forget()
+            records = list(self._buttons)
+        for record in sorted(records, key = self._position, reverse = True):
+            button = self._buttons.get(record)
+            if button is not None:
+                self._pack_button(record, button)
+
+    def _retitle_page(self, record: StackChild) -> None:
+        button = self._buttons.get(record)
+        if button is not None:
+            button.configure(text = self._get_title(record))
+
+    def _select(self, previous: StackChild | None, record: StackChild | None) -> None:
+        styles = self._backend.button_styles
+        if previous in self._buttons:
+            self._buttons[previous].configure(**styles["normal"])
+        if record in self._buttons:
+            self._buttons[record].configure(**styles["selected"])
+
+    def _pack_button(self, record: StackChild, button: BASECLASS) -> None: # type: ignore
+        """
+        private method that packs a button before the button of the next page that has one, or last.
+        """
+        children = self.stack.children_list
+        options = {"side": "left", "fill": "y"} if self.orientation == "horizontal" else {"side": "top", "fill": "x"}
+        position = children.index(record) + 1
+        if position < len(children):
+            following = self._buttons.get(children[position])
+            if following is not None and following is not button and following.winfo_manager() == "pack":
+                button.pack(before = following, **options)
+                return
+        button.pack_forget() # packing an already packed button again does not move it.
+        button.pack(**options)
+
+
+STACK_SWITCHER_DOC = """
+    The stack switcher widget built on the default backend, see StackSwitcherMixin.
+    """
+_stack_switcher_classes: dict[str, type] = {}
+
+def get_stack_switcher_class(backend: str | Backend | None = None) -> type:
+    """
+    gets the StackSwitcher class for a backend, it should be the backend of the stack it switches.
+
+    Args:
+        backend (str | Backend | None, optional): the backend or its name, eg "headless". Defaults to None,
+            the default backend.
+
+    Raises:
+        ValueError: if there is no backend with that name, or it has no button class.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        type: the StackSwitcher class.
+    """
+    return get_navigator_class(StackSwitcherMixin, STACK_SWITCHER_DOC, _stack_switcher_classes, backend)
+
+
+def __getattr__(name: str):
+    """
+    picks the default backend the first time StackSwitcher is used.
+    """
+    if name != "StackSwitcher":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = get_stack_switcher_class()
+    return value
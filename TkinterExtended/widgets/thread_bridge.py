@@ -0,0 +1,151 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class TkThreadBridge:
+    """
+    A thread safe command queue that is drained on the Tk thread by an after loop.
+    Any thread may queue a call, the call runs on the Tk thread and its result or exception is passed
+    back through a concurrent.futures.Future. The loop polls quickly while commands are arriving and
+    backs off, doubling its interval up to max_poll_ms, while the queue stays empty.
+
+    Must be created and started on the Tk thread.
+
+    Args:
+        widget (Widget): the widget whose after loop drains the queue.
+        min_poll_ms (int, optional): the interval used while commands are arriving. Defaults to 1.
+        max_poll_ms (int, optional): the longest interval used while the queue is empty. Defaults to 50.
+        drain_budget_ms (float, optional): the most time spent running commands per poll, so a flood of
+            commands cannot freeze the UI. Defaults to 8.
+        latency_samples (int, optional): how many recent command latencies are kept for get_stats. Defaults to 1024.
+    """
+    def __init__(self, widget, min_poll_ms: int = 1, max_poll_ms: int = 50, drain_budget_ms: float = 8,
+                 latency_samples: int = 1024) -> None:
+        self.min_poll_ms: int = min_poll_ms
+        self.max_poll_ms: int = max_poll_ms
+        self.drain_budget_ms: float = drain_budget_ms
+
+        self._widget = widget
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._tk_thread: int = threading.get_ident()
+        self._interval: int = min_poll_ms
+        self._job: str | None = None
+
+        self._latencies: deque[float] = deque(maxlen = latency_samples)
+        self._commands_run: int = 0
+        self._started_at: float = time.perf_counter()
+
+    def start(self) -> None:
+        """
+        starts the polling loop, does nothing if it is already running.
+        """
+        if self._job is None:
+            self._tk_thread = threading.get_ident()
+            self._started_at = time.perf_counter()
+            self._job = self._widget.after(self._interval, self._poll)
+
+    def stop(self) -> None:
+        """
+        stops the polling loop and cancels every command still waiting in the queue.
+        """
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._job = None
+        while True:
+            try:
+                future = self._queue.get_nowait()[3]
+            except queue.Empty:
+                break
+            future.cancel()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        if the polling loop is running.
+        """
+        return self._job is not None
+
+    def in_tk_thread(self) -> bool:
+        """
+        checks if the calling thread is the Tk thread.
+
+        Returns:
+            bool: if the caller is on the Tk thread.
+        """
+        return threading.get_ident() == self._tk_thread
+
+    def call_soon_threadsafe(self, callback: callable, *args, **kwargs) -> Future:
+        """
+        queues a call to run on the Tk thread, safe to use from any thread.
+
+        Args:
+            callback (callable): the function to call.
+            *args: positional arguments for the function.
+            **kwargs: keyword arguments for the function.
+
+        Raises:
+            RuntimeError: if the bridge is not running.
+
+        Returns:
+            Future: resolves to the return value of the call, or its exception.
+        """
+        if self._job is None:
+            raise RuntimeError("The thread bridge is not running, call start on the Tk thread first")
+        future = Future()
+        self._queue.put((callback, args, kwargs, future, time.perf_counter()))
+        return future
+
+    def get_stats(self) -> dict:
+        """
+        gets the latency and throughput of the commands run so far. latency is the time from a command
+        being queued to it starting on the Tk thread.
+
+        Returns:
+            dict: commands_run, commands_per_second, latency_mean_ms, latency_p50_ms, latency_p99_ms,
+                latency_max_ms, queued and poll_interval_ms.
+        """
+        latencies = sorted(self._latencies)
+        elapsed = time.perf_counter() - self._started_at
+        def percentile(fraction: float) -> float:
+            return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] * 1000 if latencies else 0.0
+        return {
+            "commands_run": self._commands_run,
+            "commands_per_second": self._commands_run / elapsed if elapsed > 0 else 0.0,
+            "latency_mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "latency_p50_ms": percentile(0.5),
+            "latency_p99_ms": percentile(0.99),
+            "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+            "queued": self._queue.qsize(),
+            "poll_interval_ms": self._interval,
+        }
+
+    def _poll(self) -> None:
+        ran = self._drain()
+        if ran or not self._queue.empty():
+            self._interval = self.min_poll_ms
+        else:
+            self._interval = min(self._interval * 2, self.max_poll_ms)
+        self._job = self._widget.after(self._interval, self._poll)
+
+    def _drain(self) -> int:
+        deadline = time.perf_counter() + self.drain_budget_ms / 1000
+        ran = 0
+        while True:
+            try:
+                callback, args, kwargs, future, queued_at = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                self._latencies.append(time.perf_counter() - queued_at)
+                try:
+                    future.set_result(callback(*args, **kwargs))
+                except Exception as error:
+                    future.set_exception(error)
+            ran += 1
+            if time.perf_counter() >= deadline:
+                break
+        self._commands_run += ran
+        return ran
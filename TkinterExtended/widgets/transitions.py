@@ -0,0 +1,210 @@
+import math
+
+from TkinterExtended.widgets.stack_child import StackChild
+
+
+# the direction each page moves in, as a fraction of the stack's size, for the slide and cover modes.
+TRANSITION_DIRECTIONS = {
+    "left": (-1, 0),
+    "right": (1, 0),
+    "up": (0, -1),
+    "down": (0, 1),
+}
+
+TRANSITION_MODES = ("none", "crossfade") + tuple(f"{kind}_{direction}" for kind in ("slide", "cover") for direction in TRANSITION_DIRECTIONS)
+
+
+def ease_out_cubic(progress: float) -> float:
+    return 1 - (1 - progress) ** 3
+
+
+class TransitionEngine:
+    """
+    Animates the switch between two pages of a Stack.
+    While a transition runs both pages are positioned with place offsets relative to the stack, the stack
+    keeps the size it had before the switch and nothing is re-gridded until the transition ends. Frames are
+    scheduled with after against the monotonic clock of the stack's event loop, so if the event loop falls behind frames are skipped
+    rather than the transition running long, and other after loops still get their turn between frames.
+    Switching again while a transition runs retargets it instead of queueing another one.
+
+    slide moves both pages, cover moves the new page over the old one. Tk widgets cannot be drawn partly
+    transparent, so crossfade is approximated by holding the old page for the first half of the duration
+    and cutting to the new one.
+
+    Args:
+        stack (Stack): the stack being animated.
+        mode (str, optional): one of TRANSITION_MODES. Defaults to "slide_left".
+        duration_ms (int, optional): how long a transition lasts. Defaults to 250.
+        fps (int, optional): the frame rate aimed for. Defaults to 60.
+    """
+    def __init__(self, stack, mode: str = "slide_left", duration_ms: int = 250, fps: int = 60) -> None:
+        if mode not in TRANSITION_MODES:
+            raise ValueError(f"{mode} is an invalid transition. valid transitions: {', '.join(TRANSITION_MODES)}")
+        self.mode: str = mode
+        self.duration_ms: int = duration_ms
+        self.fps: int = fps
+
+        self._stack = stack
+        self._from: StackChild | None = None
+        self._to: StackChild | None = None
+        self._started_at: float = 0.0 # moved by a retarget that reverses, so progress carries on from where it was.
+        self._job: str | None = None
+        self._frame_index: int = 0 # the frame boundary, counted from _started_at, last rendered.
+
+        self._frames: int = 0
+        self._frames_started_at: float = 0.0
+        self._last_fps: float = 0.0
+        self._transitions: int = 0
+        self._retargets: int = 0
+        self._skipped_frames: int = 0
+
+    @property
+    def running(self) -> bool:
+        return self._to is not None
+
+    def start(self, from_child: StackChild, to_child: StackChild) -> None:
+        """
+        starts animating from the visible page to another one, or retargets the running transition.
+
+        Args:
+            from_child (StackChild): the page being left, currently gridded in the stack.
+            to_child (StackChild): the built page being shown.
+        """
+        if self.running:
+            self._retarget(to_child)
+            return
+
+        stack = self._stack
+        stack.grid_propagate(False) # keep the current size while nothing is gridded.
+        from_child.widget.grid_remove()
+        self._from = from_child
+        self._to = to_child
+        self._started_at = self._frames_started_at = self._stack._monotonic()
+        self._frame_index = 0
+        self._frames = 1
+        self._transitions += 1
+        self._render(0.0)
+        self._schedule_tick()
+
+    def finish(self) -> None:
+        """
+        jumps to the end of the running transition, gridding the new page in place.
+        """
+        if not self.running:
+            return
+        if self._job is not None:
+            self._stack.after_cancel(self._job)
+            self._job = None
+
+        elapsed = self._stack._monotonic() - self._frames_started_at
+        self._last_fps = self._frames / elapsed if elapsed > 0 else 0.0
+
+        from_child, to_child = self._from, self._to
+        self._from = self._to = None
+        for child in (from_child, to_child):
+            if child is not None and child.widget is not None:
+                child.widget.place_forget()
+
+        stack = self._stack
+        stack.grid_propagate(True)
+        if to_child.widget is not None and to_child is stack._visible_record:
+            stack._grid_child(to_child)
+        stack._evict_hidden_pages()
+
+    def cancel(self) -> None:
+        """
+        stops the running transition where it is, without gridding either page, eg as the stack is destroyed.
+        """
+        if self._job is not None:
+            self._stack.after_cancel(self._job)
+            self._job = None
+        self._from = self._to = None
+
+    def get_stats(self) -> dict:
+        """
+        gets how the transitions have performed.
+
+        Returns:
+            dict: transitions, retargets, skipped_frames, last_fps (achieved by the last transition) and target_fps.
+        """
+        return {
+            "transitions": self._transitions,
+            "retargets": self._retargets,
+            "skipped_frames": self._skipped_frames,
+            "last_fps": self._last_fps,
+            "target_fps": self.fps,
+        }
+
+    def _retarget(self, to_child: StackChild) -> None:
+        self._retargets += 1
+        if to_child is self._to:
+            return
+        if to_child is self._from:
+            # going back to the page being left, run the transition backwards from where it is now.
+            progress = self._progress()
+            self._from, self._to = self._to, self._from
+            self._started_at = self._stack._monotonic() - (1 - progress) * self.duration_ms / 1000
+            self._frame_index = self._current_frame_index(self._stack._monotonic() - self._started_at)
+        else:
+            if self._to.widget is not None:
+                self._to.widget.place_forget()
+            self._to = to_child
+        self._render(self._progress()) # not counted as a frame, it redraws the one the transition is on.
+
+    def _progress(self) -> float:
+        return min((self._stack._monotonic() - self._started_at) * 1000 / self.duration_ms, 1.0) if self.duration_ms > 0 else 1.0
+
+    def _current_frame_index(self, elapsed: float) -> int:
+        return math.floor(elapsed * self.fps + 1e-9) # the tolerance keeps a tick on a boundary from rounding below it.
+
+    def _tick(self) -> None:
+        self._job = None
+        progress = self._progress()
+        if progress >= 1.0:
+            self.finish()
+            return
+
+        elapsed = self._stack._monotonic() - self._started_at
+        index = self._current_frame_index(elapsed)
+        if index > self._frame_index: # a tick that arrives before the next boundary draws nothing.
+            self._skipped_frames += index - self._frame_index - 1
+            self._frame_index = index
+            self._frames += 1
+            self._render(progress)
+        self._schedule_tick()
+
+    def _schedule_tick(self) -> None:
+        """
+        private method that schedules the next tick on the next frame boundary after the last rendered one,
+        rather than after a fixed delay, so late frames do not add up.
+        """
+        boundary = (self._frame_index + 1) / self.fps
+        elapsed = self._stack._monotonic() - self._started_at
+        delay_ms = math.ceil((boundary - elapsed) * 1000 - 1e-9)
+        self._job = self._stack.after(max(1, delay_ms), self._tick)
+
+    def _render(self, progress: float) -> None:
+        kind, _, direction = self.mode.partition("_")
+        if kind == "crossfade":
+            showing, hidden = (self._to, self._from) if progress >= 0.5 else (self._from, self._to)
+            self._place(showing, 0, 0)
+            showing.widget.lift() # with the raise and place strategies other pages are managed beneath it.
+            if hidden.widget is not None:
+                hidden.widget.place_forget()
+            return
+
+        eased = ease_out_cubic(progress)
+        dx, dy = TRANSITION_DIRECTIONS[direction]
+        # the new page starts one stack length away, opposite to the direction of travel.
+        self._place(self._to, -dx * (1 - eased), -dy * (1 - eased))
+        if kind == "slide":
+            self._place(self._from, dx * eased, dy * eased)
+        else:
+            self._place(self._from, 0, 0)
+        self._to.widget.lift()
+
+    def _place(self, child: StackChild, relx: float, rely: float) -> None:
+        if child.expandable:
+            child.widget.place(relx = relx, rely = rely, relwidth = 1, relheight = 1)
+        else:
+            child.widget.place(relx = 0.5 + relx, rely = 0.5 + rely, anchor = "center")
@@ -0,0 +1,487 @@
+from __future__ import annotations # the annotations name BASECLASS, which is only looked up once a backend is chosen.
+
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+from TkinterExtended.exceptions import NotInStackError
+from TkinterExtended.backends import Backend, get_backend, get_default_backend
+from TkinterExtended.widgets.callback_dispatcher import CallbackDispatcher
+
+
+class VirtualStackMixin:
+    """
+    A stack with one page per record of a data source, for thousands of records that would each need a
+    widget with a normal Stack. Only a small pool of page widgets is ever created from a template, showing
+    a record binds it to a pooled widget, so memory does not grow with the number of records and a switch
+    costs one bind. The most recently shown records keep their widgets, so going back to one of them does
+    not bind it again.
+
+    The data source is a sequence, or a length and a function that gets the record at an index. Records
+    are shown by index, or by key if a key function is given. After the data changes call notify_inserted,
+    notify_removed or notify_changed, so the visible record and the pooled widgets stay correct.
+
+    Events are the same as Stack's. change_visible_widget is passed the identifier that was shown, like
+    Stack, and also the index and record. add_widget and remove_widget are sent by notify_inserted and
+    notify_removed with the range of affected indexes as the widget.
+
+    Args:
+        template (callable): called with the stack as the master to create a pooled page widget.
+        source (Sequence | None, optional): the records. Defaults to None.
+        length (int | callable | None, optional): the number of records, or a function that returns it,
+            used with get_item instead of source. Defaults to None.
+        get_item (callable | None, optional): called with an index, returns the record. Defaults to None.
+        key (callable | None, optional): called with a record, returns the key used to show it by name.
+            Defaults to None.
+        index_of_key (callable | None, optional): called with a key, returns the index of its record.
+            without it the first key lookup builds an index of every key. Defaults to None.
+        bind (callable | None, optional): called as bind(widget, record, index) to show a record on a
+            pooled widget. Defaults to None, calling widget.bind_record(record, index).
+        pool_size (int, optional): how many page widgets are created at most. Defaults to 2.
+        children_expandable (bool, optional): if the pages expand to fill the stack. Defaults to False.
+
+    Attributes:
+        visible_child (BASECLASS): the pooled widget showing the visible record.
+        visible_index (int | None): the index of the visible record.
+    """
+    _backend: Backend # set by get_virtual_stack_class on each concrete VirtualStack class.
+
+    def __init__(self, *args, template: Callable, source: Sequence | None = None, length: int | Callable | None = None,
+                 get_item: Callable | None = None, key: Callable | None = None, index_of_key: Callable | None = None,
+                 bind: Callable | None = None, pool_size: int = 2, children_expandable: bool = False, **kwargs):
+        super().__init__(*args, **{**self._backend.frame_options, **kwargs})
+        if not callable(template):
+            raise TypeError(f"Object {template} is not callable")
+        if pool_size < 1:
+            raise ValueError(f"Pool size must be at least 1, not {pool_size}")
+
+        self.template: Callable = template
+        self.pool_size: int = pool_size
+        self.children_expandable: bool = children_expandable
+        self.visible_child: BASECLASS = None # type: ignore
+        self.visible_index: int | None = None
+
+        self._bind: Callable | None = bind
+        self._bound: OrderedDict[int, BASECLASS] = OrderedDict() # type: ignore # index -> widget, least recently shown first.
+        self._free: list[BASECLASS] = [] # type: ignore # pooled widgets not bound to any record.
+        self._created: int = 0
+        self._binds: int = 0
+        self._reuses: int = 0
+
+        self._callbacks: CallbackDispatcher = CallbackDispatcher(("add_widget", "remove_widget", "change_visible_widget"))
+
+        if self.children_expandable:
+            self.grid_rowconfigure(0, weight=1)
+            self.grid_columnconfigure(0, weight=1)
+
+        self.set_data_source(source, length, get_item, key, index_of_key)
+
+    def set_data_source(self, source: Sequence | None = None, length: int | Callable | None = None,
+                        get_item: Callable | None = None, key: Callable | None = None,
+                        index_of_key: Callable | None = None) -> None:
+        """
+        replaces the data source, showing its first record.
+
+        Args:
+            source (Sequence | None, optional): the records. Defaults to None.
+            length (int | callable | None, optional): the number of records, or a function that returns it.
+                Defaults to None.
+            get_item (callable | None, optional): called with an index, returns the record. Defaults to None.
+            key (callable | None, optional): called with a record, returns its key. Defaults to None.
+            index_of_key (callable | None, optional): called with a key, returns the index of its record.
+                Defaults to None.
+
+        Raises:
+            TypeError: if both or neither of source and length with get_item are given.
+        """
+        if (source is None) == (length is None or get_item is None):
+            raise TypeError("A data source needs either source, or both length and get_item")
+        if source is not None:
+            self._length = source.__len__
+            self._get_item = source.__getitem__
+        else:
+            self._length = length if callable(length) else (lambda: length)
+            self._get_item = get_item
+        self._key = key
+        self._index_of_key = index_of_key
+        self._key_index: dict | None = None
+
+        self._release_all()
+        self.visible_index = None
+        if self.get_stack_size():
+            self.set_visible_child(0)
+        else:
+            self._hide_visible()
+
+    def set_visible_child(self, index_or_key: int | str) -> None:
+        """
+        shows a record by its index or its key.
+
+        Args:
+            index_or_key (int | str): the index of the record, -1 for the last, or its key.
+
+        Raises:
+            IndexError: index out of range.
+            NotInStackError: no record has that key.
+        """
+        if isinstance(index_or_key, int) and not isinstance(index_or_key, bool):
+            size = self.get_stack_size()
+            if (index_or_key < 0 or index_or_key > size - 1) and index_or_key != -1:
+                raise IndexError(f"Index {index_or_key} is out of range.")
+            index = index_or_key if index_or_key >= 0 else size - 1
+            if index < 0:
+                raise IndexError(f"Index {index_or_key} is out of range.")
+        else:
+            index = self.index_of_key(index_or_key)
+        self._show_index(index)
+        self._trigger_event_callbacks(event = "change_visible_widget", widget = index_or_key, index = index,
+                                      record = self.get_visible_record())
+
+    def show_next(self) -> None:
+        """
+        Shows the next record, wrapping round to the first.
+        """
+        if self.visible_index is None:
+            return
+        self.set_visible_child(self.visible_index + 1 if self.visible_index < self.get_stack_size() - 1 else 0)
+
+    def show_previous(self) -> None:
+        """
+        Shows the previous record, wrapping round to the last.
+        """
+        if self.visible_index is None:
+            return
+        self.set_visible_child(self.visible_index - 1 if self.visible_index > 0 else -1)
+
+    def get_visible_child(self) -> BASECLASS | None: # type: ignore
+        """
+        gets the pooled widget showing the visible record.
+
+        Returns:
+            Widget | None: the visible widget.
+        """
+        return self.visible_child
+
+    def get_visible_record(self):
+        """
+        gets the visible record.
+
+        Returns:
+            object: the record, None if there are no records.
+        """
+        return None if self.visible_index is None else self._get_item(self.visible_index)
+
+    def get_stack_size(self) -> int:
+        """
+        gets the number of records.
+
+        Returns:
+            int: the number of records.
+        """
+        return self._length()
+
+    def get_stack_state(self) -> int | None:
+        """
+        gets the index of the visible record.
+
+        Returns:
+            int | None: the index, None if there are no records.
+        """
+        return self.visible_index
+
+    def load_stack_state(self, index: int) -> None:
+        """
+        shows the record with the given index.
+
+        Args:
+            index (int): the index of the record.
+        """
+        self.set_visible_child(index)
+
+    def index_of_key(self, key) -> int:
+        """
+        gets the index of the record with a key.
+
+        Args:
+            key (object): the key.
+
+        Raises:
+            NotInStackError: no record has that key.
+
+        Returns:
+            int: the index of the record.
+        """
+        if self._index_of_key is not None:
+            index = self._index_of_key(key)
+        else:
+            if self._key is None:
+                raise NotInStackError(key)
+            if self._key_index is None:
+                self._key_index = {self._key(self._get_item(index)): index for index in range(self.get_stack_size())}
+            index = self._key_index.get(key)
+        if index is None or not 0 <= index < self.get_stack_size():
+            raise NotInStackError(key)
+        return index
+
+    def notify_inserted(self, index: int, count: int = 1) -> None:
+        """
+        tells the stack records were inserted into the data source, the visible record stays visible.
+
+        Args:
+            index (int): the index of the first inserted record.
+            count (int, optional): how many records were inserted. Defaults to 1.
+        """
+        self._key_index = None
+        self._shift_bound(index, count)
+        if self.visible_index is not None and self.visible_index >= index:
+            self.visible_index += count
+        if self.visible_index is None and self.get_stack_size():
+            self.set_visible_child(0)
+        self._trigger_event_callbacks(event = "add_widget", widget = range(index, index + count))
+
+    def notify_removed(self, index: int, count: int = 1) -> None:
+        """
+        tells the stack records were removed from the data source. if the visible record was removed, the
+        record that took its place is shown, or the new last record.
+
+        Args:
+            index (int): the index the first removed record had.
+            count (int, optional): how many records were removed. Defaults to 1.
+        """
+        self._key_index = None
+        for removed in range(index, index + count):
+            widget = self._bound.pop(removed, None)
+            if widget is not None:
+                self._free.append(widget)
+        self._shift_bound(index + count, -count)
+
+        visible = self.visible_index
+        if visible is not None and visible >= index + count:
+            self.visible_index = visible - count
+        elif visible is not None and visible >= index:
+            self.visible_index = None
+            size = self.get_stack_size()
+            if size:
+                self.set_visible_child(min(index, size - 1))
+            else:
+                self._hide_visible()
+        self._trigger_event_callbacks(event = "remove_widget", widget = range(index, index + count))
+
+    def notify_changed(self, index: int | None = None) -> None:
+        """
+        tells the stack a record, or every record, changed. the visible record is bound again straight
+        away, other pooled widgets when their record is next shown.
+
+        Args:
+            index (int | None, optional): the index of the changed record. Defaults to None, every record.
+        """
+        self._key_index = None
+        for bound in ([index] if index is not None else list(self._bound)):
+            widget = self._bound.get(bound)
+            if widget is None:
+                continue
+            if bound == self.visible_index:
+                self._bind_widget(widget, bound)
+            else:
+                del self._bound[bound]
+                self._free.append(widget)
+
+    def get_pool_stats(self) -> dict:
+        """
+        gets how the widget pool is being used.
+
+        Returns:
+            dict: created (widgets made from the template), pool_size, binds (records bound to a widget)
+                and reuses (switches to a record whose widget was still bound).
+        """
+        return {"created": self._created, "pool_size": self.pool_size, "binds": self._binds, "reuses": self._reuses}
+
+    def add_callback_function(self, event: str, callback_function: callable, priority: int = 0, weak: bool = False) -> None:
+        """
+        Adds a callback function for the specified event, the same as Stack.add_callback_function.
+
+        Args:
+            event (str): events are, add_widget, remove_widget and change_visible_widget, plus any added
+                with register_event.
+            callback_function (callable): the callback function to be added.
+            priority (int, optional): callbacks with a higher priority are called first. Defaults to 0.
+            weak (bool, optional): only keep a weak reference to the callback. Defaults to False.
+
+        Raises:
+            TypeError: an error if the callback_function passed is not callable.
+            ValueError: if the event is invalid.
+        """
+        self._callbacks.add(event, callback_function, priority, weak)
+
+    def remove_callback_function(self, event: str, callback_function: callable) -> None:
+        """
+        removes a callback function for the specified event.
+
+        Args:
+            event (str): the name of the event.
+            callback_function (callable): the callback function to be removed.
+
+        Raises:
+            TypeError: an error if the callback_function passed is not callable.
+            ValueError: if the event is invalid.
+        """
+        self._callbacks.remove(event, callback_function)
+
+    def get_callback_functions(self, event: str) -> set[callable]:
+        """
+        gets the specified set of callback functions relating to the event.
+
+        Args:
+            event (str): the name of the event.
+
+        Raises:
+            ValueError: if the event is invalid.
+
+        Returns:
+            set[callable]: the set of callback functions.
+        """
+        return self._callbacks.get(event)
+
+    def register_event(self, event: str) -> None:
+        """
+        adds a custom event that callbacks can be added to and that can be sent with emit_event.
+
+        Args:
+            event (str): the name of the event.
+        """
+        self._callbacks.register_event(event)
+
+    def emit_event(self, event: str, **kwargs) -> None:
+        """
+        sends an event to its callbacks, the same way the stack sends its own events.
+
+        Args:
+            event (str): the name of the event.
+            **kwargs: Keyword arguments passed to the callback fucntions.
+
+        Raises:
+            ValueError: if the event is invalid.
+        """
+        self._trigger_event_callbacks(event, **kwargs)
+
+    def _trigger_event_callbacks(self, event: str, **kwargs) -> None:
+        """
+        private method that calls the callback functions when an event happens.
+        """
+        self._callbacks.dispatch(event, **kwargs)
+
+    def _show_index(self, index: int) -> None:
+        """
+        private method that shows a record, taking its widget from the pool and binding it if needed.
+
+        Args:
+            index (int): the index of the record.
+        """
+        widget = self._bound.get(index)
+        if widget is not None:
+            self._bound.move_to_end(index)
+            if index != self.visible_index:
+                self._reuses += 1
+        else:
+            widget = self._take_widget()
+            self._bind_widget(widget, index)
+            self._bound[index] = widget
+
+        if widget is not self.visible_child:
+            self._hide_visible()
+            if self.children_expandable:
+                widget.grid(row = 0, column = 0, sticky = "nsew")
+            else:
+                widget.grid(row = 0, column = 0)
+            self.visible_child = widget
+        self.visible_index = index
+
+    def _take_widget(self) -> BASECLASS: # type: ignore
+        """
+        private method that gets an unbound widget, creating one while the pool is not full, otherwise
+        taking the widget of the least recently shown record that is not visible.
+        """
+        if self._free:
+            return self._free.pop()
+        if self._created < self.pool_size or not self._bound:
+            self._created += 1
+            return self.template(self)
+        for index, widget in self._bound.items():
+            if widget is not self.visible_child:
+                del self._bound[index]
+                return widget
+        # a pool of one, the visible widget is bound to the new record in place.
+        index, widget = self._bound.popitem(last = False)
+        return widget
+
+    def _bind_widget(self, widget: BASECLASS, index: int) -> None: # type: ignore
+        """
+        private method that binds a record to a pooled widget.
+        """
+        record = self._get_item(index)
+        if self._bind is not None:
+            self._bind(widget, record, index)
+        else:
+            widget.bind_record(record, index)
+        self._binds += 1
+
+    def _hide_visible(self) -> None:
+        """
+        private method that hides the visible widget.
+        """
+        if self.visible_child is not None:
+            self.visible_child.grid_remove()
+            self.visible_child = None
+
+    def _release_all(self) -> None:
+        """
+        private method that unbinds every pooled widget, keeping them for reuse.
+        """
+        self._free.extend(self._bound.values())
+        self._bound.clear()
+
+    def _shift_bound(self, start: int, offset: int) -> None:
+        """
+        private method that moves the pooled bindings from an index onwards after records are inserted or
+        removed. the pool is small, so this is cheap.
+        """
+        self._bound = OrderedDict((index + offset if index >= start else index, widget) for index, widget in self._bound.items())
+
+
+VIRTUAL_STACK_DOC = """
+    The virtual stack widget built on the default backend, see VirtualStackMixin.
+    """
+_virtual_stack_classes: dict[str, type] = {}
+
+def get_virtual_stack_class(backend: str | Backend | None = None) -> type:
+    """
+    gets the VirtualStack class for a backend.
+
+    Args:
+        backend (str | Backend | None, optional): the backend or its name, eg "headless". Defaults to None,
+            the default backend.
+
+    Raises:
+        ValueError: if there is no backend with that name.
+        ModuleNotFoundError: if the toolkit of the backend is not installed.
+
+    Returns:
+        type: the VirtualStack class.
+    """
+    if not isinstance(backend, Backend):
+        backend = get_default_backend() if backend is None else get_backend(backend)
+    virtual_stack_class = _virtual_stack_classes.get(backend.name)
+    if virtual_stack_class is None or virtual_stack_class._backend is not backend:
+        virtual_stack_class = type("VirtualStack", (VirtualStackMixin, backend.frame_class),
+                                   {"_backend": backend, "__module__": __name__, "__doc__": VIRTUAL_STACK_DOC})
+        _virtual_stack_classes[backend.name] = virtual_stack_class
+    return virtual_stack_class
+
+
+def __getattr__(name: str):
+    """
+    picks the default backend the first time VirtualStack is used.
+    """
+    if name != "VirtualStack":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = get_virtual_stack_class()
+    return value
@@ -0,0 +1,91 @@
+"""
+Measures what coalescing saves when switches arrive faster than the screen can show them, eg a held key
+repeating or a data feed calling set_visible_child.
+
+Each frame, --rate / --fps switches are requested with show_next and the event loop is then left to run its
+idle tasks, which is when a coalesced burst is shown. The same input is run with coalescing off and on, and
+the time spent, the pages actually shown and the change_visible_widget callbacks are compared.
+
+Usage:
+    python benchmarks/coalescing.py [--backends headless tkinter] [--rates 60 600 6000] [--fps 60] [--seconds N]
+"""
+import argparse
+import sys
+import time
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, ensure_display
+
+
+RATES = (60, 600, 6_000)
+PAGES = 17 # prime, so a burst never wraps around to the page it started on.
+
+
+def run(harness: BackendHarness, coalesce: bool, rate: int, fps: int, seconds: float, weight: int) -> dict:
+    stack = harness.stack_class(harness.root, children_expandable = True)
+    for _ in range(PAGES):
+        page = harness.page_class(stack)
+        for i in range(weight):
+            harness.page_class(page, width = 10, height = 10).grid(row = 0, column = i)
+        stack.add_widget(page)
+    if coalesce:
+        stack.enable_coalescing()
+
+    callbacks = 0
+    def on_change(event, widget) -> None:
+        nonlocal callbacks
+        callbacks += 1
+    stack.add_callback_function("change_visible_widget", on_change)
+
+    shown = 0
+    def on_grid() -> None:
+        nonlocal shown
+        shown += 1
+    grid_child = stack._grid_child
+    stack._grid_child = lambda child: (on_grid(), grid_child(child))
+
+    frames = int(fps * seconds)
+    per_frame = max(rate // fps, 1)
+    started = time.perf_counter()
+    for _ in range(frames):
+        for _ in range(per_frame):
+            stack.show_next()
+        stack.update_idletasks()
+    elapsed = time.perf_counter() - started
+
+    stack.destroy()
+    return {"requests": frames * per_frame, "shown": shown, "callbacks": callbacks, "ms_per_frame": elapsed / frames * 1e3}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--rates", nargs = "+", type = int, default = list(RATES), help = "switch requests per second")
+    parser.add_argument("--fps", type = int, default = 60)
+    parser.add_argument("--seconds", type = float, default = 2.0, help = "simulated input time per run")
+    parser.add_argument("--weight", type = int, default = 20, help = "child widgets per page")
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            harness.root.deiconify()
+            print(f"\n{name}, {args.fps} fps")
+            print(f"{'rate':>8} {'mode':>10} {'requests':>9} {'shown':>7} {'callbacks':>10} {'ms/frame':>9}")
+            for rate in args.rates:
+                for coalesce in (False, True):
+                    result = run(harness, coalesce, rate, args.fps, args.seconds, args.weight)
+                    print(f"{rate:>8} {'coalesced' if coalesce else 'direct':>10} {result['requests']:>9} "
+                          f"{result['shown']:>7} {result['callbacks']:>10} {result['ms_per_frame']:>9.3f}")
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the cost of navigating with history as the session gets longer.
+Navigation history is a fixed size ring buffer, so the time per navigation and the memory used by the
+history should stay constant however many navigations have been made.
+
+The tkinter and customtkinter backends need a display, under Xvfb if there is none and Xvfb is installed.
+The headless backend always runs, it does not draw, so its numbers only show the Python side.
+
+Usage:
+    python benchmarks/history_cost.py [--backends headless tkinter] [--history N] [--pages N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, ensure_display
+
+
+NAVIGATIONS = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def measure(harness: BackendHarness, history: int, pages: int) -> None:
+    stack = harness.stack_class(harness.root, children_expandable = True, saved_history_length = history)
+    stack.add_widgets((harness.page_class(stack), f"page{i}") for i in range(pages))
+
+    tracemalloc.start()
+    done = 0
+    print(f"{'navigations':>12} {'us/navigation':>14} {'history KiB':>12}")
+    for total in NAVIGATIONS:
+        start = time.perf_counter()
+        for i in range(total - done):
+            if i % 4 == 3:
+                stack.undo()
+            else:
+                stack.show_next()
+        elapsed = time.perf_counter() - start
+        history_size = tracemalloc.get_traced_memory()[0] / 1024
+        print(f"{total:>12} {elapsed / (total - done) * 1e6:>14.2f} {history_size:>12.1f}")
+        done = total
+    tracemalloc.stop()
+
+    stack.destroy()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--history", type = int, default = 50)
+    parser.add_argument("--pages", type = int, default = 100)
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            print(f"\n{name}")
+            measure(harness, args.history, args.pages)
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measures what importing TkinterExtended costs with python -X importtime, in a fresh interpreter for each
+scenario so nothing is already cached in sys.modules.
+
+Scenarios:
+    package     import TkinterExtended, what a tool that only needs the exceptions pays
+    exceptions  from TkinterExtended import NotInStackError
+    headless    using Stack on the headless backend
+    default     using Stack on the default backend, which imports the GUI toolkit
+
+Modules the interpreter imports at startup are left out. Each scenario is run --repeats times and the
+fastest total is reported, with the modules that took the longest. A budget can be given for the package
+scenario so CI fails when the bare import gets slow again.
+
+Usage:
+    python benchmarks/import_cost.py [--repeats N] [--top N] [--budget-ms MS] [--output results.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+SCENARIOS = {
+    "package": "import TkinterExtended",
+    "exceptions": "from TkinterExtended import NotInStackError",
+    "headless": "import TkinterExtended as etk; etk.set_backend('headless'); etk.Stack",
+    "default": "import TkinterExtended as etk; etk.Stack",
+}
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """
+    runs a statement with -X importtime in a new interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: each imported module's own and cumulative import time in microseconds.
+    """
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (repository, os.environ.get("PYTHONPATH"))))}
+    environment.pop("TKINTEREXTENDED_BACKEND", None)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env = environment,
+                               capture_output = True, text = True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def measure(statement: str, repeats: int, top: int, startup: set[str]) -> dict:
+    best = None
+    for _ in range(repeats):
+        times = {module: cost for module, cost in import_times(statement).items() if module not in startup}
+        total = sum(own for own, _ in times.values())
+        if best is None or total < best[0]:
+            best = (total, times)
+    total, times = best
+    slowest = sorted(times.items(), key = lambda item: item[1][0], reverse = True)[:top]
+    return {
+        "statement": statement,
+        "total_ms": total / 1000,
+        "modules": len(times),
+        "package_ms": times.get("TkinterExtended", (0, 0))[1] / 1000,
+        "slowest": [{"module": module, "self_ms": own / 1000, "cumulative_ms": cumulative / 1000}
+                    for module, (own, cumulative) in slowest],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type = int, default = 5)
+    parser.add_argument("--top", type = int, default = 8)
+    parser.add_argument("--budget-ms", type = float, help = "fail if the package scenario takes longer than this")
+    parser.add_argument("--output", help = "write the results to this JSON file")
+    args = parser.parse_args()
+
+    startup = set(import_times("pass")) # modules every interpreter imports before running anything.
+    results = {}
+    for name, statement in SCENARIOS.items():
+        try:
+            results[name] = measure(statement, args.repeats, args.top, startup)
+        except RuntimeError as error:
+            results[name] = {"statement": statement, "error": str(error)}
+            print(f"{name}: failed, {error}")
+            continue
+        result = results[name]
+        print(f"{name}: {result['total_ms']:.1f} ms for {result['modules']} modules ({result['statement']})")
+        for module in result["slowest"]:
+            print(f"    {module['self_ms']:>8.2f} ms  {module['module']}")
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 2)
+
+    package = results.get("package", {})
+    if args.budget_ms is not None and "total_ms" in package and package["total_ms"] > args.budget_ms:
+        print(f"\nimport TkinterExtended took {package['total_ms']:.1f} ms, over the {args.budget_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
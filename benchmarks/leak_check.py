@@ -0,0 +1,109 @@
+"""
+Checks that a long running stack does not leak when its pages are created and destroyed over and over.
+
+Each cycle builds a page, adds it to the stack, registers a weak change_visible_widget callback on an object
+owned by the page, shows it, then destroys the page directly instead of removing it, so the stack has to
+notice through <Destroy>. Memory is sampled with tracemalloc after a warm up and again at the end, along
+with the pages still alive, the stack's records and callbacks, and on Tk backends the number of Tcl commands.
+Everything except memory must be back where it started, and memory may only grow by --max-growth-kb.
+
+Usage:
+    python benchmarks/leak_check.py [--backends headless tkinter] [--cycles N] [--max-growth-kb KB]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, ensure_display
+
+
+class PageController:
+    """
+    stands in for an object owning a page, eg a view model, that listens to the stack through a bound method.
+    """
+    def __init__(self, page) -> None:
+        self.page = page
+        self.shown = 0
+
+    def on_change(self, event, widget) -> None:
+        if widget is self.page:
+            self.shown += 1
+
+
+def sample(harness: BackendHarness, stack) -> dict[str, int]:
+    gc.collect()
+    counts = {
+        "memory": tracemalloc.get_traced_memory()[0],
+        "pages": sum(1 for item in gc.get_objects() if type(item) is harness.page_class),
+        "records": len(stack.children_list),
+        "callbacks": len(stack._callbacks._registrations["change_visible_widget"]),
+    }
+    if harness.name != "headless":
+        counts["tcl_commands"] = len(harness.root.tk.splitlist(harness.root.tk.call("info", "commands")))
+    return counts
+
+
+def run(harness: BackendHarness, cycles: int, warmup: int) -> tuple[dict, dict]:
+    stack = harness.stack_class(harness.root, children_expandable = True)
+    stack.add_widget(harness.page_class(stack), "home") # a page that stays, so the stack is never empty.
+
+    def cycle() -> None:
+        page = harness.page_class(stack)
+        controller = PageController(page)
+        page.controller = controller # the page owns its controller, the stack must not keep either alive.
+        stack.add_widget(page)
+        stack.add_callback_function("change_visible_widget", controller.on_change, weak = True)
+        stack.set_visible_child(page)
+        page.destroy()
+
+    for _ in range(warmup):
+        cycle()
+    before = sample(harness, stack)
+    for _ in range(cycles):
+        cycle()
+    after = sample(harness, stack)
+    stack.destroy()
+    return before, after
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--cycles", type = int, default = 5_000)
+    parser.add_argument("--warmup", type = int, default = 200)
+    parser.add_argument("--max-growth-kb", type = float, default = 64.0, help = "memory growth allowed over all cycles")
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    failures = []
+    tracemalloc.start()
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            before, after = run(harness, args.cycles, args.warmup)
+            harness.destroy()
+
+            growth_kb = (after["memory"] - before["memory"]) / 1024
+            print(f"{name}: {args.cycles} cycles, memory {growth_kb:+.1f} KB, " +
+                  ", ".join(f"{key} {before[key]} -> {after[key]}" for key in before if key != "memory"))
+            if growth_kb > args.max_growth_kb:
+                failures.append(f"{name}: memory grew by {growth_kb:.1f} KB")
+            failures.extend(f"{name}: {key} went from {before[key]} to {after[key]}"
+                            for key in before if key != "memory" and after[key] > before[key])
+    finally:
+        tracemalloc.stop()
+        if xvfb is not None:
+            xvfb.terminate()
+
+    if failures:
+        print("\nleaks found:\n    " + "\n    ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Measures StackSwitcher and StackSidebar against the navigators apps build by hand.
+
+switcher    a row of buttons kept up to date by hand destroys and recreates every button after each
+            add_widget, StackSwitcher creates one. Times are per page added, and per switch.
+sidebar     a hand built list has one button per page, StackSidebar only has --rows. The widget counts,
+            the time per page added and the time per keystroke of typing --query into the filter are
+            compared, the hand built filter scans every title and regrids every matching button.
+
+The tkinter and customtkinter backends need a display, under Xvfb if there is none and Xvfb is installed.
+The headless backend always runs, it does not draw, so its numbers only show the Python side.
+
+Usage:
+    python benchmarks/navigators.py [--backends headless tkinter] [--sizes 10 100 1000] [--sidebar-sizes 1000 10000]
+        [--rows N] [--query TEXT] [--repeats N]
+"""
+import argparse
+import itertools
+import sys
+import time
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, best_of, ensure_display, per_call
+
+import TkinterExtended as etk
+
+
+def hand_switcher(harness: BackendHarness, stack, button_class: type):
+    bar = harness.page_class(harness.root)
+    def rebuild(event, widget) -> None:
+        for button in bar.winfo_children():
+            button.destroy()
+        for child in stack.children_list:
+            button_class(bar, text = child.name, command = lambda name = child.name: stack.set_visible_child(name)).pack(side = "left")
+    stack.add_callback_function("add_widget", rebuild)
+    return bar
+
+
+def measure_switcher(harness: BackendHarness, size: int, repeats: int) -> dict:
+    button_class = etk.get_backend(harness.name).button_class
+    switcher_class = etk.get_stack_switcher_class(harness.name)
+    results = {}
+    for mode in ("by_hand", "switcher"):
+        def add_pages() -> float:
+            stack = harness.stack_class(harness.root, children_expandable = True)
+            bar = hand_switcher(harness, stack, button_class) if mode == "by_hand" else switcher_class(harness.root, stack = stack)
+            pages = harness.new_pages(stack, size)
+            started = time.perf_counter()
+            for i, page in enumerate(pages):
+                stack.add_widget(page, f"page{i}")
+            elapsed = (time.perf_counter() - started) / size * 1e6
+            targets = itertools.cycle((0, size - 1))
+            results[f"{mode}_switch"] = per_call(lambda: stack.set_visible_child(next(targets)), 1_000)
+            bar.destroy()
+            stack.destroy()
+            return elapsed
+        results[f"{mode}_add"] = best_of(repeats, add_pages)
+    return results
+
+
+def measure_sidebar(harness: BackendHarness, size: int, rows: int, query: str, repeats: int) -> dict:
+    button_class = etk.get_backend(harness.name).button_class
+    sidebar_class = etk.get_stack_sidebar_class(harness.name)
+    stack = harness.stack_class(harness.root, children_expandable = True)
+    results = {}
+
+    # by hand, every page has a button and filtering regrids the matching ones.
+    listing = harness.page_class(harness.root)
+    buttons = {}
+    def add_button(event, widget) -> None:
+        buttons[widget] = button_class(listing, text = widget, command = lambda: stack.set_visible_child(widget))
+        buttons[widget].grid(row = len(buttons), column = 0)
+    stack.add_callback_function("add_widget", add_button)
+    started = time.perf_counter()
+    for i in range(size):
+        stack.add_lazy_widget(harness.page_class, f"page {i:05d}")
+    results["by_hand_add"] = (time.perf_counter() - started) / size * 1e6
+    results["by_hand_widgets"] = len(listing.winfo_children())
+    def type_by_hand() -> float:
+        started = time.perf_counter()
+        for end in range(1, len(query) + 1):
+            text = query[:end].casefold()
+            for row, (name, button) in enumerate(buttons.items()):
+                if text in name.casefold():
+                    button.grid(row = row, column = 0)
+                else:
+                    button.grid_remove()
+        return (time.perf_counter() - started) / len(query) * 1e6
+    results["by_hand_keystroke"] = best_of(repeats, type_by_hand)
+    stack.remove_callback_function("add_widget", add_button)
+    listing.destroy()
+    stack.destroy()
+
+    stack = harness.stack_class(harness.root, children_expandable = True)
+    sidebar = sidebar_class(harness.root, stack = stack, rows = rows)
+    started = time.perf_counter()
+    for i in range(size):
+        stack.add_lazy_widget(harness.page_class, f"page {i:05d}")
+    results["sidebar_add"] = (time.perf_counter() - started) / size * 1e6
+    results["sidebar_widgets"] = len(sidebar.winfo_children())
+    def type_in_sidebar() -> float:
+        sidebar.set_filter("")
+        started = time.perf_counter()
+        for end in range(1, len(query) + 1):
+            sidebar.set_filter(query[:end])
+        return (time.perf_counter() - started) / len(query) * 1e6
+    results["sidebar_keystroke"] = best_of(repeats, type_in_sidebar)
+    sidebar.set_filter("")
+    results["sidebar_scroll"] = per_call(lambda: sidebar.yview("scroll", 1, "units"), 1_000)
+    sidebar.destroy()
+    stack.destroy()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--sizes", nargs = "+", type = int, default = [10, 100, 1_000], help = "pages for the switcher")
+    parser.add_argument("--sidebar-sizes", nargs = "+", type = int, default = [1_000, 10_000], help = "pages for the sidebar")
+    parser.add_argument("--rows", type = int, default = 30)
+    parser.add_argument("--query", default = "page 0999", help = "typed into the filter one character at a time")
+    parser.add_argument("--repeats", type = int, default = 3)
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            print(f"\n{name} switcher (us)")
+            print(f"{'pages':>8} {'add by hand':>12} {'add':>10} {'switch by hand':>15} {'switch':>10}")
+            for size in args.sizes:
+                result = measure_switcher(harness, size, args.repeats)
+                print(f"{size:>8} {result['by_hand_add']:>12.1f} {result['switcher_add']:>10.1f} "
+                      f"{result['by_hand_switch']:>15.2f} {result['switcher_switch']:>10.2f}")
+            print(f"\n{name} sidebar, {args.rows} rows, typing {args.query!r} (us)")
+            print(f"{'pages':>8} {'widgets by hand':>16} {'widgets':>8} {'add by hand':>12} {'add':>8} "
+                  f"{'keystroke by hand':>18} {'keystroke':>10} {'scroll':>8}")
+            for size in args.sidebar_sizes:
+                result = measure_sidebar(harness, size, args.rows, args.query, args.repeats)
+                print(f"{size:>8} {result['by_hand_widgets']:>16} {result['sidebar_widgets']:>8} {result['by_hand_add']:>12.1f} "
+                      f"{result['sidebar_add']:>8.1f} {result['by_hand_keystroke']:>18.1f} {result['sidebar_keystroke']:>10.1f} "
+                      f"{result['sidebar_scroll']:>8.2f}")
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
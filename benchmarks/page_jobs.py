@@ -0,0 +1,70 @@
+"""
+Measures the background work saved by page_after, with a dashboard of pages that each refresh on a timer.
+
+Every page does --work-us of busy work every --interval-ms. With plain after every page refreshes all the
+time, with page_after only the visible page does. The user switches page every --switch-ms. The headless
+backend runs the loop on its virtual clock, so the run is instant and the counts are exact, the CPU time is
+the time spent in the refreshes.
+
+Usage:
+    python benchmarks/page_jobs.py [--pages N] [--seconds N] [--interval-ms MS] [--work-us US] [--switch-ms MS]
+"""
+import argparse
+import time
+
+import TkinterExtended as etk
+
+
+def run(managed: bool, pages: int, seconds: float, interval_ms: int, work_us: float, switch_ms: int) -> dict:
+    from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+    root = HeadlessRoot()
+    stack = etk.get_stack_class("headless")(root, children_expandable = True)
+    refreshes = 0
+    busy = 0.0
+
+    def refresh() -> None:
+        nonlocal refreshes, busy
+        refreshes += 1
+        started = time.perf_counter()
+        while time.perf_counter() - started < work_us / 1e6:
+            pass
+        busy += time.perf_counter() - started
+
+    for i in range(pages):
+        page = HeadlessFrame(stack)
+        stack.add_widget(page, f"page{i}")
+        if managed:
+            stack.page_after(page, interval_ms, refresh, repeat = True)
+        else:
+            def loop(page = page) -> None:
+                refresh()
+                page.after(interval_ms, loop)
+            page.after(interval_ms, loop)
+
+    elapsed = 0
+    while elapsed < seconds * 1000:
+        root.loop.advance(switch_ms)
+        elapsed += switch_ms
+        stack.show_next()
+    root.destroy()
+    return {"refreshes": refreshes, "cpu_ms": busy * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type = int, default = 20)
+    parser.add_argument("--seconds", type = float, default = 60.0, help = "virtual time to run for")
+    parser.add_argument("--interval-ms", type = int, default = 250)
+    parser.add_argument("--work-us", type = float, default = 200.0, help = "busy work per refresh")
+    parser.add_argument("--switch-ms", type = int, default = 5_000)
+    args = parser.parse_args()
+
+    etk.set_backend("headless")
+    print(f"{args.pages} pages refreshing every {args.interval_ms} ms for {args.seconds:g} s, switching every {args.switch_ms} ms")
+    for managed in (False, True):
+        result = run(managed, args.pages, args.seconds, args.interval_ms, args.work_us, args.switch_ms)
+        print(f"{'page_after' if managed else 'after':>10}: {result['refreshes']:>7} refreshes, {result['cpu_ms']:>9.1f} ms of CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measures the cost of page accounting, the page weights kept by enable_accounting.
+
+report      the totals of a stack of --pages lazy pages with --widgets widgets each, after every switch,
+            as an app polling its memory would ask for them. walking the whole tree each time is compared
+            with get_accounting_report, which only counts the pages the switch built or evicted.
+switch      the time per switch with accounting off and on, it times each build and show.
+
+The last lines print the heaviest pages of the report, as an example of what it holds.
+
+The tkinter and customtkinter backends need a display, under Xvfb if there is none and Xvfb is installed.
+The headless backend always runs, it does not draw, so its numbers only show the Python side.
+
+Usage:
+    python benchmarks/page_weight.py [--backends headless tkinter] [--pages N] [--widgets N] [--max-live N] [--switches N]
+"""
+import argparse
+import itertools
+import sys
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, ensure_display, per_call
+
+
+def new_stack(harness: BackendHarness, pages: int, widgets: int, max_live: int):
+    stack = harness.stack_class(harness.root, children_expandable = True, max_live_pages = max_live)
+    def factory(master):
+        page = harness.page_class(master)
+        for _ in range(widgets):
+            harness.page_class(page)
+        return page
+    for i in range(pages):
+        stack.add_lazy_widget(factory, f"page{i}")
+    return stack
+
+
+def walk(widget) -> int:
+    return sum(1 + walk(child) for child in widget.winfo_children())
+
+
+def measure(harness: BackendHarness, pages: int, widgets: int, max_live: int, switches: int) -> dict:
+    results = {}
+    stack = new_stack(harness, pages, widgets, max_live)
+    targets = itertools.cycle(range(pages))
+    results["switch_off"] = per_call(lambda: stack.set_visible_child(next(targets)), switches)
+    results["walk"] = per_call(lambda: (stack.set_visible_child(next(targets)), walk(stack)), switches)
+    stack.enable_accounting()
+    results["switch_on"] = per_call(lambda: stack.set_visible_child(next(targets)), switches)
+    results["report"] = per_call(lambda: (stack.set_visible_child(next(targets)), stack.get_accounting_report(False)), switches)
+    harness.root.update_idletasks() # lets the last show be timed.
+    results["report_data"] = stack.get_accounting_report()
+    stack.destroy()
+    # the switch alone is taken off, leaving the cost of the query.
+    results["walk"] -= results["switch_off"]
+    results["report"] -= results["switch_on"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--pages", type = int, default = 200)
+    parser.add_argument("--widgets", type = int, default = 50, help = "widgets in each page")
+    parser.add_argument("--max-live", type = int, default = 20, help = "max_live_pages of the stack")
+    parser.add_argument("--switches", type = int, default = 500)
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            result = measure(harness, args.pages, args.widgets, args.max_live, args.switches)
+            print(f"\n{name}, {args.pages} pages of {args.widgets} widgets, {args.max_live} live (us)")
+            print(f"{'switch':>10} {'switch accounted':>17} {'walk the tree':>14} {'report':>10}")
+            print(f"{result['switch_off']:>10.1f} {result['switch_on']:>17.1f} {result['walk']:>14.1f} {result['report']:>10.1f}")
+            report = result["report_data"]
+            print(f"totals: {report['totals']}")
+            heaviest = sorted(report["pages"], key = lambda page: page["descendants"], reverse = True)[:3]
+            for page in heaviest:
+                # build_ms is None for pages built before accounting was enabled.
+                build_ms = "n/a" if page["build_ms"] is None else f"{page['build_ms']:.2f}"
+                print(f"  {page['page']}: {page['descendants']} widgets, {page['tcl_commands']} Tcl commands, "
+                      f"built {page['builds']} times in {build_ms} ms, {page['shows']} shows")
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+The Stack benchmark suite. Times the hot paths of Stack at stack sizes from 10 to 100k children on every
+backend that can run, writes the results as JSON and compares them against a stored baseline.
+
+Cases:
+    add_by_object, add_by_name          adding pages to a stack of the given size
+    remove_by_object, remove_by_name,
+    remove_by_index                     removing the most recently added pages again
+    switch_by_object, switch_by_name,
+    switch_by_index                     set_visible_child alternating between the first and last page
+    show_next, show_previous            cycling through the stack
+    move_widget, swap_widgets           moving the first page to the end and back, swapping the first and last
+    replace_widget                      replacing the middle page and back, with the page visible
+    clear_stack                         clearing the whole stack, per child
+    fanout_<n>                          a switch with n change_visible_widget listeners, at a fixed size
+
+Times are microseconds per operation, the best of --repeats runs. The comparison looks at how each case
+scales from the smallest to the largest size rather than at absolute times, which depend on the machine,
+so a lookup that becomes O(n) again is caught on any computer. The tkinter and customtkinter backends need
+a display, under Xvfb if there is none and Xvfb is installed. The headless backend always runs.
+
+Usage:
+    python benchmarks/stack_suite.py [--backends headless tkinter customtkinter] [--sizes 10 100 ...]
+        [--output results.json] [--baseline benchmarks/stack_baseline.json] [--save-baseline]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+import TkinterExtended as etk
+
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+FANOUT_LISTENERS = (0, 1, 10, 100, 1_000)
+FANOUT_SIZE = 100
+BACKENDS = ("headless", "tkinter", "customtkinter")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stack_baseline.json")
+
+
+class BackendHarness:
+    """
+    Creates the root, stacks and pages of one backend.
+    """
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stack_class = etk.get_stack_class(name)
+        if name == "headless":
+            from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+            self.root = HeadlessRoot()
+            self.page_class = HeadlessFrame
+        elif name == "tkinter":
+            import tkinter as tk
+            self.root = tk.Tk()
+            self.page_class = tk.Frame
+        else:
+            import customtkinter as ctk
+            self.root = ctk.CTk()
+            self.page_class = ctk.CTkFrame
+        self.root.withdraw()
+
+    def new_stack(self, size: int):
+        stack = self.stack_class(self.root, children_expandable = True)
+        stack.add_widgets((self.page_class(stack), f"page{i}") for i in range(size))
+        return stack
+
+    def new_pages(self, stack, count: int) -> list:
+        return [self.page_class(stack) for _ in range(count)]
+
+    def destroy(self) -> None:
+        self.root.destroy()
+
+
+def best_of(repeats: int, run: callable) -> float:
+    """
+    runs a measurement several times with the garbage collector off, returning the fastest.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            best = min(best, run())
+        finally:
+            gc.enable()
+    return best
+
+
+def per_call(function: callable, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def measure_size(harness: BackendHarness, size: int, operations: int, repeats: int) -> dict[str, float]:
+    results = {}
+    stack = harness.new_stack(size)
+    batch = min(operations, 200)
+
+    def add_then_remove(add_identifier: bool, remove: callable) -> tuple[float, float]:
+        pages = harness.new_pages(stack, batch)
+        names = [f"extra{i}" for i in range(batch)]
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for page, name in zip(pages, names):
+                stack.add_widget(page, name if add_identifier else None)
+            added = time.perf_counter() - start
+            start = time.perf_counter()
+            remove(pages, names)
+            removed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        for page in pages:
+            page.destroy()
+        return added / batch * 1e6, removed / batch * 1e6
+
+    def remove_by_object(pages, names):
+        for page in pages:
+            stack.remove_widget(page)
+
+    def remove_by_name(pages, names):
+        for name in names:
+            stack.remove_widget(name)
+
+    def remove_by_index(pages, names):
+        for _ in pages:
+            stack.remove_widget(len(stack.children_list) - 1)
+
+    add_costs = []
+    for case, add_identifier, remove in (("remove_by_object", False, remove_by_object),
+                                         ("remove_by_name", True, remove_by_name),
+                                         ("remove_by_index", False, remove_by_index)):
+        timings = [add_then_remove(add_identifier, remove) for _ in range(repeats)]
+        results[case] = min(removed for _, removed in timings)
+        add_costs.append((add_identifier, min(added for added, _ in timings)))
+    results["add_by_object"] = min(cost for named, cost in add_costs if not named)
+    results["add_by_name"] = min(cost for named, cost in add_costs if named)
+
+    first, last = stack.children_list[0], stack.children_list[-1]
+    for case, targets in (("switch_by_object", (first.widget, last.widget)),
+                          ("switch_by_name", (first.name, last.name)),
+                          ("switch_by_index", (0, size - 1))):
+        flip = [0]
+        def switch(targets = targets, flip = flip):
+            flip[0] ^= 1
+            stack.set_visible_child(targets[flip[0]])
+        results[case] = best_of(repeats, lambda: per_call(switch, operations))
+
+    results["show_next"] = best_of(repeats, lambda: per_call(stack.show_next, operations))
+    results["show_previous"] = best_of(repeats, lambda: per_call(stack.show_previous, operations))
+
+    flip = [0]
+    def move() -> None:
+        flip[0] ^= 1
+        stack.move_widget(0, size - 1) if flip[0] else stack.move_widget(size - 1, 0)
+    results["move_widget"] = best_of(repeats, lambda: per_call(move, operations))
+    results["swap_widgets"] = best_of(repeats, lambda: per_call(lambda: stack.swap_widgets(0, size - 1), operations))
+
+    middle = size // 2
+    stack.set_visible_child(middle)
+    replacements = [stack.children_list[middle].widget, harness.new_pages(stack, 1)[0]]
+    def replace() -> None:
+        flip[0] ^= 1
+        stack.replace_widget(middle, replacements[flip[0]])
+    results["replace_widget"] = best_of(repeats, lambda: per_call(replace, operations))
+
+    start = time.perf_counter()
+    stack.clear_stack()
+    results["clear_stack"] = (time.perf_counter() - start) / size * 1e6
+    stack.destroy()
+    return results
+
+
+def measure_fanout(harness: BackendHarness, operations: int, repeats: int) -> dict[str, float]:
+    results = {}
+    stack = harness.new_stack(FANOUT_SIZE)
+    calls = [0]
+    def make_listener() -> callable:
+        def listener(event, widget) -> None:
+            calls[0] += 1
+        return listener
+
+    added = 0
+    for listeners in FANOUT_LISTENERS:
+        for _ in range(listeners - added):
+            stack.add_callback_function("change_visible_widget", make_listener())
+        added = listeners
+        results[f"fanout_{listeners}"] = best_of(repeats, lambda: per_call(stack.show_next, max(operations // max(listeners, 1), 20)))
+    stack.destroy()
+    return results
+
+
+def run_backend(name: str, sizes: tuple[int, ...], operations: int, repeats: int) -> dict:
+    harness = BackendHarness(name)
+    try:
+        cases: dict[str, dict[str, float]] = {}
+        for size in sizes:
+            print(f"  {name}: {size} children", file = sys.stderr)
+            for case, cost in measure_size(harness, size, operations, repeats).items():
+                cases.setdefault(case, {})[str(size)] = round(cost, 3)
+        fanout = {case: round(cost, 3) for case, cost in measure_fanout(harness, operations, repeats).items()}
+    finally:
+        harness.destroy()
+    return {"cases": cases, "fanout": fanout}
+
+
+def scaling(costs: dict[str, float]) -> float:
+    """
+    how much slower a case is at the largest size than at the smallest.
+    """
+    sizes = sorted(costs, key = int)
+    return costs[sizes[-1]] / costs[sizes[0]] if costs[sizes[0]] > 0 else 1.0
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    compares the scaling of every case with the baseline, and the fan-out cost per listener.
+
+    Returns:
+        list[str]: a description of each regression.
+    """
+    regressions = []
+    for backend, measured in results["backends"].items():
+        expected = baseline.get("backends", {}).get(backend)
+        if expected is None:
+            continue
+        for case, costs in measured["cases"].items():
+            expected_costs = expected["cases"].get(case, {})
+            common = set(costs) & set(expected_costs) # compare over the sizes both runs measured.
+            if len(common) < 2:
+                continue
+            costs = {size: costs[size] for size in common}
+            now, before = scaling(costs), scaling({size: expected_costs[size] for size in common})
+            # small absolute ratios are noise, a regression has to both grow and be clearly worse than flat.
+            if now > before * tolerance and now > tolerance:
+                regressions.append(f"{backend} {case}: {min(costs, key = int)} to {max(costs, key = int)} children "
+                                   f"scales x{now:.1f}, baseline x{before:.1f}")
+        fanout, expected_fanout = measured["fanout"], expected.get("fanout", {})
+        top = f"fanout_{FANOUT_LISTENERS[-1]}"
+        if top in fanout and top in expected_fanout and "fanout_0" in fanout and "fanout_0" in expected_fanout:
+            now = fanout[top] / max(fanout["fanout_0"], 1e-9)
+            before = expected_fanout[top] / max(expected_fanout["fanout_0"], 1e-9)
+            if now > before * tolerance:
+                regressions.append(f"{backend} fan-out: {FANOUT_LISTENERS[-1]} listeners cost x{now:.1f} a bare switch, "
+                                   f"baseline x{before:.1f}")
+    return regressions
+
+
+def ensure_display() -> subprocess.Popen | None:
+    """
+    starts Xvfb when there is no display and it is installed.
+
+    Returns:
+        subprocess.Popen | None: the Xvfb process to stop afterwards, if one was started.
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin") or shutil.which("Xvfb") is None:
+        return None
+    display = ":97"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+                               stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def backend_unavailable(name: str) -> str | None:
+    """
+    gets why a backend cannot run here, None if it can.
+    """
+    try:
+        etk.get_stack_class(name)
+    except ModuleNotFoundError as error:
+        return f"not installed ({error.name})"
+    if name != "headless" and sys.platform not in ("win32", "darwin") and not os.environ.get("DISPLAY"):
+        return "no display and Xvfb is not installed"
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = list(BACKENDS), choices = BACKENDS)
+    parser.add_argument("--sizes", nargs = "+", type = int, default = list(SIZES))
+    parser.add_argument("--operations", type = int, default = 2_000, help = "operations per timing")
+    parser.add_argument("--repeats", type = int, default = 5)
+    parser.add_argument("--output", help = "write the results to this JSON file")
+    parser.add_argument("--baseline", default = DEFAULT_BASELINE, help = "the baseline to compare against")
+    parser.add_argument("--save-baseline", action = "store_true", help = "store the results as the new baseline")
+    parser.add_argument("--tolerance", type = float, default = 3.0,
+                        help = "how many times worse the scaling of a case may get before it counts as a regression")
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "sizes": sorted(args.sizes),
+            "operations": args.operations,
+            "repeats": args.repeats,
+            "fanout_size": FANOUT_SIZE,
+        },
+        "backends": {},
+        "skipped": {},
+    }
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                results["skipped"][name] = reason
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            results["backends"][name] = run_backend(name, tuple(sorted(args.sizes)), args.operations, args.repeats)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    for name, measured in results["backends"].items():
+        print(f"\n{name} (us per operation)")
+        sizes = results["meta"]["sizes"]
+        print(f"{'case':>18} " + " ".join(f"{size:>9}" for size in sizes) + f" {'scaling':>9}")
+        for case, costs in measured["cases"].items():
+            print(f"{case:>18} " + " ".join(f"{costs[str(size)]:>9.2f}" for size in sizes) + f" {scaling(costs):>8.1f}x")
+        print("  fan-out at", FANOUT_SIZE, "children: " + ", ".join(f"{case[7:]}: {cost:.2f}" for case, cost in measured["fanout"].items()))
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 2)
+            file.write("\n")
+        print(f"\nbaseline saved to {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding = "utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        if regressions:
+            print("\nregressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nno regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measures how long Stack navigation takes as the number of children grows.
+Lookups are indexed, so the cost per switch should stay flat from 10 to 100k children.
+
+The tkinter and customtkinter backends need a display, under Xvfb if there is none and Xvfb is installed.
+The headless backend always runs, it does not draw, so its numbers only show the Python side.
+
+Usage:
+    python benchmarks/switch_latency.py [--backends headless tkinter] [--switches N]
+"""
+import argparse
+import itertools
+import sys
+
+from stack_suite import BACKENDS, SIZES, BackendHarness, backend_unavailable, ensure_display, per_call
+
+
+def measure(harness: BackendHarness, switches: int) -> None:
+    print(f"{'children':>10} {'show_next':>12} {'by name':>12} {'by widget':>12}  (us per switch)")
+    for size in SIZES:
+        stack = harness.new_stack(size)
+        names = itertools.cycle((stack.children_list[0].name, stack.children_list[-1].name))
+        widgets = itertools.cycle((stack.children_list[0].widget, stack.children_list[-1].widget))
+
+        next_cost = per_call(stack.show_next, switches)
+        name_cost = per_call(lambda: stack.set_visible_child(next(names)), switches)
+        widget_cost = per_call(lambda: stack.set_visible_child(next(widgets)), switches)
+        print(f"{size:>10} {next_cost:>12.2f} {name_cost:>12.2f} {widget_cost:>12.2f}")
+
+        stack.destroy()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--switches", type = int, default = 5_000)
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            print(f"\n{name}")
+            measure(harness, args.switches)
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares the switch strategies of Stack (grid, raise and place) on pages of different weights, so each stack
+can use the one that suits its pages.
+
+Each page is a frame holding --weights child widgets laid out in a grid. A switch is set_visible_child
+alternating between two pages that have already been shown, followed by update_idletasks so the geometry
+and redraw work the switch causes is included. Expandable and non expandable pages are measured separately,
+since a page that does not expand is shown over a backdrop with raise and place.
+
+Times are microseconds per switch, the best of --repeats runs. The tkinter and customtkinter backends need a
+display, under Xvfb if there is none and Xvfb is installed. The headless backend does not model geometry
+management, so its numbers only show the Python overhead of each strategy.
+
+Usage:
+    python benchmarks/switch_strategies.py [--backends tkinter headless] [--weights 0 10 100]
+        [--pages N] [--switches N] [--output results.json]
+"""
+import argparse
+import itertools
+import json
+import sys
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, best_of, ensure_display, per_call
+
+from TkinterExtended.widgets.stack import SWITCH_STRATEGIES
+
+
+WEIGHTS = (0, 10, 100)
+COLUMNS = 10 # child widgets per row of a page.
+
+
+def build_page(harness: BackendHarness, stack, weight: int):
+    page = harness.page_class(stack)
+    for i in range(weight):
+        harness.page_class(page, width = 20, height = 10).grid(row = i // COLUMNS, column = i % COLUMNS)
+    return page
+
+
+def measure(harness: BackendHarness, strategy: str, weight: int, expandable: bool, pages: int,
+            switches: int, repeats: int) -> dict[str, float]:
+    stack = harness.stack_class(harness.root, children_expandable = expandable, switch_strategy = strategy)
+    stack.grid(row = 0, column = 0, sticky = "nsew")
+    stack.add_widgets(build_page(harness, stack, weight) for _ in range(pages))
+    stack.update_idletasks()
+
+    first_show = per_call(lambda: (stack.show_next(), stack.update_idletasks()), pages - 1)
+    targets = itertools.cycle((0, pages - 1))
+    def switch() -> None:
+        stack.set_visible_child(next(targets))
+        stack.update_idletasks()
+    cost = best_of(repeats, lambda: per_call(switch, switches))
+
+    stack.destroy()
+    return {"first_show": first_show, "switch": cost}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["tkinter", "headless"], choices = BACKENDS)
+    parser.add_argument("--weights", nargs = "+", type = int, default = list(WEIGHTS), help = "child widgets per page")
+    parser.add_argument("--pages", type = int, default = 20, help = "pages in each stack")
+    parser.add_argument("--switches", type = int, default = 500, help = "switches per timing")
+    parser.add_argument("--repeats", type = int, default = 5)
+    parser.add_argument("--output", help = "write the results to this JSON file")
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    results = {}
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            harness.root.deiconify() # a withdrawn root is never mapped, so nothing would be laid out.
+            results[name] = {
+                f"{strategy}{'' if expandable else '_fixed'}_{weight}": measure(harness, strategy, weight, expandable,
+                                                                           args.pages, args.switches, args.repeats)
+                for weight in args.weights for expandable in (True, False) for strategy in SWITCH_STRATEGIES
+            }
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    for name, measured in results.items():
+        print(f"\n{name} (us per switch, first show in brackets)")
+        print(f"{'weight':>8} {'pages':>10} " + " ".join(f"{strategy:>20}" for strategy in SWITCH_STRATEGIES))
+        for weight in args.weights:
+            for expandable in (True, False):
+                costs = [measured[f"{strategy}{'' if expandable else '_fixed'}_{weight}"] for strategy in SWITCH_STRATEGIES]
+                cells = " ".join(f"{cost['switch']:>10.2f} ({cost['first_show']:>7.1f})" for cost in costs)
+                print(f"{weight:>8} {'expanding' if expandable else 'fixed':>10} {cells}")
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 2)
+
+
+if __name__ == "__main__":
+    main()
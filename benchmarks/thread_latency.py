@@ -0,0 +1,80 @@
+"""
+Measures the latency and throughput of Stack commands sent from worker threads.
+A worker thread sends bursts of set_visible_child_threadsafe calls while the main loop runs, then
+the stack's command queue statistics are printed.
+
+The tkinter and customtkinter backends need a display, under Xvfb if there is none and Xvfb is installed.
+The headless backend always runs, its mainloop follows the real clock so the worker threads are timed the
+same way, but it does not draw, so its numbers only show the Python side.
+
+Usage:
+    python benchmarks/thread_latency.py [--backends headless tkinter] [--commands N] [--workers N] [--pages N]
+"""
+import argparse
+import sys
+import threading
+import time
+
+from stack_suite import BACKENDS, BackendHarness, backend_unavailable, ensure_display
+
+
+def measure(harness: BackendHarness, commands: int, workers: int, pages: int) -> None:
+    root = harness.root
+    stack = harness.new_stack(pages)
+    stack.enable_thread_safe_calls()
+
+    futures = []
+    def worker(offset: int) -> None:
+        for i in range(commands // workers):
+            futures.append(stack.set_visible_child_threadsafe(f"page{(i + offset) % pages}"))
+            if i % 100 == 0:
+                time.sleep(0.001) # bursts, like a socket reader would produce.
+
+    threads = [threading.Thread(target = worker, args = (i,)) for i in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    def check_finished() -> None:
+        if any(thread.is_alive() for thread in threads) or not all(future.done() for future in futures):
+            root.after(10, check_finished)
+            return
+        elapsed = time.perf_counter() - start
+        stats = stack.get_thread_call_stats()
+        print(f"{len(futures)} commands from {workers} threads in {elapsed:.3f}s "
+              f"({len(futures) / elapsed:,.0f} commands/s end to end)")
+        for key, value in stats.items():
+            print(f"  {key}: {value:,.3f}" if isinstance(value, float) else f"  {key}: {value}")
+        root.quit()
+
+    root.after(10, check_finished)
+    root.mainloop()
+    stack.destroy()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs = "+", default = ["headless", "tkinter"], choices = BACKENDS)
+    parser.add_argument("--commands", type = int, default = 20_000)
+    parser.add_argument("--workers", type = int, default = 4)
+    parser.add_argument("--pages", type = int, default = 100)
+    args = parser.parse_args()
+
+    xvfb = ensure_display() if any(name != "headless" for name in args.backends) else None
+    try:
+        for name in args.backends:
+            reason = backend_unavailable(name)
+            if reason is not None:
+                print(f"skipping {name}: {reason}", file = sys.stderr)
+                continue
+            harness = BackendHarness(name)
+            print(f"\n{name}")
+            measure(harness, args.commands, args.workers, args.pages)
+            harness.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
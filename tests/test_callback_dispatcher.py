@@ -0,0 +1,99 @@
+"""
+Checks how CallbackDispatcher calls callbacks, it does not need a backend.
+
+Run with:
+    python -m pytest tests
+"""
+import gc
+import unittest
+import warnings
+
+from TkinterExtended.widgets.callback_dispatcher import CallbackDispatcher
+
+
+class Listener:
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+
+    def on_change(self, event, widget) -> None:
+        self.calls.append(widget)
+
+
+class CallbackDispatcherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dispatcher = CallbackDispatcher(("change",))
+        self.calls = []
+
+    def test_callbacks_are_passed_only_what_they_accept(self) -> None:
+        self.dispatcher.add("change", lambda event, widget: self.calls.append(("both", event, widget)))
+        self.dispatcher.add("change", lambda **kwargs: self.calls.append(("all", kwargs)))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.dispatcher.add("change", lambda widget: self.calls.append(("widget", widget)))
+            self.dispatcher.add("change", lambda: self.calls.append(("none",)))
+        self.dispatcher.dispatch("change", widget = "page", origin = "home")
+        self.assertEqual(self.calls, [("both", "change", "page"), ("all", {"widget": "page", "origin": "home", "event": "change"}),
+                                      ("widget", "page"), ("none",)])
+
+    def test_callbacks_without_event_and_widget_warn(self) -> None:
+        with self.assertWarns(UserWarning):
+            self.dispatcher.add("change", lambda widget: None)
+
+    def test_priority_then_order(self) -> None:
+        for name, priority in (("low", -1), ("first", 0), ("high", 5), ("second", 0)):
+            self.dispatcher.add("change", lambda event, widget, name = name: self.calls.append(name), priority = priority)
+        self.dispatcher.dispatch("change", widget = None)
+        self.assertEqual(self.calls, ["high", "first", "second", "low"])
+
+    def test_adding_again_updates_the_priority(self) -> None:
+        first = lambda event, widget: self.calls.append("first")
+        second = lambda event, widget: self.calls.append("second")
+        self.dispatcher.add("change", first)
+        self.dispatcher.add("change", second)
+        self.dispatcher.dispatch("change", widget = None)
+        self.dispatcher.add("change", second, priority = 1)
+        self.dispatcher.dispatch("change", widget = None)
+        self.assertEqual(self.calls, ["first", "second", "second", "first"])
+        self.assertEqual(self.dispatcher.get("change"), {first, second})
+
+    def test_weak_callbacks_are_dropped_with_their_owner(self) -> None:
+        listener = Listener(self.calls)
+        self.dispatcher.add("change", listener.on_change, weak = True)
+        self.dispatcher.dispatch("change", widget = 1)
+        del listener
+        gc.collect()
+        self.dispatcher.dispatch("change", widget = 2)
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(self.dispatcher.get("change"), set())
+        self.assertEqual(self.dispatcher._registrations["change"], {})
+
+    def test_removing_weak_callbacks(self) -> None:
+        listener = Listener(self.calls)
+        self.dispatcher.add("change", listener.on_change, weak = True)
+        self.dispatcher.remove("change", listener.on_change)
+        self.dispatcher.dispatch("change", widget = 1)
+        self.assertEqual(self.calls, [])
+
+    def test_changes_while_dispatching_apply_next_time(self) -> None:
+        def late(event, widget) -> None:
+            self.calls.append("late")
+        def adder(event, widget) -> None:
+            self.calls.append("adder")
+            self.dispatcher.add("change", late)
+        self.dispatcher.add("change", adder)
+        self.dispatcher.dispatch("change", widget = None)
+        self.assertEqual(self.calls, ["adder"])
+        self.dispatcher.dispatch("change", widget = None)
+        self.assertEqual(self.calls, ["adder", "adder", "late"])
+
+    def test_invalid_events_and_callbacks(self) -> None:
+        with self.assertRaises(ValueError):
+            self.dispatcher.dispatch("missing")
+        with self.assertRaises(ValueError):
+            self.dispatcher.add("missing", lambda event, widget: None)
+        with self.assertRaises(TypeError):
+            self.dispatcher.add("change", "not callable")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Checks that the headless backend keeps the state Tk would and runs timers on its virtual clock.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+from unittest import mock
+
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot, TclError
+
+
+class HeadlessEventLoopTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.calls = []
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_timers_fire_in_due_order_on_the_virtual_clock(self) -> None:
+        self.root.after(30, self.calls.append, "late")
+        self.root.after(10, self.calls.append, "early")
+        self.root.after_idle(self.calls.append, "idle")
+        self.root.loop.advance(20)
+        self.assertEqual(self.calls, ["idle", "early"])
+        self.assertEqual(self.root.loop.now(), 20)
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.calls, ["idle", "early", "late"])
+        self.assertEqual(self.root.loop.pending(), 0)
+
+    def test_cancelled_jobs_do_not_run(self) -> None:
+        job = self.root.after(10, self.calls.append, "cancelled")
+        self.root.after_cancel(job)
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.calls, [])
+        with self.assertRaises(ValueError):
+            self.root.after_cancel("")
+
+    def test_limit_stops_callbacks_that_reschedule_themselves(self) -> None:
+        def tick() -> None:
+            self.calls.append(self.root.loop.now())
+            self.root.after(10, tick)
+        tick()
+        self.root.loop.run_until_idle(limit_ms = 35)
+        self.assertEqual(self.calls, [0, 10, 20, 30])
+
+    def test_callback_errors_are_reported_and_the_loop_goes_on(self) -> None:
+        self.root.after_idle(lambda: 1 / 0)
+        self.root.after_idle(self.calls.append, "after")
+        with mock.patch.object(self.root, "report_callback_exception") as report:
+            self.root.update_idletasks()
+        self.assertIs(report.call_args.args[0], ZeroDivisionError)
+        self.assertEqual(self.calls, ["after"])
+
+
+class HeadlessWidgetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.frame = HeadlessFrame(self.root)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_geometry_managers(self) -> None:
+        page = HeadlessFrame(self.frame)
+        page.grid(row = 1, sticky = "news")
+        self.assertEqual((page.winfo_manager(), page.grid_info()["sticky"]), ("grid", "nesw"))
+        page.grid_remove()
+        page.grid()
+        self.assertEqual(page.grid_info()["row"], 1) # grid_remove keeps the options.
+        with self.assertRaises(TclError):
+            HeadlessFrame(self.frame).pack()
+        page.place(relx = 0.5)
+        self.assertEqual(page.winfo_manager(), "place")
+
+    def test_mapping_follows_the_root(self) -> None:
+        self.frame.pack()
+        self.assertFalse(self.frame.winfo_ismapped())
+        self.root.update_idletasks()
+        self.assertTrue(self.frame.winfo_ismapped())
+        self.frame.pack_forget()
+        self.assertFalse(self.frame.winfo_ismapped())
+
+    def test_stacking_order(self) -> None:
+        first, second = HeadlessFrame(self.frame), HeadlessFrame(self.frame)
+        first.lift()
+        self.assertEqual(self.frame.winfo_children(), [second, first])
+        first.lower()
+        self.assertEqual(self.frame.winfo_children(), [first, second])
+
+    def test_destroyed_widgets_raise_tcl_error(self) -> None:
+        child = HeadlessFrame(self.frame)
+        destroyed = []
+        self.frame.bind("<Destroy>", lambda event: destroyed.append(event.widget), "+")
+        self.frame.destroy()
+        self.assertEqual(destroyed, [self.frame])
+        self.assertFalse(child.winfo_exists())
+        with self.assertRaises(TclError):
+            child.winfo_manager()
+        with self.assertRaises(TclError):
+            HeadlessFrame(self.frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
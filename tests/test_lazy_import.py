@@ -0,0 +1,71 @@
+"""
+Checks that importing the package does not load the widgets or a toolkit, and how the default backend is
+chosen. Each check runs in a fresh interpreter, since both are decided once per process.
+
+Run with:
+    python -m pytest tests
+"""
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code: str, **environment: str) -> subprocess.CompletedProcess:
+    env = {name: value for name, value in os.environ.items() if name != "TKINTEREXTENDED_BACKEND"}
+    env.update(PYTHONPATH = PACKAGE_ROOT, **environment)
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], env = env, capture_output = True, text = True)
+
+
+class LazyImportTest(unittest.TestCase):
+    def check(self, code: str, **environment: str) -> str:
+        result = run(code, **environment)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_import_loads_no_widgets_or_toolkit(self) -> None:
+        output = self.check("""
+            import sys
+            import TkinterExtended
+            print(sorted(name for name in ("tkinter", "customtkinter", "TkinterExtended.widgets.stack") if name in sys.modules))
+        """)
+        self.assertEqual(output, "[]")
+
+    def test_environment_variable_chooses_the_backend(self) -> None:
+        output = self.check("""
+            import TkinterExtended as etk
+            print(etk.Stack._backend.name)
+        """, TKINTEREXTENDED_BACKEND = "headless")
+        self.assertEqual(output, "headless")
+
+    def test_set_backend_cannot_change_a_backend_in_use(self) -> None:
+        output = self.check("""
+            import TkinterExtended as etk
+            etk.set_backend("headless")
+            etk.Stack
+            try:
+                etk.set_backend("tkinter")
+            except RuntimeError:
+                print("refused")
+        """)
+        self.assertEqual(output, "refused")
+
+    def test_missing_toolkits_are_not_hidden(self) -> None:
+        output = self.check("""
+            import sys
+            sys.modules["tkinter"] = sys.modules["customtkinter"] = None # neither can be imported.
+            import TkinterExtended as etk
+            try:
+                etk.Stack
+            except ModuleNotFoundError as error:
+                print("headless" in str(error))
+        """)
+        self.assertEqual(output, "True")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Checks batched changes, which send each event once with the list of widgets, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackBatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.events = []
+        for event in ("add_widget", "remove_widget", "change_visible_widget"):
+            self.stack.add_callback_function(event, self.on_event)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def on_event(self, event, widget) -> None:
+        self.events.append((event, widget)) # each event is sent once per batch, so they can be compared as a dict.
+
+    def test_add_widgets_sends_one_event(self) -> None:
+        pages = [HeadlessFrame(self.stack) for _ in range(3)]
+        self.stack.add_widgets([(pages[0], "a"), (pages[1], "b", False), pages[2]])
+        self.assertEqual(dict(self.events), {"add_widget": pages, "change_visible_widget": [pages[0]]})
+        self.assertEqual([child.name for child in self.stack.children_list], ["a", "b", None])
+        self.assertFalse(self.stack.children_list[1].expandable)
+
+    def test_add_widgets_checks_everything_first(self) -> None:
+        page = HeadlessFrame(self.stack)
+        with self.assertRaises(etk.DuplicateNameError):
+            self.stack.add_widgets([(page, "a"), (HeadlessFrame(self.stack), "a")])
+        with self.assertRaises(etk.WidgetAlreadyInStackError):
+            self.stack.add_widgets([page, page])
+        self.assertEqual(self.stack.get_stack_size(), 0)
+        self.assertEqual(self.events, [])
+
+    def test_remove_widgets_reselects_once(self) -> None:
+        pages = [HeadlessFrame(self.stack) for _ in range(4)]
+        self.stack.add_widgets(pages)
+        self.events.clear()
+        self.stack.remove_widgets([pages[0], 1, pages[0]])
+        self.assertEqual(dict(self.events), {"remove_widget": [pages[0], 1], "change_visible_widget": [pages[2]]})
+        self.assertIs(self.stack.get_visible_child(), pages[2])
+        self.assertFalse(self.stack.is_widget_in_stack(pages[1]))
+
+    def test_events_are_held_until_the_outer_batch_ends(self) -> None:
+        first, second = HeadlessFrame(self.stack), HeadlessFrame(self.stack)
+        with self.stack.batch():
+            self.stack.add_widget(first, "first")
+            with self.stack.batch():
+                self.stack.add_widget(second, "second")
+                self.stack.set_visible_child("second")
+            self.assertEqual(self.events, [])
+        self.assertEqual(dict(self.events), {"add_widget": [first, second], "change_visible_widget": [first, "second"]})
+
+    def test_batched_changes_are_applied_straight_away(self) -> None:
+        with self.stack.batch():
+            self.stack.add_widget(HeadlessFrame(self.stack), "page")
+            self.assertEqual(self.stack.get_stack_size(), 1)
+            self.assertIsNotNone(self.stack.get_visible_child())
+
+
+if __name__ == "__main__":
+    unittest.main()
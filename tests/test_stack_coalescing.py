@@ -0,0 +1,120 @@
+"""
+Checks coalesced navigation, and how it works with the history, lazy pages and transitions, on the headless
+backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackCoalescingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.pages = [HeadlessFrame(self.stack) for _ in range(4)]
+        for i, page in enumerate(self.pages):
+            self.stack.add_widget(page, f"page{i}")
+        self.events = []
+        self.stack.add_callback_function("change_visible_widget", self.on_change)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def on_change(self, event, widget, origin, destination) -> None:
+        self.events.append((origin, destination))
+
+    def test_burst_shows_the_last_request_once(self) -> None:
+        stack = self.stack
+        stack.enable_coalescing()
+        for i in (1, 2, 3):
+            stack.set_visible_child(f"page{i}")
+        self.assertIs(stack.get_visible_child(), self.pages[0])
+        self.root.update_idletasks()
+        self.assertIs(stack.get_visible_child(), self.pages[3])
+        self.assertEqual(self.events, [(self.pages[0], self.pages[3])])
+        self.assertEqual(stack.get_coalescing_stats()["coalesced_requests"], 2)
+
+    def test_burst_ending_where_it_started_does_nothing(self) -> None:
+        stack = self.stack
+        stack.enable_coalescing()
+        stack.set_visible_child("page2")
+        stack.set_visible_child("page0")
+        self.root.update_idletasks()
+        self.assertIs(stack.get_visible_child(), self.pages[0])
+        self.assertEqual(self.events, [])
+
+    def test_undo_and_redo_are_not_coalesced(self) -> None:
+        stack = self.stack
+        stack.set_visible_child("page1")
+        stack.set_visible_child("page2")
+        stack.enable_coalescing()
+
+        stack.undo()
+        self.assertIs(stack.get_visible_child(), self.pages[1])
+        self.root.update_idletasks()
+        self.assertEqual(stack.stack_history.entries(), [stack._get_child(page) for page in self.pages[:3]])
+        self.assertTrue(stack.can_go_forward())
+
+        stack.redo()
+        self.root.update_idletasks()
+        self.assertIs(stack.get_visible_child(), self.pages[2])
+        self.assertEqual(self.events[-2:], [(self.pages[2], self.pages[1]), (self.pages[1], self.pages[2])])
+
+    def test_undo_drops_the_pending_burst(self) -> None:
+        stack = self.stack
+        stack.set_visible_child("page1")
+        stack.enable_coalescing()
+        stack.set_visible_child("page3")
+        stack.undo()
+        self.root.update_idletasks()
+        self.assertIs(stack.get_visible_child(), self.pages[0])
+        self.assertTrue(stack.can_go_forward())
+
+    def test_restore_drops_the_pending_burst(self) -> None:
+        stack = self.stack
+        stack.set_visible_child("page2")
+        snapshot = stack.snapshot()
+        stack.set_visible_child("page0")
+        stack.enable_coalescing()
+        stack.set_visible_child("page3")
+        stack.restore(snapshot)
+        self.root.update_idletasks()
+        self.assertIs(stack.get_visible_child(), self.pages[2])
+        self.assertEqual(self.events[-1], (self.pages[0], self.pages[2]))
+
+    def test_pages_passed_through_are_not_built(self) -> None:
+        stack = self.stack
+        for name in ("lazy1", "lazy2", "lazy3"):
+            stack.add_lazy_widget(HeadlessFrame, name)
+        stack.enable_coalescing()
+        for name in ("lazy1", "lazy2", "lazy3"):
+            stack.set_visible_child(name)
+        self.root.update_idletasks()
+        self.assertEqual([stack._get_child(name).widget is not None for name in ("lazy1", "lazy2", "lazy3")],
+                         [False, False, True])
+        self.assertEqual(stack.stack_history.entries(), [stack._get_child("page0"), stack._get_child("lazy3")])
+
+    def test_burst_runs_one_transition(self) -> None:
+        stack = self.stack
+        stack.pack()
+        self.root.update_idletasks()
+        stack.set_transition("slide_left", duration_ms = 100)
+        stack.enable_coalescing()
+        for i in (1, 2, 3):
+            stack.set_visible_child(f"page{i}")
+        self.root.update_idletasks()
+        self.assertEqual([page.winfo_manager() for page in self.pages], ["place", "", "", "place"])
+        self.root.loop.advance(100)
+        self.assertEqual([page.winfo_manager() for page in self.pages], ["", "", "", "grid"])
+        self.assertEqual(stack.get_transition_stats()["transitions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
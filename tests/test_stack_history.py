@@ -0,0 +1,121 @@
+"""
+Checks the navigation history and undo and redo, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+from TkinterExtended.widgets.navigation_history import NavigationHistory
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class NavigationHistoryTest(unittest.TestCase):
+    def test_oldest_entries_are_overwritten(self) -> None:
+        history = NavigationHistory(3)
+        for entry in "abcd":
+            history.push(entry)
+        self.assertEqual(history.entries(), ["b", "c", "d"])
+        self.assertEqual((history.back(), history.back(), history.back()), ("c", "b", None))
+
+    def test_pushing_after_going_back_drops_the_forward_entries(self) -> None:
+        history = NavigationHistory(5)
+        for entry in "abc":
+            history.push(entry)
+        history.back()
+        history.push("d")
+        self.assertEqual(history.entries(), ["a", "b", "d"])
+        self.assertFalse(history.can_go_forward())
+
+    def test_entries_equal_to_the_current_one_are_skipped(self) -> None:
+        history = NavigationHistory(5)
+        a, b = object(), object()
+        for entry in (a, b, a):
+            history.push(entry)
+        self.assertFalse(history.can_go_back(lambda entry: entry is not b)) # only a, the current page, is left.
+        self.assertIs(history.back(), b)
+
+    def test_resize_keeps_the_entries_nearest_the_cursor(self) -> None:
+        history = NavigationHistory(5)
+        for entry in "abcde":
+            history.push(entry)
+        history.back()
+        history.resize(3)
+        self.assertEqual((history.entries(), history.current), (["b", "c", "d"], "d"))
+        history.move_to(0)
+        self.assertEqual((history.current, history.position), ("b", 0))
+        with self.assertRaises(ValueError):
+            history.resize(0)
+
+
+class StackHistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True, saved_history_length = 4)
+        self.pages = {name: HeadlessFrame(self.stack) for name in "abcde"}
+        for name, page in self.pages.items():
+            self.stack.add_widget(page, name)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def visible(self) -> str:
+        return self.stack._visible_record.name
+
+    def test_undo_and_redo(self) -> None:
+        self.assertFalse(self.stack.can_go_back())
+        for name in "bc":
+            self.stack.set_visible_child(name)
+        self.stack.undo()
+        self.assertEqual(self.visible(), "b")
+        self.stack.undo()
+        self.assertEqual(self.visible(), "a")
+        self.stack.undo() # nothing earlier, does nothing.
+        self.assertEqual(self.visible(), "a")
+        self.stack.redo()
+        self.stack.redo()
+        self.assertEqual(self.visible(), "c")
+        self.assertFalse(self.stack.can_go_forward())
+
+    def test_history_is_bounded(self) -> None:
+        for name in "bcdebcde":
+            self.stack.set_visible_child(name)
+        self.assertEqual(len(self.stack.stack_history), 4)
+        self.stack.saved_history_length = 2
+        self.assertEqual([child.name for child in self.stack.stack_history.entries()], ["d", "e"])
+
+    def test_removed_pages_are_skipped(self) -> None:
+        for name in "bcd":
+            self.stack.set_visible_child(name)
+        self.stack.remove_widget("c")
+        self.stack.undo()
+        self.assertEqual(self.visible(), "b")
+
+    def test_entries_follow_moved_pages(self) -> None:
+        self.stack.set_visible_child("b")
+        self.stack.move_widget("a", 4)
+        self.stack.undo()
+        self.assertEqual(self.visible(), "a")
+
+    def test_undo_sends_change_visible_widget(self) -> None:
+        events = []
+        self.stack.set_visible_child("b")
+        self.stack.add_callback_function("change_visible_widget",
+                                         lambda event, widget, origin, destination: events.append((origin, destination)))
+        self.stack.undo()
+        self.assertEqual(events, [(self.pages["b"], self.pages["a"])])
+
+    def test_clear_history_keeps_the_visible_page(self) -> None:
+        for name in "bc":
+            self.stack.set_visible_child(name)
+        self.stack.clear_history()
+        self.assertFalse(self.stack.can_go_back())
+        self.assertEqual([child.name for child in self.stack.stack_history.entries()], ["c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
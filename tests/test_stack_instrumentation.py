@@ -0,0 +1,107 @@
+"""
+Checks the opt-in timing of stack operations and callbacks, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import gc
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class Listener:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def on_change(self, event, widget) -> None:
+        self.calls += 1
+
+
+def slow_callback(event, widget) -> None:
+    time.sleep(0.002)
+
+
+class StackInstrumentationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        for i in range(3):
+            self.stack.add_widget(HeadlessFrame(self.stack), f"page{i}")
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy")
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_operations_and_callbacks_are_timed(self) -> None:
+        self.stack.add_callback_function("change_visible_widget", slow_callback)
+        self.stack.enable_instrumentation()
+        self.stack.set_visible_child("page1")
+        self.stack.show_next()
+        self.stack.set_visible_child("lazy")
+        self.root.update_idletasks()
+
+        stats = self.stack.get_instrumentation_stats()
+        operations = stats["operations"]
+        self.assertEqual(operations["set_visible_child"]["count"], 3) # show_next switches through it.
+        self.assertEqual(operations["show_next"]["count"], 1)
+        self.assertEqual(operations["build_page"]["count"], 1)
+        self.assertEqual(operations["dispatch:change_visible_widget"]["count"], 3)
+        self.assertGreaterEqual(stats["callbacks"]["slow_callback"]["min_ms"], 2)
+        self.assertGreaterEqual(stats["idle_after_switch"]["count"], 1)
+
+    def test_stalls_name_the_slowest_callback(self) -> None:
+        self.stack.add_callback_function("change_visible_widget", slow_callback)
+        self.stack.enable_instrumentation(stall_threshold_ms = 1)
+        self.stack.set_visible_child("page2")
+        stall = next(stall for stall in self.stack.get_instrumentation_stats()["stalls"] if stall["operation"] == "set_visible_child")
+        self.assertEqual(stall["culprit"], "slow_callback")
+        self.assertGreaterEqual(stall["culprit_ms"], 2)
+
+    def test_weak_callbacks_are_timed_and_still_dropped(self) -> None:
+        listener = Listener()
+        self.stack.add_callback_function("change_visible_widget", listener.on_change, weak = True)
+        self.stack.enable_instrumentation()
+        self.stack.set_visible_child("page1")
+        self.assertEqual(listener.calls, 1)
+        self.assertIn("Listener.on_change", self.stack.get_instrumentation_stats()["callbacks"])
+        del listener
+        gc.collect()
+        self.stack.set_visible_child("page2")
+        self.assertEqual(self.stack._callbacks._registrations["change_visible_widget"], {})
+
+    def test_export_trace(self) -> None:
+        self.stack.enable_instrumentation()
+        self.stack.set_visible_child("page1")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            trace = self.stack.export_trace(path)
+            with open(path, encoding = "utf-8") as file:
+                self.assertEqual(json.load(file), trace)
+        names = {event["name"] for event in trace["traceEvents"]}
+        self.assertIn("set_visible_child", names)
+        self.assertTrue(all(event["ph"] == "X" for event in trace["traceEvents"]))
+
+    def test_disabling_restores_the_stack(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.stack.get_instrumentation_stats()
+        self.stack.enable_instrumentation()
+        self.stack.set_visible_child("page1")
+        self.stack.disable_instrumentation()
+        self.assertNotIn("set_visible_child", vars(self.stack))
+        self.assertNotIn("dispatch", vars(self.stack._callbacks))
+        self.assertEqual(self.root.loop._jobs, {})
+        with self.assertRaises(RuntimeError):
+            self.stack.export_trace()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Checks lazy pages, which are only built from their factory when first shown, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class CountingFactory:
+    """
+    builds a page each time it is called and remembers how many it built.
+    """
+    def __init__(self) -> None:
+        self.built = []
+
+    def __call__(self, master) -> HeadlessFrame:
+        page = HeadlessFrame(master)
+        self.built.append(page)
+        return page
+
+
+class StackLazyPageTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.stack.add_widget(HeadlessFrame(self.stack), "home")
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_page_is_built_when_first_shown(self) -> None:
+        factory = CountingFactory()
+        self.stack.add_lazy_widget(factory, "lazy")
+        self.assertEqual(factory.built, [])
+        self.assertEqual(self.stack.get_stack_size(), 2)
+
+        self.stack.set_visible_child("lazy")
+        self.assertEqual(len(factory.built), 1)
+        self.assertIs(self.stack.get_visible_child(), factory.built[0])
+        self.assertIs(factory.built[0].master, self.stack)
+
+        self.stack.set_visible_child("home")
+        self.stack.set_visible_child("lazy")
+        self.assertEqual(len(factory.built), 1)
+
+    def test_first_page_added_is_built_straight_away(self) -> None:
+        stack = Stack(self.root)
+        factory = CountingFactory()
+        stack.add_lazy_widget(factory, "first")
+        self.assertIs(stack.get_visible_child(), factory.built[0])
+
+    def test_events_name_unbuilt_pages(self) -> None:
+        added = []
+        self.stack.add_callback_function("add_widget", lambda event, widget: added.append(widget))
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy")
+        self.assertEqual(added, ["lazy"])
+
+    def test_generator_factory(self) -> None:
+        def factory(master):
+            page = HeadlessFrame(master)
+            yield
+            HeadlessFrame(page)
+            return page
+
+        self.stack.add_lazy_widget(factory, "generated")
+        self.stack.set_visible_child("generated")
+        self.assertEqual(len(self.stack.get_visible_child().winfo_children()), 1)
+
+    def test_invalid_pages_are_rejected(self) -> None:
+        with self.assertRaises(TypeError):
+            self.stack.add_lazy_widget("not callable", "page")
+        with self.assertRaises(etk.DuplicateNameError):
+            self.stack.add_lazy_widget(HeadlessFrame, "home")
+
+    def test_unbuilt_page_can_be_removed(self) -> None:
+        factory = CountingFactory()
+        self.stack.add_lazy_widget(factory, "lazy")
+        self.stack.remove_widget("lazy")
+        self.assertEqual([child.name for child in self.stack.children_list], ["home"])
+        self.assertEqual(factory.built, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
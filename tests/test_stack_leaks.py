@@ -0,0 +1,95 @@
+"""
+Checks that stacks do not leak, on the headless backend so it runs without a display.
+
+Run with:
+    python -m pytest tests
+"""
+import gc
+import tempfile
+import os
+import unittest
+import weakref
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class PageController:
+    """
+    stands in for an object owning a page, eg a view model, that listens to the stack through a bound method.
+    """
+    def __init__(self, page) -> None:
+        self.page = page
+
+    def on_change(self, event, widget) -> None:
+        pass
+
+
+def count_pages() -> int:
+    gc.collect()
+    return sum(1 for item in gc.get_objects() if type(item) is HeadlessFrame)
+
+
+class StackLeakTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_destroyed_pages_are_released(self) -> None:
+        stack = Stack(self.root, children_expandable = True)
+        stack.add_widget(HeadlessFrame(stack), "home")
+
+        def cycle() -> None:
+            page = HeadlessFrame(stack)
+            page.controller = PageController(page) # the page owns its controller, the stack must not keep either alive.
+            stack.add_widget(page)
+            stack.add_callback_function("change_visible_widget", page.controller.on_change, weak = True)
+            stack.set_visible_child(page)
+            page.destroy() # the stack has to notice through <Destroy>.
+
+        for _ in range(50):
+            cycle()
+        pages, records = count_pages(), len(stack.children_list)
+        callbacks = len(stack._callbacks._registrations["change_visible_widget"])
+        for _ in range(500):
+            cycle()
+        self.assertLessEqual(count_pages(), pages)
+        self.assertLessEqual(len(stack.children_list), records)
+        self.assertLessEqual(len(stack._callbacks._registrations["change_visible_widget"]), callbacks)
+        stack.destroy()
+
+    def test_destroy_releases_the_stack(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            stack = Stack(self.root, children_expandable = True, max_live_pages = 2)
+            stack.pack()
+            self.root.update_idletasks()
+            for i in range(5):
+                stack.add_lazy_widget(HeadlessFrame, f"page{i}")
+            stack.enable_prefetch()
+            stack.enable_coalescing(frame_ms = 16)
+            stack.set_transition("slide_left", duration_ms = 250)
+            stack.enable_autosave(os.path.join(directory, "stack.json"))
+            stack.enable_thread_safe_calls()
+            stack.enable_instrumentation()
+            stack.enable_accounting()
+            stack.set_page_loader("page1", lambda: "data", lambda widget, data: None)
+            stack.page_after("page0", 100, lambda: None, repeat = True)
+            stack.set_visible_child("page0")
+            stack.set_visible_child("page1")
+            stack.show_next() # left pending by the coalescer, with the transition still running.
+
+            reference = weakref.ref(stack)
+            stack.destroy()
+            del stack
+            gc.collect()
+            self.assertIsNone(reference())
+            self.assertEqual(self.root.loop._jobs, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
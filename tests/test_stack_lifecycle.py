@@ -0,0 +1,176 @@
+"""
+Checks the page lifecycle hooks and the jobs scheduled with page_after, against the virtual clock of the
+headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class HookedPage(HeadlessFrame):
+    """
+    a page that records the hooks it is sent.
+    """
+    def __init__(self, master, calls: list | None = None) -> None:
+        super().__init__(master)
+        self.calls = [] if calls is None else calls
+
+    def on_show(self) -> None:
+        self.calls.append("show")
+
+    def on_hide(self) -> None:
+        self.calls.append("hide")
+
+    def on_suspend(self) -> None:
+        self.calls.append("suspend")
+
+    def on_resume(self) -> None:
+        self.calls.append("resume")
+
+
+class TabsPage(HeadlessFrame):
+    """
+    a page with a stack nested inside it.
+    """
+    def __init__(self, master) -> None:
+        super().__init__(master)
+        self.tabs = Stack(self)
+        self.tab = HookedPage(self.tabs)
+        self.tabs.add_widget(self.tab, "tab")
+
+
+class StackLifecycleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.stack.add_widget(HeadlessFrame(self.stack), "home")
+        self.page = HookedPage(self.stack)
+        self.stack.add_widget(self.page, "page")
+        self.ticks = []
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def tick(self) -> None:
+        self.ticks.append(self.root.loop.now())
+
+    def test_hook_methods_follow_switches(self) -> None:
+        self.stack.set_visible_child("page")
+        self.stack.set_visible_child("home")
+        self.assertEqual(self.page.calls, ["show", "resume", "hide", "suspend"])
+
+    def test_registered_hooks(self) -> None:
+        calls = []
+        self.stack.set_page_hooks("home", on_hide = lambda: calls.append("hide"), on_resume = lambda: calls.append("resume"))
+        self.stack.set_visible_child("page")
+        self.stack.set_visible_child("home")
+        self.assertEqual(calls, ["hide", "resume"])
+        self.stack.set_page_hooks("home", on_hide = None)
+        self.stack.set_visible_child("page")
+        self.assertEqual(calls, ["hide", "resume"])
+        with self.assertRaises(ValueError):
+            self.stack.set_page_hooks("home", on_close = print)
+
+    def test_jobs_pause_while_their_page_is_hidden(self) -> None:
+        self.stack.set_visible_child("page")
+        self.stack.page_after("page", 100, self.tick)
+        self.root.loop.advance(40)
+        self.stack.set_visible_child("home")
+        self.assertEqual(self.stack.get_page_job_counts("page"), {"running": 0, "paused": 1})
+        self.root.loop.advance(500)
+        self.assertEqual(self.ticks, [])
+        self.stack.set_visible_child("page")
+        self.root.loop.advance(60) # 40ms ran before it was paused.
+        self.assertEqual(self.ticks, [600])
+        self.assertEqual(self.stack.get_page_job_counts(), {})
+
+    def test_catch_up_jobs_fire_once_when_resumed(self) -> None:
+        self.stack.set_visible_child("page")
+        job = self.stack.page_after("page", 100, self.tick, repeat = True, catch_up = True)
+        self.root.loop.advance(100)
+        self.stack.set_visible_child("home")
+        self.root.loop.advance(1000)
+        self.stack.set_visible_child("page")
+        self.root.loop.advance(0)
+        self.assertEqual(self.ticks, [100, 1100])
+        self.stack.page_after_cancel(job)
+        self.root.loop.advance(500)
+        self.assertEqual(len(self.ticks), 2)
+
+    def test_jobs_of_hidden_pages_start_paused(self) -> None:
+        self.stack.page_after("page", 10, self.tick)
+        self.root.loop.advance(100)
+        self.assertEqual(self.ticks, [])
+        self.assertEqual(self.stack.get_page_job_counts(), {self.page: {"running": 0, "paused": 1}})
+
+    def test_removing_a_page_cancels_its_jobs(self) -> None:
+        self.stack.set_visible_child("page")
+        self.stack.page_after("page", 10, self.tick, repeat = True)
+        self.stack.remove_widget("page")
+        self.root.loop.advance(100)
+        self.assertEqual(self.ticks, [])
+        self.assertEqual(self.root.loop._jobs, {})
+
+    def test_evicted_pages_lose_their_jobs_and_keep_their_hooks(self) -> None:
+        calls = []
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy")
+        self.stack.set_page_hooks("lazy", on_show = lambda: calls.append("show"))
+        self.stack.set_page_cache_limits(max_live_pages = 1)
+        self.stack.set_visible_child("lazy")
+        self.stack.page_after("lazy", 10, self.tick, repeat = True)
+        self.stack.add_lazy_widget(HeadlessFrame, "other")
+        self.stack.set_visible_child("other") # evicts lazy.
+        self.assertIsNone(self.stack._get_child("lazy").widget)
+        self.assertEqual(self.stack.get_page_job_counts(), {})
+        self.stack.set_visible_child("lazy")
+        self.root.loop.advance(100)
+        self.assertEqual(self.ticks, [])
+        self.assertEqual(calls, ["show", "show"])
+
+    def test_nested_pages_are_suspended_with_the_outer_page(self) -> None:
+        self.stack.add_lazy_widget(TabsPage, "tabs")
+        self.stack.set_visible_child("tabs")
+        tabs = self.stack.get_visible_child()
+        tabs.tabs.page_after("tab", 100, self.tick)
+        self.assertEqual(tabs.tab.calls, ["show", "resume"])
+
+        self.stack.set_visible_child("home")
+        self.assertEqual(tabs.tab.calls, ["show", "resume", "suspend"]) # still shown in its own stack.
+        self.root.loop.advance(200)
+        self.assertEqual(self.ticks, [])
+
+        self.stack.set_visible_child("tabs")
+        self.root.loop.advance(100)
+        self.assertEqual(tabs.tab.calls[-1], "resume")
+        self.assertEqual(self.ticks, [300])
+
+    def test_pages_passed_through_by_a_coalesced_burst_get_no_hooks(self) -> None:
+        calls = []
+        self.stack.add_widget(HookedPage(self.stack, calls), "last")
+        self.stack.enable_coalescing()
+        self.stack.set_visible_child("page")
+        self.stack.set_visible_child("last")
+        self.root.update_idletasks()
+        self.assertEqual(self.page.calls, [])
+        self.assertEqual(calls, ["show", "resume"])
+
+    def test_replacing_a_page_cancels_the_jobs_of_the_old_widget(self) -> None:
+        self.stack.set_visible_child("page")
+        self.stack.page_after("page", 10, self.tick)
+        calls = []
+        self.stack.replace_widget("page", HookedPage(self.stack, calls))
+        self.assertEqual(self.page.calls[-2:], ["hide", "suspend"])
+        self.assertEqual(calls, ["show", "resume"])
+        self.root.loop.advance(100)
+        self.assertEqual(self.ticks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
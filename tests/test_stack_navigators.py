@@ -0,0 +1,146 @@
+"""
+Checks that StackSwitcher and StackSidebar follow the stack they navigate, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+from TkinterExtended.widgets.stack_navigator import StackNavigatorMixin, get_navigator_class
+
+
+Stack = etk.get_stack_class("headless")
+StackSwitcher = etk.get_stack_switcher_class("headless")
+StackSidebar = etk.get_stack_sidebar_class("headless")
+SELECTED = etk.get_backend("headless").button_styles["selected"]["relief"]
+
+
+def titled(master, text: str) -> HeadlessFrame:
+    page = HeadlessFrame(master)
+    page.title = text
+    return page
+
+
+class StackSwitcherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        for name in "abcd":
+            self.stack.add_widget(HeadlessFrame(self.stack), name)
+        self.switcher = StackSwitcher(self.root, stack = self.stack)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def titles(self) -> list[str]:
+        return [button.cget("text") for button in self.switcher.pack_slaves()]
+
+    def selected(self) -> list[str]:
+        return [button.cget("text") for button in self.switcher.pack_slaves() if button.cget("relief") == SELECTED]
+
+    def test_tracks_the_visible_page(self) -> None:
+        self.assertEqual(self.selected(), ["a"])
+        self.stack.set_visible_child("c")
+        self.assertEqual(self.selected(), ["c"])
+        self.switcher.get_button("b").invoke()
+        self.assertIs(self.stack.get_visible_child(), self.stack._get_child("b").widget)
+        self.assertEqual(self.selected(), ["b"])
+
+    def test_follows_added_and_removed_pages(self) -> None:
+        self.stack.add_widget(HeadlessFrame(self.stack), "x", index = 1)
+        self.assertEqual(self.titles(), list("axbcd"))
+        self.stack.remove_widget("c")
+        self.assertEqual(self.titles(), list("axbd"))
+        with self.stack.batch():
+            self.stack.add_widget(HeadlessFrame(self.stack), "y")
+            self.stack.remove_widget("x")
+        self.assertEqual(self.titles(), list("abdy"))
+
+    def test_follows_reordered_pages(self) -> None:
+        self.stack.move_widget("a", 3)
+        self.assertEqual(self.titles(), list("bcda"))
+        self.stack.swap_widgets("b", "a")
+        self.assertEqual(self.titles(), list("acdb"))
+        snapshot = self.stack.snapshot()
+        self.stack.move_widget(0, 2)
+        self.stack.restore(snapshot)
+        self.assertEqual(self.titles(), list("acdb"))
+
+    def test_retitles_replaced_pages(self) -> None:
+        stack = Stack(self.root)
+        stack.add_widget(titled(stack, "Home"), "home")
+        switcher = StackSwitcher(self.root, stack = stack, title = lambda page: page.title)
+        stack.replace_widget("home", titled(stack, "Start"))
+        self.assertEqual(switcher.get_button("home").cget("text"), "Start")
+
+    def test_navigator_missing_a_hook_cannot_be_created(self) -> None:
+        class Incomplete(StackNavigatorMixin):
+            def _rebuild(self) -> None:
+                pass
+
+        navigator_class = get_navigator_class(Incomplete, "", {}, "headless")
+        with self.assertRaises(TypeError):
+            navigator_class(self.root, stack = self.stack)
+
+
+class StackSidebarTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        with self.stack.batch():
+            for i in range(200):
+                self.stack.add_lazy_widget(HeadlessFrame, f"page {i:03d}")
+        self.sidebar = StackSidebar(self.root, stack = self.stack, rows = 5)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def rows(self) -> list[str]:
+        return [button.cget("text") for button in self.sidebar.grid_slaves()[::-1]]
+
+    def test_only_creates_the_visible_rows(self) -> None:
+        self.assertEqual(self.rows(), [f"page {i:03d}" for i in range(5)])
+        self.assertEqual(len(self.sidebar.winfo_children()), 5)
+        self.sidebar.yview("moveto", 0.5)
+        self.assertEqual(self.rows()[0], "page 100")
+        self.assertEqual(len(self.sidebar.winfo_children()), 5)
+
+    def test_tracks_the_visible_page(self) -> None:
+        self.stack.set_visible_child("page 150")
+        self.assertIn("page 150", self.rows())
+        selected = [button.cget("text") for button in self.sidebar.grid_slaves() if button.cget("relief") == SELECTED]
+        self.assertEqual(selected, ["page 150"])
+        self.sidebar.grid_slaves()[-1].invoke() # the top row.
+        self.assertEqual(self.stack._visible_record.name, self.rows()[0])
+
+    def test_filters_by_title(self) -> None:
+        self.sidebar.set_filter("page 1")
+        self.assertEqual(len(self.sidebar.get_matches()), 100)
+        self.sidebar.set_filter("page 19") # narrows the previous matches.
+        self.assertEqual(self.sidebar.get_matches(), [f"page {i}" for i in range(190, 200)])
+        self.sidebar.set_filter("99")
+        self.assertEqual(self.sidebar.get_matches(), ["page 099", "page 199"])
+        self.sidebar.set_filter("PAGE 00", "prefix")
+        self.assertEqual(len(self.sidebar.get_matches()), 10)
+        self.sidebar.set_filter("age 00", "prefix")
+        self.assertEqual(self.sidebar.get_matches(), [])
+        self.sidebar.set_filter("")
+        self.assertEqual(len(self.sidebar.get_matches()), 200)
+
+    def test_filter_follows_added_removed_and_moved_pages(self) -> None:
+        self.sidebar.set_filter("99")
+        self.stack.add_lazy_widget(HeadlessFrame, "x99", index = 0)
+        self.stack.remove_widget("page 099")
+        self.assertEqual(self.sidebar.get_matches(), ["x99", "page 199"])
+        self.stack.move_widget("x99", 199)
+        self.assertEqual(self.sidebar.get_matches(), ["page 199", "x99"])
+
+    def test_follows_reordered_pages(self) -> None:
+        self.stack.move_widget("page 000", 4)
+        self.assertEqual(self.rows(), ["page 001", "page 002", "page 003", "page 004", "page 000"])
+
+
+if __name__ == "__main__":
+    unittest.main()
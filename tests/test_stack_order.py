@@ -0,0 +1,128 @@
+"""
+Checks the page order tree and moving, swapping and replacing pages, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import random
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+from TkinterExtended.exceptions import WidgetAlreadyInStackError
+from TkinterExtended.widgets.order_tree import OrderTree
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class OrderTreeTest(unittest.TestCase):
+    def test_matches_a_list(self) -> None:
+        randomiser = random.Random(0)
+        tree, model = OrderTree(range(50)), list(range(50))
+        next_item = 50
+        for _ in range(2000):
+            operation = randomiser.choice(("insert", "remove", "move", "swap", "replace"))
+            if operation == "insert" or not model:
+                index = randomiser.randint(0, len(model))
+                tree.insert(index, next_item)
+                model.insert(index, next_item)
+                next_item += 1
+            elif operation == "remove":
+                item = randomiser.choice(model)
+                tree.remove(item)
+                model.remove(item)
+            elif operation == "move":
+                item, index = randomiser.choice(model), randomiser.randrange(len(model))
+                tree.move(item, index)
+                model.remove(item)
+                model.insert(index, item)
+            elif operation == "swap":
+                first, second = randomiser.choice(model), randomiser.choice(model)
+                tree.swap(first, second)
+                i, j = model.index(first), model.index(second)
+                model[i], model[j] = model[j], model[i]
+            else:
+                item = randomiser.choice(model)
+                tree.replace(item, next_item)
+                model[model.index(item)] = next_item
+                next_item += 1
+        self.assertEqual(list(tree), model)
+        self.assertEqual(list(reversed(tree)), model[::-1])
+        self.assertEqual([tree.index(item) for item in model], list(range(len(model))))
+        self.assertEqual([tree[index] for index in range(len(model))], model)
+
+    def test_items_are_unique(self) -> None:
+        tree = OrderTree("ab")
+        with self.assertRaises(ValueError):
+            tree.append("a")
+        with self.assertRaises(ValueError):
+            OrderTree("aa")
+        with self.assertRaises(IndexError):
+            tree.move("a", 2)
+
+
+class StackOrderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.pages = {name: HeadlessFrame(self.stack) for name in "abcd"}
+        for name, page in self.pages.items():
+            self.stack.add_widget(page, name)
+        self.events = []
+        self.stack.add_callback_function("reorder", lambda event, widget, **kwargs: self.events.append((widget, kwargs)))
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def order(self) -> str:
+        return "".join(child.name for child in self.stack.children_list)
+
+    def test_move_widget(self) -> None:
+        self.stack.move_widget("a", 2)
+        self.assertEqual(self.order(), "bcad")
+        self.assertEqual(self.events, [("a", {"old_index": 0, "new_index": 2})])
+        self.stack.show_next() # a is visible, so the next page is now d.
+        self.assertIs(self.stack.get_visible_child(), self.pages["d"])
+        with self.assertRaises(IndexError):
+            self.stack.move_widget("a", 4)
+
+    def test_swap_widgets(self) -> None:
+        self.stack.swap_widgets("b", "d")
+        self.assertEqual(self.order(), "adcb")
+        self.assertEqual(self.events, [(["b", "d"], {})])
+        self.stack.set_visible_child("b")
+        self.assertEqual(self.stack.get_stack_state(), 3)
+
+    def test_replacing_the_visible_page_shows_the_new_widget(self) -> None:
+        replaced = []
+        self.stack.add_callback_function("replace_widget", lambda event, widget, old_widget: replaced.append((widget, old_widget)))
+        new = HeadlessFrame(self.stack)
+        self.stack.replace_widget("a", new)
+        self.assertEqual(self.order(), "abcd")
+        self.assertIs(self.stack.get_visible_child(), new)
+        self.assertEqual(new.winfo_manager(), "grid")
+        self.assertEqual(self.pages["a"].winfo_manager(), "")
+        self.assertTrue(self.pages["a"].winfo_exists()) # hidden, not destroyed.
+        self.assertEqual(replaced, [(new, self.pages["a"])])
+        with self.assertRaises(WidgetAlreadyInStackError):
+            self.stack.replace_widget("b", new)
+
+    def test_replaced_pages_keep_their_place_in_the_history(self) -> None:
+        self.stack.set_visible_child("b")
+        new = HeadlessFrame(self.stack)
+        self.stack.replace_widget("a", new)
+        self.stack.undo()
+        self.assertIs(self.stack.get_visible_child(), new)
+
+    def test_replacing_a_lazy_page(self) -> None:
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy")
+        new = HeadlessFrame(self.stack)
+        self.stack.replace_widget("lazy", new)
+        self.stack.set_visible_child("lazy")
+        self.assertIs(self.stack.get_visible_child(), new)
+        self.assertIsNone(self.stack._get_child("lazy").factory)
+
+
+if __name__ == "__main__":
+    unittest.main()
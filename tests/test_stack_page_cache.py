@@ -0,0 +1,101 @@
+"""
+Checks that hidden lazy pages are evicted least recently shown first, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class FormPage(HeadlessFrame):
+    """
+    a page with some state of its own that it keeps across being evicted and rebuilt.
+    """
+    def __init__(self, master) -> None:
+        super().__init__(master)
+        self.text = ""
+        self.restored = None
+
+    def save_page_state(self) -> dict:
+        return {"text": self.text}
+
+    def restore_page_state(self, state: dict) -> None:
+        self.restored = state
+        self.text = state["text"]
+
+
+class StackPageCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True, max_live_pages = 2)
+        for i in range(4):
+            self.stack.add_lazy_widget(FormPage, f"page{i}")
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def built(self) -> list[str]:
+        return [child.name for child in self.stack.children_list if child.widget is not None]
+
+    def test_least_recently_shown_page_is_evicted(self) -> None:
+        self.stack.set_visible_child("page1")
+        self.stack.set_visible_child("page2")
+        self.assertEqual(self.built(), ["page1", "page2"])
+        self.stack.set_visible_child("page1")
+        self.stack.set_visible_child("page3")
+        self.assertEqual(self.built(), ["page1", "page3"])
+        stats = self.stack.get_page_cache_stats()
+        self.assertEqual((stats["evictions"], stats["live_pages"]), (2, 2))
+
+    def test_visible_page_is_never_evicted(self) -> None:
+        self.stack.set_visible_child("page1")
+        self.stack.set_page_cache_limits(max_live_pages = 0)
+        self.assertEqual(self.built(), ["page1"])
+
+    def test_lowering_the_limits_evicts_straight_away(self) -> None:
+        self.stack.add_lazy_widget(FormPage, "heavy", cost = 10)
+        self.stack.set_page_cache_limits(max_live_pages = None)
+        for child in list(self.stack.children_list):
+            self.stack.set_visible_child(child.name)
+        self.assertEqual(len(self.built()), 5)
+        self.stack.set_page_cache_limits(page_cost_budget = 12)
+        self.assertEqual(self.built(), ["page2", "page3", "heavy"])
+        self.assertEqual(self.stack.get_page_cache_stats()["live_cost"], 12)
+
+    def test_page_state_survives_eviction(self) -> None:
+        self.stack.set_visible_child("page1")
+        self.stack.get_visible_child().text = "draft"
+        evicted = self.stack.get_visible_child()
+        self.stack.set_visible_child("page2")
+        self.stack.set_visible_child("page3")
+        self.assertFalse(evicted.winfo_exists())
+
+        self.stack.set_visible_child("page1")
+        page = self.stack.get_visible_child()
+        self.assertIsNot(page, evicted)
+        self.assertEqual((page.text, page.restored), ("draft", {"text": "draft"}))
+
+    def test_hits_and_misses_are_counted(self) -> None:
+        for name in ("page1", "page0", "page1", "page2", "page0"):
+            self.stack.set_visible_child(name)
+        stats = self.stack.get_page_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 4)) # page0 was first built by add_lazy_widget.
+
+    def test_history_rebuilds_evicted_pages(self) -> None:
+        for name in ("page1", "page2", "page3"):
+            self.stack.set_visible_child(name)
+        self.assertNotIn("page1", self.built())
+        self.stack.undo()
+        self.stack.undo()
+        self.assertEqual(self.stack._visible_record.name, "page1")
+        self.assertIsNotNone(self.stack.get_visible_child())
+
+
+if __name__ == "__main__":
+    unittest.main()
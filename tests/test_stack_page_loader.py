@@ -0,0 +1,134 @@
+"""
+Checks that page data is loaded off the Tk thread and only applied to the visible page, on the headless
+backend. The test drives the headless loop itself while the loads run.
+
+Run with:
+    python -m pytest tests
+"""
+import threading
+import time
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackPageLoaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.stack.add_widget(HeadlessFrame(self.stack), "home")
+        self.stack.add_lazy_widget(HeadlessFrame, "detail")
+        self.loads = 0
+        self.applied = []
+        self.events = []
+        self.stack.add_callback_function("page_data_loaded", lambda event, widget, data: self.events.append((event, data)))
+        self.stack.add_callback_function("page_data_failed", lambda event, widget, error: self.events.append((event, error)))
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def load(self) -> str:
+        self.loads += 1
+        return f"data{self.loads}"
+
+    def apply(self, widget, data) -> None:
+        self.applied.append((widget, data))
+
+    def pump(self, finished: callable, timeout: float = 5) -> None:
+        """
+        runs the loop, on this thread, until finished returns True.
+        """
+        end = time.monotonic() + timeout
+        while not finished():
+            self.assertLess(time.monotonic(), end, "the load did not finish")
+            self.root.loop.advance(1)
+            time.sleep(0.001)
+
+    def test_data_is_applied_to_the_visible_page(self) -> None:
+        placeholders = []
+        self.stack.set_page_loader("detail", self.load, self.apply, placeholder = placeholders.append)
+        self.stack.set_visible_child("detail")
+        page = self.stack.get_visible_child()
+        self.assertEqual(placeholders, [page])
+        self.pump(lambda: self.applied)
+        self.assertEqual(self.applied, [(page, "data1")])
+        self.assertEqual(self.events, [("page_data_loaded", "data1")])
+
+    def test_cached_data_is_reused_until_invalidated(self) -> None:
+        self.stack.set_page_loader("detail", self.load, self.apply)
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: self.applied)
+        self.stack.set_visible_child("home")
+        self.stack.set_visible_child("detail")
+        self.assertEqual([data for _, data in self.applied], ["data1", "data1"])
+        self.assertEqual(self.loads, 1)
+
+        self.stack.set_visible_child("home")
+        self.stack.invalidate_page_data("detail")
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: len(self.applied) == 3)
+        self.assertEqual(self.applied[-1][1], "data2")
+
+    def test_expired_data_is_loaded_again(self) -> None:
+        self.stack.set_page_loader("detail", self.load, self.apply, ttl = 0)
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: self.applied)
+        self.stack.set_visible_child("home")
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: len(self.applied) == 2)
+        self.assertEqual(self.loads, 2)
+
+    def test_failed_loads_send_page_data_failed(self) -> None:
+        def load() -> None:
+            raise OSError("offline")
+        self.stack.set_page_loader("detail", load, self.apply)
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: self.events)
+        self.assertEqual(self.events[0][0], "page_data_failed")
+        self.assertIsInstance(self.events[0][1], OSError)
+        self.assertEqual(self.applied, [])
+
+    def test_results_for_pages_left_are_dropped(self) -> None:
+        release = threading.Event()
+        def load() -> str:
+            release.wait(5)
+            return self.load()
+        self.stack.set_page_loader("detail", load, self.apply)
+        self.stack.set_visible_child("detail")
+        self.stack.set_visible_child("home") # cancels the running load.
+        release.set()
+        self.pump(lambda: self.loads == 1)
+        self.root.loop.advance(50)
+        self.assertEqual(self.applied, [])
+
+        self.stack.set_visible_child("detail") # nothing was cached, so it loads again.
+        self.pump(lambda: self.applied)
+        self.assertEqual(self.applied[0][1], "data2")
+
+    def test_removing_the_loader_stops_loading(self) -> None:
+        self.stack.set_page_loader("detail", self.load, self.apply)
+        self.stack.remove_page_loader("detail")
+        self.stack.set_visible_child("detail")
+        self.root.loop.advance(50)
+        self.assertEqual(self.loads, 0)
+
+    def test_evicted_page_gets_its_cached_data_when_rebuilt(self) -> None:
+        self.stack.add_lazy_widget(HeadlessFrame, "other")
+        self.stack.set_page_cache_limits(max_live_pages = 1)
+        self.stack.set_page_loader("detail", self.load, self.apply)
+        self.stack.set_visible_child("detail")
+        self.pump(lambda: self.applied)
+        first = self.stack.get_visible_child()
+        self.stack.set_visible_child("other") # evicts detail.
+        self.stack.set_visible_child("detail")
+        rebuilt = self.stack.get_visible_child()
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(self.applied[-1], (rebuilt, "data1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
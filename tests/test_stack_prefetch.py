@@ -0,0 +1,80 @@
+"""
+Checks that lazy pages are prefetched while the loop is idle, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackPrefetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        for i in range(6):
+            self.stack.add_lazy_widget(HeadlessFrame, f"page{i}")
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def built(self) -> list[str]:
+        return [child.name for child in self.stack.children_list if child.widget is not None]
+
+    def test_neighbours_are_built_when_idle(self) -> None:
+        self.stack.enable_prefetch()
+        self.assertEqual(self.built(), ["page0"])
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.built(), ["page0", "page1", "page5"])
+
+        self.stack.set_visible_child("page2")
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.built(), ["page0", "page1", "page2", "page3", "page5"])
+
+    def test_likely_pages_are_built_after_the_neighbours(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.stack.set_likely_pages(["page3"])
+        self.stack.enable_prefetch(neighbours = 0)
+        self.stack.set_likely_pages(["page3", "missing"])
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.built(), ["page0", "page3"])
+
+    def test_generator_pages_are_built_over_several_slices(self) -> None:
+        steps = []
+        def factory(master):
+            page = HeadlessFrame(master)
+            for i in range(3):
+                steps.append(i)
+                yield
+            return page
+
+        self.stack.add_lazy_widget(factory, "slow", index = 1)
+        self.stack.enable_prefetch(slice_budget_ms = 0)
+        self.root.update_idletasks()
+        self.assertNotIn("slow", self.built())
+        self.root.loop.run_until_idle()
+        self.assertIn("slow", self.built())
+        self.assertEqual(steps, [0, 1, 2])
+
+    def test_prefetching_does_not_evict(self) -> None:
+        self.stack.set_page_cache_limits(max_live_pages = 2)
+        self.stack.enable_prefetch()
+        self.root.loop.run_until_idle()
+        self.assertEqual(len(self.built()), 2)
+        self.assertEqual(self.stack.get_page_cache_stats()["evictions"], 0)
+
+    def test_disabling_cancels_pending_work(self) -> None:
+        self.stack.enable_prefetch()
+        self.stack.disable_prefetch()
+        self.root.loop.run_until_idle()
+        self.assertEqual(self.built(), ["page0"])
+        self.assertEqual(self.root.loop._jobs, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Checks StackRouter across nested stacks, and that navigators follow its switches, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+StackSwitcher = etk.get_stack_switcher_class("headless")
+
+
+class StackRouterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.inner = {}
+        for name, subpages in (("home", ("feed",)), ("settings", ("display", "network"))):
+            page = HeadlessFrame(self.stack)
+            inner = self.inner[name] = Stack(page)
+            inner.grid()
+            for subpage in subpages:
+                inner.add_widget(HeadlessFrame(inner), subpage)
+            self.stack.add_widget(page, name)
+        self.router = etk.StackRouter(self.stack)
+        self.routes = []
+        self.router.add_callback_function("change_route", self.on_route)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def on_route(self, event, widget, route, previous_route) -> None:
+        self.routes.append((previous_route, route))
+
+    def test_navigate_switches_every_level(self) -> None:
+        self.assertEqual(self.router.current_route(), "home/feed")
+        self.router.navigate("settings/network")
+        self.assertEqual(self.stack.get_visible_child(), self.stack._get_child("settings").widget)
+        self.assertEqual(self.inner["settings"].get_visible_child(), self.inner["settings"]._get_child("network").widget)
+        self.assertEqual(self.router.current_route(), "settings/network")
+        self.assertEqual(self.routes, [("home/feed", "settings/network")])
+
+    def test_navigate_to_the_current_route_sends_nothing(self) -> None:
+        self.router.navigate("home/feed")
+        self.assertEqual(self.routes, [])
+
+    def test_unknown_route_switches_nothing(self) -> None:
+        with self.assertRaises(etk.NotInStackError):
+            self.router.navigate("settings/missing")
+        self.assertFalse(self.router.is_route("settings/missing"))
+        self.assertEqual(self.router.current_route(), "home/feed")
+
+    def test_routes_follow_added_and_removed_pages(self) -> None:
+        inner = self.inner["settings"]
+        inner.add_widget(HeadlessFrame(inner), "sound")
+        self.assertTrue(self.router.is_route("settings/sound"))
+        inner.remove_widget("display")
+        self.assertFalse(self.router.is_route("settings/display"))
+
+    def test_stacks_send_their_switches(self) -> None:
+        outer_events, inner_events = [], []
+        self.stack.add_callback_function("change_visible_widget",
+                                         lambda event, widget, origin, destination: outer_events.append((origin, destination)))
+        self.inner["settings"].add_callback_function("change_visible_widget",
+                                                     lambda event, widget: inner_events.append(widget))
+        self.router.navigate("settings/network")
+        home, settings = self.stack._get_child("home").widget, self.stack._get_child("settings").widget
+        self.assertEqual(outer_events, [(home, settings)])
+        self.assertEqual(inner_events, [self.inner["settings"]._get_child("network").widget])
+
+    def test_switcher_follows_navigate(self) -> None:
+        switcher = StackSwitcher(self.root, stack = self.stack)
+        inner_switcher = StackSwitcher(self.root, stack = self.inner["settings"])
+        relief = etk.get_backend("headless").button_styles["selected"]["relief"]
+
+        self.router.navigate("settings/network")
+        self.assertEqual(switcher.get_button("settings").cget("relief"), relief)
+        self.assertNotEqual(switcher.get_button("home").cget("relief"), relief)
+        self.assertEqual(inner_switcher.get_button("network").cget("relief"), relief)
+        self.assertNotEqual(inner_switcher.get_button("display").cget("relief"), relief)
+
+
+if __name__ == "__main__":
+    unittest.main()
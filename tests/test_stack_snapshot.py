@@ -0,0 +1,148 @@
+"""
+Checks that snapshot and restore bring back the whole state of a stack tree, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class FormPage(HeadlessFrame):
+    """
+    a page with some state of its own.
+    """
+    def __init__(self, master) -> None:
+        super().__init__(master)
+        self.text = ""
+
+    def save_page_state(self) -> dict:
+        return {"text": self.text}
+
+    def restore_page_state(self, state: dict) -> None:
+        self.text = state["text"]
+
+
+class SettingsPage(HeadlessFrame):
+    """
+    a page with a stack nested inside it, not as the page itself.
+    """
+    def __init__(self, master) -> None:
+        super().__init__(master)
+        self.tabs = Stack(HeadlessFrame(self))
+        for name in ("general", "network", "display"):
+            self.tabs.add_widget(HeadlessFrame(self.tabs), name)
+
+
+def build_app(root: HeadlessRoot) -> Stack:
+    """
+    builds the same stack each time, as an application does when it starts.
+    """
+    stack = Stack(root, children_expandable = True, saved_history_length = 10)
+    stack.add_widget(HeadlessFrame(stack), "home")
+    stack.add_lazy_widget(FormPage, "form")
+    stack.add_lazy_widget(SettingsPage, "settings")
+    stack.add_widget(HeadlessFrame(stack))
+    return stack
+
+
+class StackSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = build_app(self.root)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def restart(self) -> Stack:
+        self.stack.destroy()
+        self.stack = build_app(self.root)
+        return self.stack
+
+    def test_restore_after_a_restart(self) -> None:
+        self.stack.set_visible_child("form")
+        self.stack.get_visible_child().text = "draft"
+        self.stack.set_visible_child("settings")
+        self.stack.get_visible_child().tabs.set_visible_child("network")
+        self.stack.move_widget("home", 2)
+        snapshot = json.loads(json.dumps(self.stack.snapshot())) # it must survive being written as JSON.
+
+        stack = self.restart()
+        stack.restore(snapshot)
+        self.assertEqual([child.name for child in stack.children_list], ["form", "settings", "home", None])
+        self.assertEqual(stack._visible_record.name, "settings")
+        self.assertEqual(stack.get_visible_child().tabs._visible_record.name, "network")
+        self.assertIsNone(stack._get_child("form").widget) # lazy pages are not built by restore.
+
+        stack.undo()
+        self.assertEqual(stack._visible_record.name, "form")
+        self.assertEqual(stack.get_visible_child().text, "draft")
+        stack.redo()
+        self.assertEqual(stack._visible_record.name, "settings")
+
+    def test_unnamed_pages_are_kept_by_index(self) -> None:
+        self.stack.set_visible_child(3)
+        snapshot = self.stack.snapshot()
+        self.assertEqual(snapshot["visible"], 3)
+        self.restart().restore(snapshot)
+        self.assertEqual(self.stack.get_stack_state(), 3)
+
+    def test_pages_that_no_longer_exist_are_ignored(self) -> None:
+        self.stack.set_visible_child("form")
+        snapshot = self.stack.snapshot()
+        stack = self.restart()
+        stack.remove_widget("form")
+        stack.restore(snapshot)
+        self.assertEqual(stack._visible_record.name, "home")
+
+    def test_restore_sends_reorder_and_change_visible_widget(self) -> None:
+        self.stack.set_visible_child("form")
+        self.stack.swap_widgets("home", "form")
+        snapshot = self.stack.snapshot()
+        stack = self.restart()
+        events = []
+        for event in ("reorder", "change_visible_widget"):
+            stack.add_callback_function(event, lambda event, widget: events.append(event))
+        stack.restore(snapshot)
+        self.assertEqual(sorted(events), ["change_visible_widget", "reorder"])
+
+    def test_save_and_load_snapshot_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stack.json")
+            self.assertFalse(self.stack.load_snapshot(path))
+            self.stack.set_visible_child("settings")
+            self.stack.save_snapshot(path)
+            self.assertTrue(self.restart().load_snapshot(path))
+            self.assertEqual(self.stack._visible_record.name, "settings")
+
+            with open(path, "w", encoding = "utf-8") as file:
+                json.dump({"version": 0}, file)
+            with self.assertRaises(ValueError):
+                self.stack.load_snapshot(path)
+
+    def test_autosave_writes_changes_together(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stack.json")
+            self.stack.enable_autosave(path, delay_ms = 100)
+            self.stack.set_visible_child("form")
+            self.stack.set_visible_child("settings")
+            self.stack.get_visible_child().tabs.set_visible_child("display") # nested changes are saved too.
+            self.assertFalse(os.path.exists(path))
+            self.root.loop.advance(100)
+            self.stack.disable_autosave()
+
+            self.restart().load_snapshot(path)
+            self.assertEqual(self.stack._visible_record.name, "settings")
+            self.assertEqual(self.stack.get_visible_child().tabs._visible_record.name, "display")
+
+
+if __name__ == "__main__":
+    unittest.main()
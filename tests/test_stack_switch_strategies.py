@@ -0,0 +1,81 @@
+"""
+Checks the grid, raise and place ways of swapping the visible page, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackSwitchStrategyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.pages = {name: HeadlessFrame(self.stack) for name in "abc"}
+        for name, page in self.pages.items():
+            self.stack.add_widget(page, name)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def managers(self) -> dict[str, str]:
+        return {name: page.winfo_manager() for name, page in self.pages.items()}
+
+    def top(self) -> HeadlessFrame:
+        return self.stack.winfo_children()[-1]
+
+    def test_grid_only_keeps_the_visible_page_gridded(self) -> None:
+        self.stack.set_visible_child("b")
+        self.assertEqual(self.managers(), {"a": "", "b": "grid", "c": ""})
+
+    def test_raise_keeps_shown_pages_gridded(self) -> None:
+        self.stack.set_switch_strategy("raise")
+        self.stack.set_visible_child("b")
+        self.stack.set_visible_child("a")
+        self.assertEqual(self.managers(), {"a": "grid", "b": "grid", "c": ""})
+        self.assertIs(self.top(), self.pages["a"])
+
+    def test_place_places_the_pages(self) -> None:
+        self.stack.set_switch_strategy("place")
+        self.stack.set_visible_child("c")
+        self.assertEqual(self.managers(), {"a": "place", "b": "", "c": "place"})
+        self.assertIs(self.top(), self.pages["c"])
+        self.assertEqual(float(self.pages["c"].place_info()["relwidth"]), 1)
+
+    def test_pages_that_do_not_expand_are_drawn_on_the_backdrop(self) -> None:
+        stack = Stack(self.root, switch_strategy = "raise")
+        pages = [HeadlessFrame(stack) for _ in range(2)]
+        for page in pages:
+            stack.add_widget(page)
+        stack.set_visible_child(1)
+        backdrop, page = stack.winfo_children()[-2:]
+        self.assertIs(page, pages[1])
+        self.assertNotIn(backdrop, pages)
+        self.assertEqual(backdrop.grid_info()["sticky"], "nesw")
+
+    def test_changing_strategy_only_keeps_the_visible_page(self) -> None:
+        self.stack.set_switch_strategy("raise")
+        for name in "bc":
+            self.stack.set_visible_child(name)
+        self.stack.set_switch_strategy("grid")
+        self.assertEqual(self.managers(), {"a": "", "b": "", "c": "grid"})
+        self.stack.set_visible_child("a")
+        self.assertEqual(self.managers(), {"a": "grid", "b": "", "c": ""})
+        with self.assertRaises(ValueError):
+            self.stack.set_switch_strategy("pack")
+
+    def test_removed_pages_are_unmanaged(self) -> None:
+        self.stack.set_switch_strategy("place")
+        self.stack.set_visible_child("b")
+        self.stack.remove_widget("a")
+        self.assertEqual(self.pages["a"].winfo_manager(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Checks that other threads and asyncio code can change a stack through its command queue, on the headless
+backend. The test drives the headless loop itself while the worker threads run.
+
+Run with:
+    python -m pytest tests
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackThreadSafeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.stack.add_widgets((HeadlessFrame(self.stack), f"page{i}") for i in range(10))
+        self.stack.enable_thread_safe_calls()
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def pump(self, finished: callable, timeout: float = 5) -> None:
+        """
+        runs the loop, on this thread, until finished returns True.
+        """
+        end = time.monotonic() + timeout
+        while not finished():
+            self.assertLess(time.monotonic(), end, "the commands were not run")
+            self.root.loop.advance(1)
+            time.sleep(0.001)
+
+    def test_commands_from_threads_run_on_the_tk_thread(self) -> None:
+        threads_seen = set()
+        futures = []
+        def worker(offset: int) -> None:
+            for i in range(50):
+                futures.append(self.stack.set_visible_child_threadsafe(f"page{(i + offset) % 10}"))
+            futures.append(self.stack.call_soon_threadsafe(lambda: threads_seen.add(threading.get_ident())))
+
+        workers = [threading.Thread(target = worker, args = (i,)) for i in range(4)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.pump(lambda: all(future.done() for future in futures))
+
+        self.assertEqual(threads_seen, {threading.get_ident()})
+        self.assertTrue(all(future.exception() is None for future in futures))
+        self.assertEqual(self.stack.get_thread_call_stats()["commands_run"], len(futures))
+
+    def test_errors_are_set_on_the_future(self) -> None:
+        future = self.stack.set_visible_child_threadsafe("missing")
+        self.pump(future.done)
+        self.assertIsInstance(future.exception(), etk.NotInStackError)
+
+    def test_add_and_remove_from_a_thread(self) -> None:
+        page = HeadlessFrame(self.stack)
+        added = self.stack.add_widget_threadsafe(page, "new")
+        self.pump(added.done)
+        self.assertTrue(self.stack.is_widget_in_stack(page))
+        removed = self.stack.remove_widget_threadsafe("new")
+        self.pump(removed.done)
+        self.assertFalse(self.stack.is_widget_in_stack(page))
+
+    def test_awaiting_show_from_an_asyncio_thread(self) -> None:
+        thread_result = concurrent.futures.Future()
+        def run() -> None:
+            try:
+                asyncio.run(self.stack.show("page3"))
+                thread_result.set_result(None)
+            except BaseException as error:
+                thread_result.set_exception(error)
+
+        threading.Thread(target = run).start()
+        self.pump(thread_result.done)
+        thread_result.result()
+        self.assertIs(self.stack.get_visible_child(), self.stack._get_child("page3").widget)
+
+    def test_awaiting_on_the_tk_thread_runs_straight_away(self) -> None:
+        asyncio.run(self.stack.show("page5"))
+        self.assertIs(self.stack.get_visible_child(), self.stack._get_child("page5").widget)
+
+    def test_disabling_cancels_waiting_commands(self) -> None:
+        future = self.stack.set_visible_child_threadsafe("page2")
+        self.stack.disable_thread_safe_calls()
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            self.stack.call_soon_threadsafe(print)
+
+
+if __name__ == "__main__":
+    unittest.main()
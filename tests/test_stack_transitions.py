@@ -0,0 +1,100 @@
+"""
+Checks animated page transitions against the virtual clock of the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+
+
+Stack = etk.get_stack_class("headless")
+
+
+class StackTransitionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.stack = Stack(self.root, children_expandable = True)
+        self.stack.pack() # transitions only run while the stack is on screen.
+        self.root.update_idletasks()
+        self.pages = {name: HeadlessFrame(self.stack) for name in ("a", "b", "c")}
+        for name, page in self.pages.items():
+            self.stack.add_widget(page, name)
+        self.stack.set_transition("slide_left", duration_ms = 100, fps = 50)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def managers(self) -> dict[str, str]:
+        return {name: page.winfo_manager() for name, page in self.pages.items()}
+
+    def test_both_pages_slide_until_the_end(self) -> None:
+        self.stack.set_visible_child("b")
+        self.assertIs(self.stack.get_visible_child(), self.pages["b"])
+        self.assertEqual(self.managers(), {"a": "place", "b": "place", "c": ""})
+        self.assertEqual(float(self.pages["b"].place_info()["relx"]), 1.0)
+
+        self.root.loop.advance(40)
+        self.assertTrue(0 < float(self.pages["b"].place_info()["relx"]) < 1)
+        self.assertTrue(-1 < float(self.pages["a"].place_info()["relx"]) < 0)
+
+        self.root.loop.advance(60)
+        self.assertEqual(self.managers(), {"a": "", "b": "grid", "c": ""})
+        stats = self.stack.get_transition_stats()
+        self.assertEqual((stats["transitions"], stats["skipped_frames"]), (1, 0))
+        self.assertEqual(self.root.loop._jobs, {})
+
+    def test_switching_again_retargets(self) -> None:
+        self.stack.set_visible_child("b")
+        self.root.loop.advance(40)
+        self.stack.set_visible_child("c")
+        self.assertEqual(self.managers(), {"a": "place", "b": "", "c": "place"})
+        self.root.loop.advance(60)
+        self.assertEqual(self.managers(), {"a": "", "b": "", "c": "grid"})
+        self.assertEqual(self.stack.get_transition_stats()["retargets"], 1)
+
+    def test_going_back_runs_backwards_from_where_it_is(self) -> None:
+        self.stack.set_visible_child("b")
+        self.root.loop.advance(20)
+        self.stack.set_visible_child("a")
+        self.root.loop.advance(20) # it was 20ms from the start, so it is back there after 20ms.
+        self.assertEqual(self.managers(), {"a": "grid", "b": "", "c": ""})
+
+    def test_pages_switch_straight_away_when_not_on_screen(self) -> None:
+        self.stack.pack_forget()
+        self.stack.set_visible_child("b")
+        self.assertEqual(self.managers(), {"a": "", "b": "grid", "c": ""})
+
+    def test_crossfade_cuts_half_way(self) -> None:
+        self.stack.set_transition("crossfade", duration_ms = 100)
+        self.stack.set_visible_child("b")
+        self.root.loop.advance(40)
+        self.assertEqual(self.managers()["a"], "place")
+        self.root.loop.advance(20)
+        self.assertEqual(self.managers()["a"], "")
+
+    def test_modes(self) -> None:
+        with self.assertRaises(ValueError):
+            self.stack.set_transition("spin")
+        self.stack.set_visible_child("b")
+        self.stack.set_transition("none") # finishes the running transition.
+        self.assertIsNone(self.stack.get_transition_stats())
+        self.assertEqual(self.managers(), {"a": "", "b": "grid", "c": ""})
+
+    def test_page_being_left_is_evicted_once_it_ends(self) -> None:
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy1")
+        self.stack.add_lazy_widget(HeadlessFrame, "lazy2")
+        self.stack.set_page_cache_limits(max_live_pages = 1)
+        self.stack.set_visible_child("lazy1")
+        self.root.loop.advance(100)
+        self.stack.set_visible_child("lazy2")
+        left = self.stack._get_child("lazy1")
+        self.assertIsNotNone(left.widget) # still sliding out.
+        self.root.loop.advance(100)
+        self.assertIsNone(left.widget)
+
+
+if __name__ == "__main__":
+    unittest.main()
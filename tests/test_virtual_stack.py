@@ -0,0 +1,93 @@
+"""
+Checks that a virtual stack shows records on a small pool of widgets, on the headless backend.
+
+Run with:
+    python -m pytest tests
+"""
+import unittest
+
+import TkinterExtended as etk
+from TkinterExtended.backends.headless import HeadlessFrame, HeadlessRoot
+from TkinterExtended.exceptions import NotInStackError
+
+
+VirtualStack = etk.get_virtual_stack_class("headless")
+
+
+class RecordPage(HeadlessFrame):
+    def bind_record(self, record, index) -> None:
+        self.record = record
+
+
+class VirtualStackTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.records = [f"record{i}" for i in range(1000)]
+        self.stack = VirtualStack(self.root, template = RecordPage, source = self.records, key = str.upper,
+                                  pool_size = 2, children_expandable = True)
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_widgets_are_pooled(self) -> None:
+        for index in range(0, 1000, 100):
+            self.stack.set_visible_child(index)
+            self.assertEqual(self.stack.get_visible_child().record, f"record{index}")
+        self.assertEqual(len(self.stack.winfo_children()), 2)
+        self.assertEqual(self.stack.get_pool_stats()["created"], 2)
+
+    def test_recent_records_keep_their_widgets(self) -> None:
+        first = self.stack.get_visible_child()
+        self.stack.set_visible_child(1)
+        self.stack.set_visible_child(0)
+        self.assertIs(self.stack.get_visible_child(), first)
+        self.assertEqual(self.stack.get_pool_stats()["reuses"], 1)
+
+    def test_records_are_shown_by_index_or_key(self) -> None:
+        self.stack.set_visible_child("RECORD42")
+        self.assertEqual(self.stack.get_stack_state(), 42)
+        self.stack.set_visible_child(-1)
+        self.stack.show_next() # wraps round.
+        self.assertEqual(self.stack.get_stack_state(), 0)
+        with self.assertRaises(IndexError):
+            self.stack.set_visible_child(1000)
+        with self.assertRaises(NotInStackError):
+            self.stack.set_visible_child("missing")
+
+    def test_length_and_get_item(self) -> None:
+        stack = VirtualStack(self.root, template = RecordPage, length = lambda: 10, get_item = lambda index: index * 2)
+        stack.set_visible_child(4)
+        self.assertEqual(stack.get_visible_record(), 8)
+        with self.assertRaises(TypeError):
+            stack.set_data_source(self.records, length = 10, get_item = len)
+
+    def test_visible_record_survives_changes_to_the_data(self) -> None:
+        events = []
+        self.stack.add_callback_function("add_widget", lambda event, widget: events.append((event, widget)))
+        self.stack.add_callback_function("remove_widget", lambda event, widget: events.append((event, widget)))
+        self.stack.set_visible_child(5)
+
+        self.records[0:0] = ["new0", "new1"]
+        self.stack.notify_inserted(0, 2)
+        self.assertEqual(self.stack.get_visible_record(), "record5")
+        self.assertEqual(self.stack.get_stack_state(), 7)
+
+        del self.records[7]
+        self.stack.notify_removed(7)
+        self.assertEqual(self.stack.get_visible_child().record, "record6") # the record that took its place.
+        self.assertEqual(events, [("add_widget", range(0, 2)), ("remove_widget", range(7, 8))])
+
+        self.records[7] = "edited"
+        self.stack.notify_changed(7)
+        self.assertEqual(self.stack.get_visible_child().record, "edited")
+
+    def test_change_visible_widget_gets_the_index_and_record(self) -> None:
+        events = []
+        self.stack.add_callback_function("change_visible_widget",
+                                         lambda event, widget, index, record: events.append((widget, index, record)))
+        self.stack.set_visible_child("RECORD3")
+        self.assertEqual(events, [("RECORD3", 3, "record3")])
+
+
+if __name__ == "__main__":
+    unittest.main()